@@ -26,12 +26,13 @@
 
 import os
 from itertools import repeat
-from ctypes import cdll, create_string_buffer, c_int, byref, c_bool, c_double
+from ctypes import c_int, byref, c_double
 import click
+import numpy as np
 import platform
 
 import typing
-from typing import Union
+from typing import Union, Callable, Iterable
 
 # ============================================================================
 # INTERNAL IMPORTS
@@ -43,20 +44,26 @@ from symupy.utils.exceptions import (
     SymupyFileLoadError,
     SymupyVehicleCreationError,
     SymupyDriveVehicleError,
+    SymupyBufferError,
     SymupyWarning,
 )
 
 #
 from .scenario import Simulation
 from symupy.utils import SimulatorRequest, Configurator
+from symupy.utils.parser import buffer_view
+from symupy.utils.bindings import load_library, EncodedStrings
 from symupy.logic import RuntimeDevice
+from symupy.logic.pipeline import StepPipeline
+from symupy.logic.triggers import Trigger
+from symupy.logic.demand import DemandQueue, demand_columns
 from symupy.components.vehicles import VehicleList
 
 from symupy.utils import timer_func, printer_time
 from symupy.utils import constants as CT
 
 from symupy.components import V2INetwork, V2VNetwork
-from symupy.components import Vehicle
+from symupy.components import Vehicle, Route
 
 # ============================================================================
 # CLASS AND DEFINITIONS
@@ -116,6 +123,11 @@ class Simulator(Configurator, RuntimeDevice):
         Configurator.__init__(self, **kwargs)
         RuntimeDevice.__init__(self)
         self._net = []
+        self._pipeline = None
+        self._triggers = {}
+        self._demand = DemandQueue()
+        self._encoded = EncodedStrings()
+        self._warm = False
 
     def __repr__(self):
         return f"{self.__class__.__name__}({self.library_path})"
@@ -125,11 +137,12 @@ class Simulator(Configurator, RuntimeDevice):
     # =========================================================================
 
     def load_symuvia(self):
-        """ Load SymuVia shared library 
+        """ Load SymuVia shared library and declare its prototypes. The 
+            library is loaded once per process and path.
 
         """
         try:
-            lib_symuvia = cdll.LoadLibrary(self.library_path)
+            lib_symuvia = load_library(self.library_path)
         except OSError:
             raise SymupyLoadLibraryError("Library not found", self.library_path)
         self.__library = lib_symuvia
@@ -173,6 +186,38 @@ class Simulator(Configurator, RuntimeDevice):
         self.load_symuvia()
         self.__library.SymRunEx(self.scenarioFilename("UTF8"))
 
+    def campaign(self, scenarios: Iterable[str]):
+        """ Run a queue of scenarios in warm mode. The library is loaded once
+            and each scenario is loaded into it after the previous one is
+            unloaded. The request, vehicle list, response buffers and the 
+            pipeline are reused across scenarios.
+
+            :param scenarios: paths to the scenario files
+            :type scenarios: iterable
+
+            :returns: the simulator, connected to each scenario in turn
+            :rtype: generator
+
+            Example:
+                Sweep a set of scenarios ::
+
+                >>> for s in simulator.campaign(scenarios):
+                ...     while s.do_next:
+                ...         s.run_step()
+                ...     results.append(s.get_total_travel_time())
+        """
+        self._warm = True
+        try:
+            for scenario in scenarios:
+                self.register_simulation(scenario)
+                with self as s:
+                    yield s
+        finally:
+            self._warm = False
+            if self._pipeline is not None:
+                self._pipeline.close()
+                self._pipeline = None
+
     def run(self, scenario_path: str = ""):
         """ Alias method to run simulation
 
@@ -186,16 +231,80 @@ class Simulator(Configurator, RuntimeDevice):
         """ Request simulator answer and maps the data locally
 
         """
+        if self._demand:
+            self._release_vehicles()
         if self.step_launch_mode == "lite":
             self._bContinue = self.__library.SymRunNextStepLiteEx(
                 self.write_xml, byref(self._b_end)
             )
             return
+        self._request_full_answer()
+
+    def _request_full_answer(self):
+        """ Request simulator answer with the full response"""
+        if self.pipeline:
+            # Response is processed while the next step is computed
+            if self._pipeline is None:
+                self._pipeline = StepPipeline(
+                    self._process_response,
+                    self.response_buffer.size,
+                    min_size=self.response_buffer.min_size,
+                )
+            buffer = self._pipeline.acquire()
+            self._bContinue = self.__library.SymRunNextStepEx(
+                buffer.raw, self.write_xml, byref(self._b_end)
+            )
+            try:
+                self._pipeline.submit(buffer)
+            except Exception:
+                self._skip_step()
+                raise
+            return
+        # Buffer is about to be overwritten
+        self.request.snapshot.detach()
         self._bContinue = self.__library.SymRunNextStepEx(
             self.buffer_string, self.write_xml, byref(self._b_end)
         )
-        self.request.query = self.buffer_string.value
+        try:
+            self.request.query = self.response_buffer.view()
+        except SymupyBufferError:
+            self._skip_step()
+            raise
+        self.vehicles.update_list()
+
+    def _skip_step(self) -> None:
+        """ Count a step that ran but whose response could not be mapped, so
+            that the step counter stays in sync with the simulator before the
+            error is raised
+        """
+        try:
+            self._c_iter = next(self._n_iter)
+        except StopIteration:
+            self._bContinue = False
+
+    def _process_response(self, buffer) -> None:
+        """ Maps a response locally, runs in the pipeline worker thread"""
+        self.request.query = buffer.view()
         self.vehicles.update_list()
+        # Buffer is released to the simulator afterwards
+        self.request.snapshot.detach()
+
+    def flush(self) -> None:
+        """ Wait until the responses of all computed steps are mapped. Only
+            relevant with ``pipeline=True``, where ``request`` and ``vehicles``
+            are updated in background and may lag one step behind.
+
+            Example:
+                Read the latest data in pipelined mode ::
+
+                >>> with Simulator(pipeline=True, step_launch_mode="full") as s:
+                ...     while s.do_next:
+                ...         s.run_step()
+                ...         s.flush()
+                ...         s.request.get_vehicle_data()
+        """
+        if self._pipeline is not None:
+            self._pipeline.flush()
 
     @printer_time
     def run_step(self) -> int:
@@ -213,6 +322,139 @@ class Simulator(Configurator, RuntimeDevice):
             self._bContinue = False
             return -1
 
+    def run_steps(
+        self, n: int, every: int = None, callback: Callable = None
+    ) -> int:
+        """ Run several simulation steps in a row. Steps run in lite mode 
+            (no response) except every ``every``-th step, which requests and 
+            maps the full response and then calls ``callback``. No step is 
+            printed.
+
+            :param n: number of steps to run
+            :type n: int
+
+            :param every: period in steps of the full responses, defaults to None (lite mode only)
+            :type every: int, optional
+
+            :param callback: function called with the simulator after each full response, returning ``False`` stops the run
+            :type callback: callable, optional
+
+            :returns it: Iteration step, -1 when the simulation is over
+            :type it: int
+
+            Example:
+                Warm up for 300 steps then control every 10 steps ::
+
+                >>> with simulator as s:
+                ...     s.run_steps(300)
+                ...     s.run_steps(600, every=10, callback=controller)
+        """
+        run_lite = self.__library.SymRunNextStepLiteEx
+        write_xml, b_end = self.write_xml, byref(self._b_end)
+        for step in range(1, n + 1):
+            if not self._bContinue:
+                break
+            if self._demand:
+                self._release_vehicles()
+            full = every and not step % every
+            if full:
+                self._request_full_answer()
+            else:
+                self._bContinue = run_lite(write_xml, b_end)
+            try:
+                self._c_iter = next(self._n_iter)
+            except StopIteration:
+                self._bContinue = False
+                return -1
+            if full:
+                self.flush()
+                if callback is not None and callback(self) is False:
+                    break
+        return self._c_iter
+
+    def add_trigger(self, trigger: Trigger, callback: Callable) -> None:
+        """ Register a trigger for ``run_triggered``
+
+            :param trigger: condition waking up the callback
+            :type trigger: Trigger
+
+            :param callback: function called with the simulator when the trigger fires, returning ``False`` stops the run
+            :type callback: callable
+        """
+        self._triggers[trigger] = callback
+
+    def remove_trigger(self, trigger: Trigger) -> None:
+        """ Unregister a trigger
+
+            :param trigger: trigger registered with ``add_trigger``
+            :type trigger: Trigger
+        """
+        self._triggers.pop(trigger, None)
+
+    def run_triggered(self, n: int = None) -> int:
+        """ Run the simulation in lite mode until a registered trigger may 
+            fire. At those steps only the full response is requested, the 
+            triggers are checked and the callbacks of the fired triggers are 
+            called. Triggers flagged ``once`` are removed after firing. The 
+            sections read by the triggers are added to the projection of the
+            request.
+
+            :param n: maximum number of steps, defaults to None (until the end)
+            :type n: int, optional
+
+            :returns it: Iteration step, -1 when the simulation is over
+            :type it: int
+
+            Example:
+                Act only when a truck enters the merge ::
+
+                >>> with simulator as s:
+                ...     s.add_trigger(VehicleEntersLink("Merge", "PL"), ctrl)
+                ...     s.run_triggered()
+        """
+        sections = self.request.sections
+        if sections is not None:
+            needed = {name for t in self._triggers for name in t.sections}
+            missing = tuple(sorted(needed.difference(sections)))
+            if missing:
+                self.request.project(self.request.fields, sections + missing)
+        time_step = self.simulation.time_step
+        run_lite = self.__library.SymRunNextStepLiteEx
+        write_xml, b_end = self.write_xml, byref(self._b_end)
+        count = 0
+        while self._bContinue and (n is None or count < n):
+            step = self._c_iter
+            if self._demand:
+                self._release_vehicles()
+            due = min(
+                (t.next_step(step, time_step) for t in self._triggers),
+                default=None,
+            )
+            if due is None or step < due:
+                self._bContinue = run_lite(write_xml, b_end)
+                due = None
+            else:
+                self._request_full_answer()
+            count += 1
+            try:
+                self._c_iter = next(self._n_iter)
+            except StopIteration:
+                self._bContinue = False
+                return -1
+            if due is None:
+                continue
+            self.flush()
+            for trigger, callback in tuple(self._triggers.items()):
+                if trigger.next_step(step, time_step) != step:
+                    continue
+                if not trigger.check(self.request):
+                    continue
+                if trigger.once:
+                    self.remove_trigger(trigger)
+                if callback(self) is False:
+                    return self._c_iter
+        return self._c_iter
+
     def stop_step(self):
         """Stop current current step of running simulation
 
@@ -262,27 +504,27 @@ class Simulator(Configurator, RuntimeDevice):
 
 
         """
-        endpoints = self._sim.get_network_endpoints()
-        veh_data = self._sim.get_vehicletype_information()
-        vehid = tuple(v["id"] for v in veh_data)
+        index = self._sim.index
 
         # Consistency checks
-        if vehtype not in vehid:
+        if vehtype not in index.vehicle_type_set:
             raise SymupyVehicleCreationError(
                 "Unexisting Vehicle Class in File: ", self.scenarioFilename()
             )
 
+        endpoints = index.endpoint_set
         if (origin not in endpoints) or (destination not in endpoints):
             raise SymupyVehicleCreationError(
                 "Unexisting Network Endpoint File: ", self.scenarioFilename()
             )
 
         # Vehicle creation
+        encoded = self._encoded
         vehid = self.__library.SymCreateVehicleEx(
-            vehtype.encode("UTF8"),
-            origin.encode("UTF8"),
-            destination.encode("UTF8"),
-            c_int(lane),
+            encoded[vehtype],
+            encoded[origin],
+            encoded[destination],
+            int(lane),
             c_double(self.simulationstep),
         )
         return vehid
@@ -294,7 +536,7 @@ class Simulator(Configurator, RuntimeDevice):
         destination: str,
         lane: int = 1,
         creation_time: float = 0,
-        route: str = "",
+        route: Union[str, bytes, Route] = "",
     ) -> int:
         """ Creates a vehicle with a specific route
 
@@ -310,8 +552,8 @@ class Simulator(Configurator, RuntimeDevice):
             :param lane: vehicle lane number, defaults to 1
             :type lane: int 
                     
-            :param route: route followed by the vehicle, defaults to ""
-            :type route: str 
+            :param route: route followed by the vehicle, defaults to "". Encoded routes (``bytes`` or ``Route`` from a ``RouteCache``) are passed as is
+            :type route: str, bytes or Route
  
             :return vehid: Vehicle id of the vehicle created >0
             :type vehid: int
@@ -320,32 +562,110 @@ class Simulator(Configurator, RuntimeDevice):
         if origin == destination:
             return -1
 
-        endpoints = self._sim.get_network_endpoints()
-        veh_data = self._sim.get_vehicletype_information()
-        vehid = tuple(v["id"] for v in veh_data)
+        index = self._sim.index
 
         # Consistency checks
-        if vehtype not in vehid:
+        if vehtype not in index.vehicle_type_set:
             raise SymupyVehicleCreationError(
                 "Unexisting Vehicle Class in File: ", self.scenarioFilename()
             )
 
+        endpoints = index.endpoint_set
         if (origin not in endpoints) or (destination not in endpoints):
             raise SymupyVehicleCreationError(
                 "Unexisting Network Endpoint File: ", self.scenarioFilename()
             )
 
+        if isinstance(route, Route):
+            route = route.encoded
+        elif isinstance(route, str):
+            route = route.encode("UTF8")
+
         # Vehicle creation
+        encoded = self._encoded
         vehid = self.__library.SymCreateVehicleWithRouteEx(
-            origin.encode("UTF8"),
-            destination.encode("UTF8"),
-            vehtype.encode("UTF8"),
-            c_int(lane),
+            encoded[origin],
+            encoded[destination],
+            encoded[vehtype],
+            int(lane),
             c_double(creation_time - self.simulationstep),
-            route.encode("UTF8"),
+            route,
         )
         return vehid
 
+    def create_vehicles(self, batch) -> int:
+        """ Creates vehicles from a demand table. All rows are validated
+            at once, then each vehicle is created during the step in which
+            its creation time falls.
+
+            :param batch: demand table with ``vehtype``, ``origin``, ``destination`` and optional ``lane``, ``time`` and ``route`` columns (see ``symupy.logic.demand``)
+            :type batch: DataFrame or dict
+
+            :returns pending: number of vehicles waiting for creation
+            :type pending: int
+
+            :raises SymupyVehicleCreationError: no vehicle is queued if a row is invalid. Vehicles rejected by the simulator are reported by the step creating them
+
+            Example:
+                Inject a demand table with routes from a route cache ::
+
+                >>> demand["route"] = [
+                ...     routes.route(o, d, rank=i % 3)
+                ...     for i, (o, d) in enumerate(
+                ...         zip(demand["origin"], demand["destination"])
+                ...     )
+                ... ]
+                >>> with simulator as s:
+                ...     s.create_vehicles(demand)
+                ...     while s.do_next:
+                ...         s.run_step()
+        """
+        columns = demand_columns(
+            batch,
+            self._sim.index,
+            self._c_iter * self.simulation.time_step,
+            self.scenarioFilename(),
+        )
+        self._demand.push(*columns)
+        return len(self._demand)
+
+    def _release_vehicles(self) -> list:
+        """ Creates the queued vehicles due before the end of the next step
+
+            :returns vehids: ids of the vehicles created
+            :type vehids: list
+
+            :raises SymupyVehicleCreationError: the simulator rejected vehicles (negative id), raised once the other vehicles of the step are created
+        """
+        time_step = self.simulation.time_step
+        start = self._c_iter * time_step
+        create = self.__library.SymCreateVehicleEx
+        create_with_route = self.__library.SymCreateVehicleWithRouteEx
+        vehids, failed = [], []
+        for row in self._demand.pop(start + time_step):
+            time, vehtype, origin, destination, lane, route = row
+            # Creation instant within the step
+            instant = c_double(max(time - start, 0.0))
+            if route:
+                vehid = create_with_route(
+                    origin, destination, vehtype, lane, instant, route
+                )
+            else:
+                vehid = create(vehtype, origin, destination, lane, instant)
+            if vehid < 0:
+                failed.append((time, vehtype, origin, destination, vehid))
+                continue
+            vehids.append(vehid)
+        if failed:
+            time, vehtype, origin, destination, code = failed[0]
+            raise SymupyVehicleCreationError(
+                f"Simulator rejected {len(failed)} vehicles, first "
+                f"{vehtype.decode('UTF8')} from {origin.decode('UTF8')} to "
+                f"{destination.decode('UTF8')} at {time} (code {code}): ",
+                self.scenarioFilename(),
+            )
+        return vehids
+
     def drive_vehicle(
         self, vehid: int, new_pos: float, destination: str = None, lane: str = 1
     ):
@@ -376,26 +696,85 @@ class Simulator(Configurator, RuntimeDevice):
                 >>>             drive_status = s.drive_vehicle(0, 1.0)
                 >>>             force_driven = s.request.is_vehicle_driven("0")
         """
-        links = self._sim.get_network_links()
+        states = self.drive_vehicles((vehid,), (new_pos,), (destination,), lane)
+        return states[0]
+
+    def drive_vehicles(self, vehids, positions, links=None, lanes=1) -> tuple:
+        """ Drives several vehicles to specific positions within a single 
+            simulation step. All vehicles are validated, then driven, then
+            the simulator answer is requested once.
 
-        if not destination:
-            destination = self.request.filter_vehicle_property("link", vehid)[0]
+            :param vehids: vehicle ids
+            :type vehids: iterable
+
+            :param positions: position to place each vehicle
+            :type positions: iterable
+
+            :param links: link of destination of each vehicle, defaults to None (current link). ``None`` entries keep the current link
+            :type links: iterable, optional
+
+            :param lanes: lane of destination of each vehicle or of all, defaults to 1
+            :type lanes: int or iterable
+
+            :returns states: drive state per vehicle
+            :type states: tuple
+
+            :raises SymupyDriveVehicleError: unknown link, vehicle not in the network or position beyond the link length, no vehicle is driven
+
+            Example:
+                Impose the positions of a platoon computed by a controller ::
 
-        if destination not in links:
+                >>> with symuvia as s:
+                ...     while s.do_next:
+                ...         s.run_step()
+                ...         vehids, positions = controller(s.request)
+                ...         states = s.drive_vehicles(vehids, positions)
+        """
+        vehids = np.asarray(vehids, dtype=np.int32)
+        size = len(vehids)
+        positions = np.broadcast_to(np.asarray(positions, float), size)
+        lanes = np.broadcast_to(np.asarray(lanes, dtype=np.int32), size)
+        links = [None] * size if links is None else list(links)
+        if len(links) != size:
             raise SymupyDriveVehicleError(
-                "Unexisting Network Endpoint File: ", self.scenarioFilename()
+                f"Expected {size} links, got {len(links)}: ",
+                self.scenarioFilename(),
+            )
+
+        current = [i for i, link in enumerate(links) if not link]
+        if current:
+            self.flush()
+            rows = self.request.get_vehicle_rows(*vehids[current].tolist())
+            if (rows < 0).any():
+                raise SymupyDriveVehicleError(
+                    "Vehicle not in network: ", self.scenarioFilename()
+                )
+            column = self.request.get_vehicle_columns(("link",)).link
+            for i, code in zip(current, column.codes[rows].tolist()):
+                links[i] = column.categories[code]
+
+        index = self._sim.index
+        if not index.link_set.issuperset(links):
+            raise SymupyDriveVehicleError(
+                "Unexisting Network Link File: ", self.scenarioFilename()
+            )
+        # Links without geometry have no length
+        lengths = np.array([index.link_length.get(lk, 0) for lk in links])
+        if ((positions < 0) | ((lengths > 0) & (positions > lengths))).any():
+            raise SymupyDriveVehicleError(
+                "Position out of link: ", self.scenarioFilename()
             )
 
-        # TODO: Validate that position do not overpass the max pos
-        dr_state = self.__library.SymDriveVehicleEx(
-            c_int(vehid),
-            destination.encode("UTF8"),
-            c_int(lane),
-            c_double(new_pos),
-            1,
+        encoded = self._encoded
+        drive = self.__library.SymDriveVehicleEx
+        states = tuple(
+            drive(vehid, encoded[link], lane, c_double(pos), 1)
+            for vehid, link, lane, pos in zip(
+                vehids.tolist(), links, lanes.tolist(), positions.tolist()
+            )
         )
         self.request_answer()
-        return dr_state
+        return states
 
     def drive_vehicle_with_control(
         self, vehcontrol, vehid: int, destination: str = None, lane: str = 1
@@ -418,18 +797,6 @@ class Simulator(Configurator, RuntimeDevice):
         ## TODO: Optional
         pass
 
-    def init_total_travel_time(self):
-        """ Counter initializer for total travel time
-        """
-        # TODO: Improvement → Better organizadtion
-        self.__library.SymGetTotalTravelTimeEx.restype = c_double
-
-    def init_total_travel_distance(self):
-        """ Counter initializer for total travel time
-        """
-        # TODO: Improvement → Better organizadtion
-        self.__library.SymGetTotalTravelDistanceEx.restype = c_double
-
     def get_total_travel_time(self, sensors_mfd: list = []):
         """ Computes the total travel time of vehicles in a MFD region
         
@@ -440,17 +807,16 @@ class Simulator(Configurator, RuntimeDevice):
             :type ttt: float
 
         """
-        # TODO: Improvement → Better organizadtion
         if isinstance(sensors_mfd, str):
             return self.__library.SymGetTotalTravelTimeEx(
-                sensors_mfd.encode("UTF8")
+                self._encoded[sensors_mfd]
             )
 
         if not sensors_mfd:
             sensors_mfd = self.simulation.get_mfd_sensor_names()
 
         return tuple(
-            self.__library.SymGetTotalTravelTimeEx(sensor.encode("UTF8"))
+            self.__library.SymGetTotalTravelTimeEx(self._encoded[sensor])
             for sensor in sensors_mfd
         )
 
@@ -466,14 +832,14 @@ class Simulator(Configurator, RuntimeDevice):
         """
         if isinstance(sensors_mfd, str):
             return self.__library.SymGetTotalTravelDistanceEx(
-                sensors_mfd.encode("UTF8")
+                self._encoded[sensors_mfd]
             )
 
         if not sensors_mfd:
             sensors_mfd = self.simulation.get_mfd_sensor_names()
 
         return tuple(
-            self.__library.SymGetTotalTravelDistanceEx(sensor.encode("UTF8"))
+            self.__library.SymGetTotalTravelDistanceEx(self._encoded[sensor])
             for sensor in sensors_mfd
         )
 
@@ -576,6 +942,13 @@ class Simulator(Configurator, RuntimeDevice):
         return self
 
     def __exit__(self, type, value, traceback) -> bool:
+        if self._pipeline is not None:
+            if self._warm:
+                # Kept for the next scenario
+                self._pipeline.flush()
+            else:
+                self._pipeline.close()
+                self._pipeline = None
         self.__library.SymUnloadCurrentNetworkEx()
         click.echo("Runtime: End")
         return False
@@ -611,14 +984,17 @@ class Simulator(Configurator, RuntimeDevice):
             Perform simulation initialization
         """
         self._b_end = c_int()
-        self.request = SimulatorRequest()
+        if self._warm and hasattr(self, "request"):
+            self.request.reset()
+            self.vehicles.reset()
+        else:
+            self.request = SimulatorRequest()
+            self.vehicles = VehicleList(self.request)
         self._n_iter = iter(self._sim.get_simulation_steps())
         self._c_iter = next(self._n_iter)
         self._bContinue = True
-        self.vehicles = VehicleList(self.request)
+        self._demand.clear()
 
-        self.init_total_travel_distance()
-        self.init_total_travel_time()
         self.build_dynamic_param()
 
         self.next_state(self.do_next)
@@ -671,7 +1047,35 @@ class Simulator(Configurator, RuntimeDevice):
             :return: last query from simulator
             :rtype: str
         """
-        return self.buffer_string.value.decode("UTF8")
+        return str(buffer_view(self.buffer_string), "UTF8")
+
+    @property
+    def buffer_stats(self) -> tuple:
+        """
+            Usage statistics of the response buffers, one entry per buffer 
+            (two in pipelined mode)
+
+            Example:
+                Largest response received so far ::
+
+                >>> max(b.high_water for b in simulator.buffer_stats)
+
+            :return: size, last usage, high water mark, steps, resizes and truncations
+            :rtype: tuple
+        """
+        if self._pipeline is not None:
+            return tuple(b.stats for b in self._pipeline.buffers)
+        return (self.response_buffer.stats,)
+
+    @property
+    def pending_vehicles(self) -> int:
+        """
+            Number of vehicles queued by ``create_vehicles`` and not created yet
+
+            :return: vehicles waiting for creation
+            :rtype: int
+        """
+        return len(self._demand)
 
     @property
     def do_next(self) -> bool:
@@ -12,12 +12,17 @@
 import os
 from lxml import etree
 from datetime import datetime
+from math import hypot
+from types import MappingProxyType
+from typing import NamedTuple, Mapping
 
 # ============================================================================
 # INTERNAL IMPORTS
 # ============================================================================
 
 from symupy.utils.exceptions import SymupyFileLoadError
+from symupy.utils.cache import content_hash, load_cached, store_cached
+from symupy.utils.validation import validate_scenario
 from symupy.utils import constants as ct
 
 # ============================================================================
@@ -25,32 +30,339 @@ from symupy.utils import constants as ct
 # ============================================================================
 
 
+class ScenarioIndex(NamedTuple):
+    """ Immutable index of a scenario built once at load. Ordered tuples keep
+        the order of the file, sets answer membership checks in O(1).
+
+        ============================  =================================
+        **Variable**                  **Description**
+        ----------------------------  ---------------------------------
+        ``parameters``                  ``SIMULATION`` attributes
+        ``vehicle_types``               Vehicle type attributes
+        ``endpoints``                   Network endpoint ids
+        ``links``                       Network link ids
+        ``sensors``                     MFD sensor ids
+        ``endpoint_set``                Endpoint ids (set)
+        ``link_set``                    Link ids (set)
+        ``vehicle_type_set``            Vehicle type ids (set)
+        ``sensor_set``                  MFD sensor ids (set)
+        ``sensor_links``                Sensor id -> link ids
+        ``time_step``                   Time step of the first simulation
+        ``link_length``                 Link id -> length (m)
+        ``link_lanes``                  Link id -> number of lanes
+        ``link_ends``                   Link id -> (upstream, downstream) element ids
+        ``link_speed``                  Link id -> regulatory speed (m/s), ``0`` if not set
+        ============================  =================================
+    """
+
+    parameters: tuple
+    vehicle_types: tuple
+    endpoints: tuple
+    links: tuple
+    sensors: tuple
+    endpoint_set: frozenset
+    link_set: frozenset
+    vehicle_type_set: frozenset
+    sensor_set: frozenset
+    sensor_links: Mapping[str, tuple]
+    time_step: float
+    link_length: Mapping[str, float]
+    link_lanes: Mapping[str, int]
+    link_ends: Mapping[str, tuple]
+    link_speed: Mapping[str, float]
+
+
+def _point(coordinates: str) -> tuple:
+    return tuple(float(c) for c in coordinates.split()[:2])
+
+
+def link_length(link) -> float:
+    """ Length of a ``TRONCON`` element, from ``longueur`` when given
+        otherwise from its geometry (extremities and internal points)
+
+        Args:
+            link (Element): ``TRONCON`` element of the network
+
+        Returns:
+            length (float): link length in meters, ``0`` without geometry
+    """
+    length = float(link.get("longueur", 0))
+    if length or link.get("extremite_amont") is None:
+        return length
+    points = [_point(link.get("extremite_amont"))]
+    points.extend(
+        _point(p.get("coordonnees")) for p in link.iter("POINT_INTERNE")
+    )
+    points.append(_point(link.get("extremite_aval")))
+    return sum(
+        hypot(x1 - x0, y1 - y0)
+        for (x0, y0), (x1, y1) in zip(points, points[1:])
+    )
+
+
+# Cache entry kind, to be changed whenever _IndexBuilder changes
+_CACHE_KIND = "index3"
+
+
+class _IndexBuilder(object):
+    """ Collects scenario elements and assembles a ``ScenarioIndex``. The
+        builder only holds plain containers so that it can be cached.
+    """
+
+    def __init__(self):
+        self.parameters = []
+        self.vehicle_types = {}
+        self.endpoints = {}
+        self.links = {}
+        self.sensor_links = {}
+        self.link_length = {}
+        self.link_lanes = {}
+        self.link_ends = {}
+        self.link_speed = {}
+
+    def add_simulation(self, attrib) -> None:
+        self.parameters.append(dict(attrib))
+
+    def add_vehicle_type(self, attrib) -> None:
+        self.vehicle_types.setdefault(attrib["id"], dict(attrib))
+
+    def add_endpoint(self, attrib) -> None:
+        self.endpoints.setdefault(attrib["id"])
+
+    def add_link(self, attrib) -> None:
+        self.links.setdefault(attrib["id"])
+
+    def add_sensor(self, sensor) -> None:
+        self.sensor_links[sensor.get("id")] = tuple(
+            lk.get("id") for lk in sensor.iterfind("TRONCONS/TRONCON")
+        )
+
+    def add_geometry(self, link) -> None:
+        self.link_length[link.get("id")] = link_length(link)
+        self.link_lanes[link.get("id")] = int(link.get("nb_voie", 1))
+        self.link_ends[link.get("id")] = (
+            link.get("id_eltamont"),
+            link.get("id_eltaval"),
+        )
+        self.link_speed[link.get("id")] = float(link.get("vit_reg", 0))
+
+    def build(self) -> ScenarioIndex:
+        parameters = tuple(MappingProxyType(p) for p in self.parameters)
+        return ScenarioIndex(
+            parameters=parameters,
+            vehicle_types=tuple(
+                MappingProxyType(v) for v in self.vehicle_types.values()
+            ),
+            endpoints=tuple(self.endpoints),
+            links=tuple(self.links),
+            sensors=tuple(self.sensor_links),
+            endpoint_set=frozenset(self.endpoints),
+            link_set=frozenset(self.links),
+            vehicle_type_set=frozenset(self.vehicle_types),
+            sensor_set=frozenset(self.sensor_links),
+            sensor_links=MappingProxyType(dict(self.sensor_links)),
+            time_step=(
+                float(parameters[0]["pasdetemps"]) if parameters else 0.0
+            ),
+            link_length=MappingProxyType(dict(self.link_length)),
+            link_lanes=MappingProxyType(dict(self.link_lanes)),
+            link_ends=MappingProxyType(dict(self.link_ends)),
+            link_speed=MappingProxyType(dict(self.link_speed)),
+        )
+
+
+# Element paths below the root feeding the index. Attribute records only
+# need the element attributes, tree records need the element subtree. A
+# ``*`` path step matches any tag.
+_ATTRIBUTE_RECORDS = {
+    ("SIMULATIONS", "SIMULATION"): _IndexBuilder.add_simulation,
+    (
+        "TRAFICS",
+        "TRAFIC",
+        "TYPES_DE_VEHICULE",
+        "TYPE_DE_VEHICULE",
+    ): _IndexBuilder.add_vehicle_type,
+    ("TRAFICS", "TRAFIC", "EXTREMITES", "EXTREMITE"): _IndexBuilder.add_endpoint,
+    ("TRAFICS", "TRAFIC", "TRONCONS", "TRONCON"): _IndexBuilder.add_link,
+}
+_TREE_RECORDS = {
+    (
+        "TRAFICS",
+        "TRAFIC",
+        "PARAMETRAGE_CAPTEURS",
+        "CAPTEURS",
+        "*",
+    ): _IndexBuilder.add_sensor,
+    ("RESEAUX", "RESEAU", "TRONCONS", "TRONCON"): _IndexBuilder.add_geometry,
+}
+
+
+def _collect_tree(root) -> _IndexBuilder:
+    builder = _IndexBuilder()
+    for path, add in _ATTRIBUTE_RECORDS.items():
+        for element in root.iterfind("/".join(path)):
+            add(builder, element.attrib)
+    for path, add in _TREE_RECORDS.items():
+        for element in root.iterfind("/".join(path)):
+            add(builder, element)
+    return builder
+
+
+def build_index(root) -> ScenarioIndex:
+    """ Build the index of a scenario from a loaded XML tree
+
+        Args:
+            root (Element): root of the scenario XML tree
+
+        Returns:
+            index (ScenarioIndex): immutable scenario index
+    """
+    return _collect_tree(root).build()
+
+
+def _release(element) -> None:
+    """ Free a processed element and its already processed siblings"""
+    element.clear(keep_tail=True)
+    parent = element.getparent()
+    if parent is not None:
+        while element.getprevious() is not None:
+            del parent[0]
+
+
+def _collect_stream(file_name: str) -> _IndexBuilder:
+    builder = _IndexBuilder()
+    path = []
+    # Depth of the tree record being collected, its subtree is kept
+    keep = None
+    for event, element in etree.iterparse(
+        file_name, events=("start", "end"), remove_comments=True
+    ):
+        if event == "start":
+            path.append(element.tag)
+            record = tuple(path[1:])
+            if record in _ATTRIBUTE_RECORDS:
+                _ATTRIBUTE_RECORDS[record](builder, element.attrib)
+            elif keep is None:
+                add = _TREE_RECORDS.get(record) or _TREE_RECORDS.get(
+                    record[:-1] + ("*",)
+                )
+                if add is not None:
+                    keep = len(path)
+            continue
+        if keep == len(path):
+            add(builder, element)
+            keep = None
+        if keep is None and len(path) > 1:
+            _release(element)
+        path.pop()
+    return builder
+
+
+def stream_index(file_name: str) -> ScenarioIndex:
+    """ Build the index of a scenario while streaming the file. Only the 
+        elements feeding the index are materialized, every element is freed
+        once processed, so large sections such as vehicle demands are never
+        held in memory.
+
+        Args:
+            file_name (str): path to the scenario file
+
+        Returns:
+            index (ScenarioIndex): immutable scenario index
+    """
+    return _collect_stream(file_name).build()
+
+
 class Simulation(object):
-    def __init__(self, file_name: str) -> None:
+    """ Scenario under simulation
+
+        By default the scenario is streamed at load and only its index is 
+        kept in memory. The full XML tree is loaded the first time 
+        ``xmltree`` is accessed. With a ``cache_dir``, the data of the index
+        is cached on disk by file content, opening a file with the same
+        content again skips the XML parsing.
+
+        Args:
+            file_name (str): path to the scenario file
+            streaming (bool): build the index while streaming the file instead of loading the full tree, defaults to True
+            cache_dir (str): directory owned by the caller where the index is cached, defaults to None (no cache)
+            validate (bool): validate the file against the schema before loading, defaults to False
+            schema (str): path to the schema, defaults to the one declared by the file
+
+        Example:
+            Fail early on invalid scenarios ::
+
+            >>> Simulation("scenario.xml", validate=True)
+
+            Reuse the index across processes ::
+
+            >>> Simulation("scenario.xml", cache_dir="/tmp/symupy")
+    """
+
+    def __init__(
+        self,
+        file_name: str,
+        streaming: bool = True,
+        cache_dir: str = None,
+        validate: bool = False,
+        schema: str = None,
+    ) -> None:
         if os.path.exists(file_name):
             self._file_name = file_name
-            self.load_xml_tree()
+            self._xml_tree = None
+            cache = cache_dir is not None
+            key = content_hash(file_name) if cache or validate else None
+            if validate:
+                validate_scenario(file_name, schema, key, cache_dir)
+            self._load_index(streaming, key if cache else None, cache_dir)
         else:
             raise SymupyFileLoadError("File not found", file_name)
 
+    def _load_index(self, streaming: bool, key: str, cache_dir: str):
+        builder = None
+        if key is not None:
+            builder = load_cached(key, _CACHE_KIND, cache_dir)
+            if not isinstance(builder, _IndexBuilder):
+                builder = None
+        if builder is None:
+            if streaming:
+                builder = _collect_stream(self._file_name)
+            else:
+                self._xml_tree = etree.parse(self._file_name).getroot()
+                builder = _collect_tree(self._xml_tree)
+            if key is not None:
+                store_cached(key, _CACHE_KIND, builder, cache_dir)
+        self._index = builder.build()
+
     def __repr__(self):
         return f"{self.__class__.__name__}({self.filename()})"
 
     def load_xml_tree(self) -> None:
         """ Load XML file_name
         """
-        # TODO: Add validation with DTD
         tree = etree.parse(self._file_name)
         root = tree.getroot()
-        self._xml_tree = root
+        self.xmltree = root
 
     @property
     def xmltree(self):
+        if self._xml_tree is None:
+            self.load_xml_tree()
         return self._xml_tree
 
     @xmltree.setter
     def xmltree(self, rootxml):
         self._xml_tree = rootxml
+        self._index = build_index(rootxml)
+
+    @property
+    def index(self) -> ScenarioIndex:
+        """ Scenario index built when the XML tree is loaded
+
+        :return: immutable index of ids, sensors and link data
+        :rtype: ScenarioIndex
+        """
+        return self._index
 
     def get_simulation_parameters(self) -> tuple:
         """ Get simulation parameters
@@ -58,9 +370,7 @@ class Simulation(object):
         :return: tuple with XML dictionary containing parameters
         :rtype: tuple
         """
-        branch_tree = "SIMULATIONS"
-        sim_params = self.xmltree.xpath(branch_tree)[0].getchildren()
-        return tuple(par.attrib for par in sim_params)
+        return self._index.parameters
 
     def get_vehicletype_information(self) -> tuple:
         """ Get the vehicle parameters
@@ -68,9 +378,7 @@ class Simulation(object):
         :return: tuple of dictionaries containing vehicle parameters
         :rtype: tuple
         """
-        branch_tree = "TRAFICS/TRAFIC/TYPES_DE_VEHICULE"
-        vehicle_types = self.xmltree.xpath(branch_tree)[0].getchildren()
-        return tuple(v.attrib for v in vehicle_types)
+        return self._index.vehicle_types
 
     def get_network_endpoints(self) -> tuple:
         """ Get networks endpoint names
@@ -78,9 +386,7 @@ class Simulation(object):
         :return: tuple containing endpoint names
         :rtype: tuple
         """
-        branch_tree = "TRAFICS/TRAFIC/EXTREMITES"
-        end_points = self.xmltree.xpath(branch_tree)[0].getchildren()
-        return tuple(ep.attrib["id"] for ep in end_points)
+        return self._index.endpoints
 
     def get_network_links(self) -> tuple:
         """ Get network link names
@@ -88,9 +394,7 @@ class Simulation(object):
         :return: tuple containing link names 
         :rtype: tuple
         """
-        branch_tree = "TRAFICS/TRAFIC/TRONCONS"
-        links = self.xmltree.xpath(branch_tree)[0].getchildren()
-        return tuple(ep.attrib["id"] for ep in links)
+        return self._index.links
 
     def get_simulation_steps(self, simid: int = 0) -> range:
         """Get simulation steps for an simulation. specify the simulation id  via an integer value
@@ -100,10 +404,11 @@ class Simulation(object):
         :return:
         :rtype: range
         """
-        t1 = datetime.strptime(self.get_simulation_parameters()[simid].get("debut"), ct.HOUR_FORMAT)
-        t2 = datetime.strptime(self.get_simulation_parameters()[simid].get("fin"), ct.HOUR_FORMAT)
+        parameters = self._index.parameters[simid]
+        t1 = datetime.strptime(parameters.get("debut"), ct.HOUR_FORMAT)
+        t2 = datetime.strptime(parameters.get("fin"), ct.HOUR_FORMAT)
         t = t2 - t1
-        n = t.seconds / float(self.get_simulation_parameters()[simid].get("pasdetemps"))
+        n = t.seconds / float(parameters.get("pasdetemps"))
         return range(int(n))
 
     def get_mfd_sensor_names(self) -> tuple:
@@ -112,9 +417,7 @@ class Simulation(object):
         :return: tuple of MFD sensors in the network
         :rtype: tuple
         """
-        branch_tree = "TRAFICS/TRAFIC/PARAMETRAGE_CAPTEURS/CAPTEURS"
-        sensors = self.xmltree.xpath(branch_tree)[0].getchildren()
-        return tuple(sn.attrib["id"] for sn in sensors)
+        return self._index.sensors
 
     def get_links_in_mfd_sensor(self, sensor_id: str) -> tuple:
         """ Get links associated to a particular MFD sensor for a specific simulation
@@ -124,14 +427,7 @@ class Simulation(object):
         :return: tuple of strings with links covered by the sensor
         :rtype: tuple
         """
-        branch_tree = "TRAFICS/TRAFIC/PARAMETRAGE_CAPTEURS/CAPTEURS"
-        sensors = self.xmltree.xpath(branch_tree)[0].getchildren()
-        try:
-            sensor_element = sensors[self.get_mfd_sensor_names().index(sensor_id)]
-            links = sensor_element.getchildren()[0].getchildren()
-            return tuple(lk.attrib["id"] for lk in links)
-        except:
-            return ()
+        return self._index.sensor_links.get(sensor_id, ())
 
     def __contains__(self, value: tuple) -> bool:
         # REVIEW: Implement? in method? maybe useful
@@ -152,4 +448,4 @@ class Simulation(object):
 
     @property
     def time_step(self):
-        return float(self.get_simulation_parameters()[0].get("pasdetemps"))
+        return self._index.time_step
@@ -1,4 +1,5 @@
 from symupy.components.networks import RoadNetwork, RoadSideUnit
+from symupy.components.networks import Route, RouteCache
 from symupy.components.networks import V2INetwork, V2VNetwork
 from symupy.components.vehicles import Vehicle, VehicleList
 from symupy.components.control import VehicleControl, VehicleGroupControl
@@ -1,2 +1,3 @@
 from symupy.components.networks.models import RoadNetwork, RoadSideUnit
+from symupy.components.networks.models import Route, RouteCache
 from symupy.components.networks.models import V2INetwork, V2VNetwork
@@ -1,2 +1,3 @@
 from .road_networks import RoadNetwork, RoadSideUnit
+from .routes import Route, RouteCache
 from .vehc_networks import V2INetwork, V2VNetwork
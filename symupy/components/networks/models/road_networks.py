@@ -1,21 +1,317 @@
-""" 
+"""
     Road Networks - Submodule
 
-    This submodule contains the networks that can be created at infrastructure level. Networks can be of different types and at different layers. E.g. Road network where cars drive is physical one. 
+    This submodule contains the networks that can be created at infrastructure level. Networks can be of different types and at different layers. E.g. Road network where cars drive is physical one.
 
-    LICIT-LAB 
+    LICIT-LAB
     Author: Andres Ladino
 """
 import typing
+from heapq import heappush, heappop
+from math import inf
+
+import numpy as np
 
 # Module imports
 from symupy.utils import constants as ct
 
-import networkx as nx
-
 
 class RoadNetwork(object):
-    pass
+    """ Directed graph of the road network. Nodes are the elements
+        connecting links (extremities, junctions, crossroads), links are the
+        ``TRONCON`` of the network. Nodes and links are numbered in file order
+        and the graph is stored in arrays:
+
+        ============================  =================================
+        **Variable**                  **Description**
+        ----------------------------  ---------------------------------
+        ``nodes``                       Node ids, by node number
+        ``links``                       Link ids, by link number
+        ``tail``                        Upstream node of each link
+        ``head``                        Downstream node of each link
+        ``length``                      Length of each link (m)
+        ``free_flow_time``              Free-flow travel time of each link (s)
+        ``indptr``                      CSR offsets of the links leaving each node
+        ``out_links``                   Links sorted by upstream node
+        ============================  =================================
+
+        Links leaving node ``n`` are ``out_links[indptr[n]:indptr[n + 1]]``.
+        Links without upstream or downstream element have ``-1`` ends and are
+        left out of the adjacency.
+
+        Args:
+            links (iterable): ``(link, upstream, downstream, length, speed)`` tuples
+
+        Example:
+            Route between two endpoints ::
+
+            >>> network = RoadNetwork.from_simulation(Simulation("scenario.xml"))
+            >>> cost, route = network.shortest_path("Ext_In", "Ext_Out")
+    """
+
+    def __init__(self, links: typing.Iterable[tuple]):
+        node_index = {}
+        link_ids, tail, head, length, speed = [], [], [], [], []
+        for link, upstream, downstream, lk_length, lk_speed in links:
+            ends = []
+            for node in (upstream, downstream):
+                if node is None:
+                    ends.append(-1)
+                    continue
+                ends.append(node_index.setdefault(node, len(node_index)))
+            link_ids.append(link)
+            tail.append(ends[0])
+            head.append(ends[1])
+            length.append(lk_length)
+            speed.append(lk_speed)
+
+        self.nodes = tuple(node_index)
+        self.links = tuple(link_ids)
+        self._node_index = node_index
+        self._link_index = {lk: i for i, lk in enumerate(self.links)}
+        self.tail = np.array(tail, dtype=np.int32)
+        self.head = np.array(head, dtype=np.int32)
+        self.length = np.array(length, dtype=np.float64)
+        self.free_flow_time = self.length / np.array(speed, dtype=np.float64)
+
+        connected = np.flatnonzero((self.tail >= 0) & (self.head >= 0))
+        order = np.argsort(self.tail[connected], kind="stable")
+        self.out_links = connected[order].astype(np.int32)
+        counts = np.bincount(self.tail[connected], minlength=len(self.nodes))
+        self.indptr = np.zeros(len(self.nodes) + 1, dtype=np.int32)
+        np.cumsum(counts, out=self.indptr[1:])
+
+        # Python lists of the arrays, indexing them is faster in loops
+        self._lists = None
+        self._weight_lists = {}
+
+    @classmethod
+    def from_simulation(cls, simulation, default_speed: float = None):
+        """ Network of a scenario, from the ``RESEAU`` links of its index.
+            Links without regulatory speed (``vit_reg``) use the highest free
+            speed of the vehicle types.
+
+            Args:
+                simulation (Simulation): scenario
+                default_speed (float): speed of links without regulatory speed (m/s)
+
+            Returns:
+                network (RoadNetwork): network graph
+        """
+        index = simulation.index
+        if default_speed is None:
+            default_speed = max(
+                (float(v.get("vx", 0)) for v in index.vehicle_types),
+                default=0,
+            )
+            default_speed = default_speed or ct.FREE_FLOW_SPEED
+        return cls(
+            (
+                link,
+                upstream,
+                downstream,
+                index.link_length[link],
+                index.link_speed[link] or default_speed,
+            )
+            for link, (upstream, downstream) in index.link_ends.items()
+        )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}"
+            f"(nodes={len(self.nodes)}, links={len(self.links)})"
+        )
+
+    def node(self, node: str) -> int:
+        """ Number of a node
+
+            Args:
+                node (str): node id
+
+            Returns:
+                number (int): node number
+        """
+        return self._node_index[node]
+
+    def link(self, link: str) -> int:
+        """ Number of a link
+
+            Args:
+                link (str): link id
+
+            Returns:
+                number (int): link number
+        """
+        return self._link_index[link]
+
+    def successors(self, node: str) -> tuple:
+        """ Links leaving a node
+
+            Args:
+                node (str): node id
+
+            Returns:
+                links (tuple): link ids
+        """
+        n = self._node_index[node]
+        out_links = self.out_links[self.indptr[n] : self.indptr[n + 1]]
+        return tuple(self.links[lk] for lk in out_links)
+
+    def _adjacency(self) -> tuple:
+        if self._lists is None:
+            self._lists = (
+                self.indptr.tolist(),
+                self.out_links.tolist(),
+                self.tail.tolist(),
+                self.head.tolist(),
+            )
+        return self._lists
+
+    def _weights(self, weight) -> list:
+        """ Cost of each link as a list
+
+            Args:
+                weight: ``None`` for free-flow time, ``"length"``, or one value per link
+        """
+        if weight is None or isinstance(weight, str):
+            key = weight or "free_flow_time"
+            if key not in self._weight_lists:
+                self._weight_lists[key] = getattr(self, key).tolist()
+            return self._weight_lists[key]
+        weights = np.asarray(weight, dtype=np.float64)
+        if weights.shape != self.length.shape:
+            raise ValueError(
+                f"Expected {len(self.links)} link weights, got {weights.size}"
+            )
+        return weights.tolist()
+
+    def _dijkstra(
+        self,
+        source: int,
+        target: int,
+        weights: list,
+        banned_links=frozenset(),
+        banned_nodes=frozenset(),
+    ) -> tuple:
+        """ Shortest path between node numbers, stops when the target is
+            settled. Banned links and nodes are not used.
+
+            Returns:
+                cost (float): path cost, ``inf`` without path
+                path (list): link numbers, ``None`` without path
+        """
+        if source == target:
+            return 0.0, []
+        indptr, out_links, tail, head = self._adjacency()
+        dist = {source: 0.0}
+        pred = {}
+        settled = set()
+        heap = [(0.0, source)]
+        while heap:
+            cost, node = heappop(heap)
+            if node == target:
+                break
+            if node in settled:
+                continue
+            settled.add(node)
+            for k in range(indptr[node], indptr[node + 1]):
+                lk = out_links[k]
+                nxt = head[lk]
+                if lk in banned_links or nxt in banned_nodes:
+                    continue
+                new = cost + weights[lk]
+                if new < dist.get(nxt, inf):
+                    dist[nxt] = new
+                    pred[nxt] = lk
+                    heappush(heap, (new, nxt))
+        else:
+            return inf, None
+        path = []
+        while node != source:
+            lk = pred[node]
+            path.append(lk)
+            node = tail[lk]
+        path.reverse()
+        return cost, path
+
+    def shortest_path(
+        self, origin: str, destination: str, weight=None
+    ) -> tuple:
+        """ Shortest path between two nodes
+
+            Args:
+                origin (str): origin node id e.g. a network entry
+                destination (str): destination node id e.g. a network exit
+                weight: link cost, ``None`` for free-flow time, ``"length"``, or one value per link
+
+            Returns:
+                cost (float): path cost, ``inf`` if the destination cannot be reached
+                route (tuple): link ids of the path
+        """
+        cost, path = self._dijkstra(
+            self._node_index[origin],
+            self._node_index[destination],
+            self._weights(weight),
+        )
+        if path is None:
+            return inf, ()
+        return cost, tuple(self.links[lk] for lk in path)
+
+    def k_shortest_paths(
+        self, origin: str, destination: str, k: int, weight=None
+    ) -> tuple:
+        """ ``k`` shortest loopless paths between two nodes (Yen's
+            algorithm), by increasing cost
+
+            Args:
+                origin (str): origin node id e.g. a network entry
+                destination (str): destination node id e.g. a network exit
+                k (int): number of paths
+                weight: link cost, ``None`` for free-flow time, ``"length"``, or one value per link
+
+            Returns:
+                paths (tuple): ``(cost, route)`` pairs, fewer than ``k`` if there are no more paths
+        """
+        source = self._node_index[origin]
+        target = self._node_index[destination]
+        weights = self._weights(weight)
+        _, _, tail, head = self._adjacency()
+        cost, path = self._dijkstra(source, target, weights)
+        if path is None:
+            return ()
+        found = [(cost, path)]
+        seen = {tuple(path)}
+        candidates = []
+        while len(found) < k:
+            previous = found[-1][1]
+            spur, root_cost = source, 0.0
+            for i, lk in enumerate(previous):
+                root = previous[:i]
+                # Deviate from every path found sharing this root
+                banned_links = {
+                    p[i] for _, p in found if len(p) > i and p[:i] == root
+                }
+                banned_nodes = {tail[r] for r in root}
+                spur_cost, spur_path = self._dijkstra(
+                    spur, target, weights, banned_links, banned_nodes
+                )
+                if spur_path is not None:
+                    candidate = tuple(root + spur_path)
+                    if candidate not in seen:
+                        seen.add(candidate)
+                        heappush(
+                            candidates, (root_cost + spur_cost, candidate)
+                        )
+                root_cost += weights[lk]
+                spur = head[lk]
+            if not candidates:
+                break
+            cost, path = heappop(candidates)
+            found.append((cost, list(path)))
+        return tuple(
+            (cost, tuple(self.links[lk] for lk in path))
+            for cost, path in found
+        )
 
 
 class RoadSideUnit(object):
@@ -0,0 +1,173 @@
+"""
+    Routes - Submodule
+
+    This submodule contains the route service used to create vehicles with a route. Routes between network endpoints are computed once on the road network and kept together with the encoded route string expected by the simulator.
+
+    Example:
+        Inject a routed vehicle ::
+
+        >>> routes = RouteCache.from_simulation(simulation, k=3)
+        >>> route = routes.route("Ext_In", "Ext_Out", rank=1)
+        >>> simulator.create_vehicle_with_route("VL", "Ext_In", "Ext_Out", route=route)
+"""
+import typing
+from itertools import product
+from typing import NamedTuple
+
+# Module imports
+from .road_networks import RoadNetwork
+
+
+class Route(NamedTuple):
+    """ Route between two network endpoints
+
+        ============================  =================================
+        **Variable**                  **Description**
+        ----------------------------  ---------------------------------
+        ``cost``                        Cost of the route
+        ``links``                       Link ids of the route
+        ``encoded``                     Route string for the simulator (UTF-8)
+        ============================  =================================
+    """
+
+    cost: float
+    links: tuple
+    encoded: bytes
+
+
+def encode_route(links: typing.Iterable[str]) -> bytes:
+    """ Route string expected by the simulator, link ids separated by spaces
+
+        Args:
+            links (iterable): link ids
+
+        Returns:
+            route (bytes): UTF-8 encoded route
+    """
+    return " ".join(links).encode("UTF8")
+
+
+class RouteCache(object):
+    """ Cache of the ``k`` shortest routes per (origin, destination) pair.
+        Routes are computed on the first request of a pair and kept until
+        ``clear`` is called.
+
+        Args:
+            network (RoadNetwork): network graph
+            k (int): routes per pair
+            weight: link cost, ``None`` for free-flow time, ``"length"``, or one value per link
+            endpoints (iterable): network endpoints, pairs precomputed by default
+    """
+
+    def __init__(
+        self,
+        network: RoadNetwork,
+        k: int = 1,
+        weight=None,
+        endpoints: typing.Iterable[str] = (),
+    ):
+        self.network = network
+        self.k = max(1, int(k))
+        self._weight = weight
+        self.endpoints = tuple(e for e in endpoints if e in network.nodes)
+        self._routes = {}
+
+    @classmethod
+    def from_simulation(cls, simulation, k: int = 1, weight=None):
+        """ Route cache of a scenario network
+
+            Args:
+                simulation (Simulation): scenario
+                k (int): routes per pair
+                weight: link cost, ``None`` for free-flow time, ``"length"``, or one value per link
+
+            Returns:
+                routes (RouteCache): route cache
+        """
+        return cls(
+            RoadNetwork.from_simulation(simulation),
+            k,
+            weight,
+            simulation.index.endpoints,
+        )
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(k={self.k}, pairs={len(self)})"
+
+    def __len__(self):
+        return len(self._routes)
+
+    def __contains__(self, pair: tuple) -> bool:
+        return pair in self._routes
+
+    @property
+    def weight(self):
+        """ Link cost, setting it clears the cache"""
+        return self._weight
+
+    @weight.setter
+    def weight(self, weight):
+        self._weight = weight
+        self.clear()
+
+    def clear(self) -> None:
+        """ Drop all cached routes"""
+        self._routes.clear()
+
+    def routes(self, origin: str, destination: str) -> tuple:
+        """ Shortest routes between two endpoints, by increasing cost
+
+            Args:
+                origin (str): network entry
+                destination (str): network exit
+
+            Returns:
+                routes (tuple): up to ``k`` routes, empty if the exit cannot be reached
+        """
+        try:
+            return self._routes[origin, destination]
+        except KeyError:
+            pass
+        paths = self.network.k_shortest_paths(
+            origin, destination, self.k, self._weight
+        )
+        routes = tuple(
+            Route(cost, links, encode_route(links)) for cost, links in paths
+        )
+        self._routes[origin, destination] = routes
+        return routes
+
+    def route(self, origin: str, destination: str, rank: int = 0) -> Route:
+        """ Route between two endpoints
+
+            Args:
+                origin (str): network entry
+                destination (str): network exit
+                rank (int): ``0`` for the shortest route, wraps around the available routes
+
+            Returns:
+                route (Route): route, ``None`` if the exit cannot be reached
+        """
+        routes = self.routes(origin, destination)
+        return routes[rank % len(routes)] if routes else None
+
+    def precompute(
+        self,
+        origins: typing.Iterable[str] = None,
+        destinations: typing.Iterable[str] = None,
+    ) -> int:
+        """ Compute the routes of all pairs before the simulation
+
+            Args:
+                origins (iterable): network entries, defaults to the endpoints
+                destinations (iterable): network exits, defaults to the endpoints
+
+            Returns:
+                pairs (int): number of cached pairs
+        """
+        origins = self.endpoints if origins is None else origins
+        destinations = self.endpoints if destinations is None else destinations
+        for origin, destination in product(origins, tuple(destinations)):
+            if origin != destination:
+                self.routes(origin, destination)
+        return len(self)
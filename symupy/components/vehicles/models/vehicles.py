@@ -11,6 +11,8 @@ Vehicle model acts as an instance to trace individual vehicle data and modify ve
 # ============================================================================
 
 from typing import Dict, List
+from heapq import merge
+from operator import attrgetter
 import itertools
 import numpy as np
 import pandas as pd
@@ -151,12 +153,48 @@ class VehicleList(SortedFrozenSet):
         self._request = request
         data = [Vehicle(request, **v) for v in request.get_vehicle_data()]
         super().__init__(data)
+        self._vehids = set(v.vehid for v in self._items)
+
+    def reset(self) -> None:
+        """ Start over from the current response, e.g. before a new 
+            simulation. Vehicles of the list stop receiving updates and the
+            vehicles of the current response are tracked instead.
+        """
+        for vehicle in self._items:
+            vehicle.unsubscribe()
+        request = self._request
+        self._items = tuple(
+            sorted(
+                (Vehicle(request, **v) for v in request.get_vehicle_data()),
+                key=attrgetter("vehid"),
+            )
+        )
+        self._vehids = set(v.vehid for v in self._items)
 
     def update_list(self):
-        """ Update vehicle data according to an update in the request.
+        """ Update vehicle data according to an update in the request. Only 
+            vehicles that entered the network since the last response are 
+            created.
         """
-        data = self + VehicleList(self._request)
-        self._items = data._items
+        request = self._request
+        entered = [
+            vehid
+            for vehid in request.delta.entered.tolist()
+            if vehid not in self._vehids
+        ]
+        if not entered:
+            return
+        data = sorted(
+            (
+                Vehicle(request, **request.get_vehicle_properties(v))
+                for v in entered
+            ),
+            key=attrgetter("vehid"),
+        )
+        self._items = tuple(
+            merge(self._items, data, key=attrgetter("vehid"))
+        )
+        self._vehids.update(entered)
 
     def _get_vehicles_attribute(self, attribute: str) -> pd.Series:
         """ Retrieve list of parameters 
@@ -0,0 +1,206 @@
+"""
+Vehicle Demand
+==============
+This module holds vehicles waiting to be created in the simulation. A demand table is validated as a whole against the scenario and its identifiers are encoded once per distinct value. Rows are then kept sorted by creation time and handed out step by step as their creation time comes due.
+
+    ============================  =================================
+    **Column**                    **Description**
+    ----------------------------  ---------------------------------
+    ``vehtype``                     Vehicle type
+    ``origin``                      Network entry
+    ``destination``                 Network exit
+    ``lane``                        Entry lane, defaults to 1
+    ``time``                        Creation time (s), defaults to now
+    ``route``                       Route (``str``, ``bytes`` or ``Route``), defaults to none
+    ============================  =================================
+
+Example:
+    Inject an hour of demand ::
+
+    >>> demand = pd.read_csv("demand.csv")
+    >>> simulator.create_vehicles(demand)
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.components import Route
+from symupy.utils.exceptions import SymupyVehicleCreationError
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+# Invalid rows reported in error messages
+_REPORTED_ROWS = 5
+
+
+def encode_column(values) -> np.ndarray:
+    """ UTF-8 encoding of a column of identifiers, each distinct value is
+        encoded once
+
+        Args:
+            values (iterable): identifiers
+
+        Returns:
+            encoded (ndarray): object array of ``bytes``
+    """
+    values = np.asarray(values, dtype=str)
+    uniques, codes = np.unique(values, return_inverse=True)
+    encoded = np.empty(len(uniques), dtype=object)
+    encoded[:] = [u.encode("UTF8") for u in uniques.tolist()]
+    return encoded[codes]
+
+
+def _encode_route(route) -> bytes:
+    if isinstance(route, Route):
+        return route.encoded
+    if isinstance(route, bytes):
+        return route
+    if isinstance(route, str):
+        return route.encode("UTF8")
+    return b""
+
+
+def _check(valid: np.ndarray, message: str, scenario: str) -> None:
+    if valid.all():
+        return
+    rows = np.flatnonzero(~valid)
+    shown = ", ".join(str(r) for r in rows[:_REPORTED_ROWS])
+    more = "..." if len(rows) > _REPORTED_ROWS else ""
+    raise SymupyVehicleCreationError(
+        f"{message} in {len(rows)} rows ({shown}{more}): ", scenario
+    )
+
+
+def demand_columns(
+    batch, index, time: float = 0.0, scenario: str = ""
+) -> tuple:
+    """ Validate a demand table against a scenario and encode it
+
+        Args:
+            batch (DataFrame or dict): demand table, see the module columns
+            index (ScenarioIndex): scenario index
+            time (float): creation time of rows without time
+            scenario (str): scenario file, reported in errors
+
+        Returns:
+            columns (tuple): time, vehtype, origin, destination, lane and route arrays
+
+        Raises:
+            SymupyVehicleCreationError: rows with unknown vehicle types or endpoints, or the same origin and destination
+    """
+    vehtype = np.asarray(batch["vehtype"], dtype=str)
+    origin = np.asarray(batch["origin"], dtype=str)
+    destination = np.asarray(batch["destination"], dtype=str)
+    n = len(vehtype)
+
+    endpoints = list(index.endpoint_set)
+    _check(
+        np.isin(vehtype, list(index.vehicle_type_set)),
+        "Unexisting Vehicle Class",
+        scenario,
+    )
+    _check(
+        np.isin(origin, endpoints) & np.isin(destination, endpoints),
+        "Unexisting Network Endpoint",
+        scenario,
+    )
+    _check(origin != destination, "Same origin and destination", scenario)
+
+    times = (
+        np.asarray(batch["time"], dtype=np.float64)
+        if "time" in batch
+        else np.full(n, time)
+    )
+    lanes = (
+        np.asarray(batch["lane"], dtype=np.int32)
+        if "lane" in batch
+        else np.ones(n, dtype=np.int32)
+    )
+    routes = np.empty(n, dtype=object)
+    if "route" in batch:
+        routes[:] = [_encode_route(r) for r in batch["route"]]
+    else:
+        routes[:] = b""
+    return (
+        times,
+        encode_column(vehtype),
+        encode_column(origin),
+        encode_column(destination),
+        lanes,
+        routes,
+    )
+
+
+class DemandQueue(object):
+    """ Vehicles waiting for their creation time, sorted by time. Rows with
+        the same creation time keep their insertion order.
+
+        Example:
+            Vehicles created during the step starting at ``t`` ::
+
+            >>> queue.push(*demand_columns(batch, sim.index))
+            >>> for row in queue.pop(t + dt):
+            ...     time, vehtype, origin, destination, lane, route = row
+    """
+
+    def __init__(self):
+        self.clear()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({len(self)})"
+
+    def __len__(self):
+        return len(self._columns[0])
+
+    def clear(self) -> None:
+        """ Drop all waiting vehicles"""
+        self._columns = (
+            np.empty(0, dtype=np.float64),
+            np.empty(0, dtype=object),
+            np.empty(0, dtype=object),
+            np.empty(0, dtype=object),
+            np.empty(0, dtype=np.int32),
+            np.empty(0, dtype=object),
+        )
+
+    @property
+    def next_time(self) -> float:
+        """ Creation time of the next vehicle, ``inf`` when empty"""
+        times = self._columns[0]
+        return times[0] if len(times) else np.inf
+
+    def push(self, time, vehtype, origin, destination, lane, route) -> None:
+        """ Add vehicles to the queue, arguments as returned by
+            ``demand_columns``
+        """
+        new = (time, vehtype, origin, destination, lane, route)
+        columns = tuple(
+            np.concatenate((c, n)) for c, n in zip(self._columns, new)
+        )
+        order = np.argsort(columns[0], kind="stable")
+        self._columns = tuple(c[order] for c in columns)
+
+    def pop(self, horizon: float) -> list:
+        """ Remove the vehicles created before ``horizon``
+
+            Args:
+                horizon (float): time (s)
+
+            Returns:
+                rows (list): ``(time, vehtype, origin, destination, lane, route)`` tuples by creation time
+        """
+        n = int(np.searchsorted(self._columns[0], horizon, side="left"))
+        if not n:
+            return []
+        rows = list(zip(*(c[:n].tolist() for c in self._columns)))
+        self._columns = tuple(c[n:] for c in self._columns)
+        return rows
@@ -0,0 +1,151 @@
+"""
+Step Pipeline
+=============
+This module implements a double buffered pipeline to overlap the computation of a simulation step with the processing of the previous one. Responses are written by the simulator into a ring of ``ResponseBuffer`` and handed to a worker thread that processes them strictly in submission order.
+
+Example:
+    Overlap the simulator call with the parsing of the previous step ::
+
+    >>> pipe = StepPipeline(process, size=ct.BUFFER_STRING)
+    >>> buffer = pipe.acquire()  # Blocks until a buffer is free
+    >>> lib.SymRunNextStepEx(buffer.raw, write_xml, byref(b_end))
+    >>> pipe.submit(buffer)  # Processed in background
+    >>> pipe.flush()  # Waits until all steps are processed
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from queue import Queue
+from threading import Semaphore, Thread
+from typing import Callable
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.buffers import ResponseBuffer
+from symupy.utils.exceptions import SymupyError
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+
+class StepPipeline(object):
+    """ Ring of response buffers processed by a single worker thread.
+
+        A buffer is handed back by ``acquire`` only once the worker is done
+        with the response it previously held, so at most ``depth`` steps are
+        in flight. Errors raised by ``process`` are raised again in the
+        calling thread on the next ``acquire``, ``submit`` or ``flush``,
+        responses submitted in between are dropped. A buffer rejected by
+        ``submit`` is returned to the ring.
+
+        Args:
+            process (callable): function called with each filled buffer, runs in the worker thread
+            size (int): initial size of each buffer in bytes
+            depth (int): number of buffers, defaults to 2 (double buffering)
+            min_size (int): minimum size of each buffer in bytes, defaults to ``size``
+    """
+
+    def __init__(
+        self,
+        process: Callable,
+        size: int,
+        depth: int = 2,
+        min_size: int = None,
+    ):
+        self._process = process
+        self._buffers = tuple(
+            ResponseBuffer(size, min_size) for _ in range(depth)
+        )
+        self._free = Semaphore(depth)
+        self._queue = Queue(maxsize=depth)
+        self._next = 0
+        self._error = None
+        self._worker = Thread(
+            target=self._run, name="symupy-pipeline", daemon=True
+        )
+        self._worker.start()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(depth={self.depth})"
+
+    @property
+    def depth(self) -> int:
+        """Number of buffers in the ring"""
+        return len(self._buffers)
+
+    @property
+    def buffers(self) -> tuple:
+        """Buffers of the ring"""
+        return self._buffers
+
+    @property
+    def running(self) -> bool:
+        """True while the worker accepts new steps"""
+        return self._worker.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            buffer = self._queue.get()
+            try:
+                if buffer is None:
+                    return
+                if self._error is None:
+                    self._process(buffer)
+            except BaseException as error:
+                self._error = error
+            finally:
+                if buffer is not None:
+                    self._free.release()
+                self._queue.task_done()
+
+    def _check(self) -> None:
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def acquire(self):
+        """ Next buffer to be filled by the simulator. Blocks while the
+            worker still processes the response held by that buffer.
+
+            Returns:
+                buffer (ResponseBuffer): free response buffer
+        """
+        self._check()
+        self._free.acquire()
+        buffer = self._buffers[self._next]
+        self._next = (self._next + 1) % self.depth
+        return buffer
+
+    def submit(self, buffer) -> None:
+        """ Queue a filled buffer for processing
+
+            Args:
+                buffer (ResponseBuffer): buffer returned by ``acquire``
+        """
+        try:
+            self._check()
+            if not self.running:
+                raise SymupyError("Pipeline is closed", self)
+        except BaseException:
+            # Buffer is not queued, hand it out again on the next acquire
+            self._next = self._buffers.index(buffer)
+            self._free.release()
+            raise
+        self._queue.put(buffer)
+
+    def flush(self) -> None:
+        """ Wait until all submitted buffers are processed"""
+        self._queue.join()
+        self._check()
+
+    def close(self) -> None:
+        """ Process the pending buffers and stop the worker"""
+        if self._worker.is_alive():
+            self._queue.put(None)
+            self._worker.join()
+        self._check()
@@ -45,5 +45,9 @@ class Subscriber(AbsObserver):
     def update(self):
         self._call = next(self._counter)
 
-    def __exit__(self, exc_type, exc_value, traceback):
+    def unsubscribe(self):
+        """ Stop receiving the updates of the publisher"""
         self._publisher.detach(self, self._channel)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.unsubscribe()
@@ -0,0 +1,177 @@
+"""
+Triggers
+========
+This module describes conditions that wake up a controller during a simulation. Between wake-ups the simulator runs without requesting responses. Each trigger tells the simulator the next step at which it may fire, the simulator requests the full response at that step only and checks the trigger against it.
+
+    ============================  =================================
+    **Trigger**                   **Fires when**
+    ----------------------------  ---------------------------------
+    ``TimeReached``                 The simulation time is reached
+    ``VehicleEntersLink``           A vehicle (of a type) enters a link
+    ``EntryQueueAbove``             An entry queue exceeds a length
+    ``VehicleAppears``              A vehicle id is in the network
+    ============================  =================================
+
+State triggers cannot be predicted from lite steps, they are checked every ``period`` steps. Response sections a trigger reads (``sections``) are added to the projection of the request when the trigger is registered.
+
+Example:
+    Wake up a ramp controller when the entry queue grows ::
+
+    >>> simulator.add_trigger(EntryQueueAbove("Ext_In", 5), controller)
+    >>> simulator.run_triggered()
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import abc
+from math import ceil
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.exceptions import SymupyError
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+
+class Trigger(metaclass=abc.ABCMeta):
+    """ Base trigger, checked every ``period`` steps.
+
+        Args:
+            period (int): steps between checks
+            once (bool): remove the trigger after it fires
+    """
+
+    # INST sections read by ``check``
+    sections = ()
+
+    def __init__(self, period: int = 1, once: bool = False):
+        self.period = max(1, int(period))
+        self.once = once
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(period={self.period})"
+
+    def next_step(self, step: int, time_step: float) -> int:
+        """ First step from ``step`` on at which the trigger may fire
+
+            Args:
+                step (int): current step
+                time_step (float): simulation time step in seconds
+
+            Returns:
+                step (int): step requiring a full response
+        """
+        return -(-step // self.period) * self.period
+
+    @abc.abstractmethod
+    def check(self, request) -> bool:
+        """ True if the trigger fires on the current response
+
+            Args:
+                request (SimulatorRequest): request holding the full response
+        """
+        pass
+
+
+class TimeReached(Trigger):
+    """ Fires once when the time of the response reaches ``time``. Step
+        ``k`` ends at time ``(k + 1)`` times time step.
+
+        Args:
+            time (float): simulation time in seconds
+    """
+
+    def __init__(self, time: float):
+        super().__init__(once=True)
+        self.time = time
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.time})"
+
+    def next_step(self, step: int, time_step: float) -> int:
+        return max(step, ceil(self.time / time_step) - 1)
+
+    def check(self, request) -> bool:
+        return request.current_time >= self.time
+
+
+class VehicleEntersLink(Trigger):
+    """ Fires when a vehicle that was not on ``link`` at the previous check
+        is on it, optionally restricted to a vehicle type. The ``link`` and
+        ``vehtype`` fields are decoded even outside the projection.
+
+        Args:
+            link (str): link name
+            vehtype (str): vehicle type, defaults to any
+            period (int): steps between checks
+    """
+
+    def __init__(self, link: str, vehtype: str = None, period: int = 1):
+        super().__init__(period)
+        self.link = link
+        self.vehtype = vehtype
+        self._present = frozenset()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.link}, {self.vehtype})"
+
+    def check(self, request) -> bool:
+        cols = request.get_vehicle_columns(("vehid", "link", "vehtype"))
+        mask = cols.link.codes == cols.link.code(self.link)
+        if self.vehtype is not None:
+            mask &= cols.vehtype.codes == cols.vehtype.code(self.vehtype)
+        present = frozenset(cols.vehid[mask].tolist())
+        entered = present - self._present
+        self._present = present
+        return bool(entered)
+
+
+class EntryQueueAbove(Trigger):
+    """ Fires while more than ``size`` vehicles wait at an entry. Requires
+        the ``ENTREES`` section, added to the projection on registration.
+
+        Args:
+            endpoint (str): network entry
+            size (int): queue length threshold
+            period (int): steps between checks
+    """
+
+    sections = ("ENTREES",)
+
+    def __init__(self, endpoint: str, size: int, period: int = 1):
+        super().__init__(period)
+        self.endpoint = endpoint
+        self.size = size
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.endpoint}, {self.size})"
+
+    def check(self, request) -> bool:
+        if request.sections is not None and "ENTREES" not in request.sections:
+            raise SymupyError("Projection excludes the ENTREES section", self)
+        return request.get_entry_queues().get(self.endpoint, 0) > self.size
+
+
+class VehicleAppears(Trigger):
+    """ Fires once when vehicle ``vehid`` is in the network
+
+        Args:
+            vehid (int): vehicle id
+            period (int): steps between checks
+    """
+
+    def __init__(self, vehid: int, period: int = 1):
+        super().__init__(period, once=True)
+        self.vehid = vehid
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.vehid})"
+
+    def check(self, request) -> bool:
+        return request.is_vehicle_in_network(self.vehid)
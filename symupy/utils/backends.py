@@ -0,0 +1,357 @@
+"""
+Parser Backends
+===============
+This module implements interchangeable backends to parse the simulator response. All backends deliver the same data: the ``INST`` attributes, the ``TRAJ`` records as dictionaries with XML attribute keys (``@abs``, ``@acc``, ...) and, on request, the full document in the ``xmltodict`` layout.
+
+    ============================  =================================
+    **Backend**                   **Description**
+    ----------------------------  ---------------------------------
+    ``xmltodict``                   Full document via ``xmltodict``
+    ``lxml``                        ``libxml2`` tree via ``lxml``
+    ``expat``                       Raw ``expat`` callbacks on ``TRAJ``
+    ``scanner``                     Byte scanner for the ``TRAJ`` layout
+    ============================  =================================
+
+The fastest backend depends on the response size. ``calibrate`` measures all backends on synthetic responses and ``select_backend`` picks one for a given size.
+
+Example:
+    Parse trajectories with a specific backend ::
+
+    >>> header, trajs = BACKENDS["scanner"].parse_trajs(one_vehicle_xml)
+    >>> trajs[0]["@vit"]
+    '25.00'
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import re
+from bisect import bisect_left
+from html import unescape
+from time import perf_counter
+from xml.parsers import expat
+from xml.parsers.expat import ExpatError
+from xmltodict import parse
+from lxml import etree
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+import symupy.utils.constants as ct
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+_INST_OPEN = re.compile(rb"<INST[^>]*>")
+_SECTION_TAGS = {
+    name: (
+        re.compile(rb"<%s(/?)>" % name.encode()),
+        re.compile(rb"</%s>" % name.encode()),
+    )
+    for name in ct.INST_SECTIONS
+}
+
+# Attribute name -> XML attribute key as produced by xmltodict
+_KEYS = {key[1:]: key for key in ct.FIELD_DATA}
+
+
+def _key(name: str) -> str:
+    return _KEYS.get(name) or "@" + name
+
+
+def iter_sections(buffer, sections: tuple):
+    """ Split a response into chunks keeping only the requested sections of
+        ``INST``. Chunks are slices of a view over the buffer, nothing is
+        copied. The chunks form a valid document that can be fed to the
+        parser.
+
+        Args:
+            buffer (bytes-like): simulator response
+            sections (tuple): section names to keep e.g. ``("TRAJS",)``
+
+        Yields:
+            chunk (bytes-like): consecutive pieces of the reduced document
+    """
+    head = _INST_OPEN.search(buffer)
+    if head is None:
+        yield buffer
+        return
+    view = memoryview(buffer).cast("B")
+    yield view[: head.end()]
+    spans = []
+    for name in sections:
+        open_tag, close_tag = _SECTION_TAGS[name]
+        start = open_tag.search(buffer, head.end())
+        if start is None:
+            continue
+        if start.group(1):
+            spans.append((start.start(), start.end()))
+            continue
+        close = close_tag.search(buffer, start.end())
+        if close is not None:
+            spans.append((start.start(), close.end()))
+    for start, end in sorted(spans):
+        yield view[start:end]
+    yield b"</INST>"
+
+
+class ParserBackend(object):
+    """ Base parser backend, parses with ``xmltodict``.
+
+        Backends that can extract trajectories without building the full
+        document set ``scans_trajs`` and override ``parse_trajs``.
+    """
+
+    name = "xmltodict"
+    scans_trajs = False
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}()"
+
+    def parse(self, buffer, sections: tuple = None) -> dict:
+        """ Parse the full document
+
+            Args:
+                buffer (bytes-like): simulator response
+                sections (tuple): ``INST`` sections to keep, defaults to all
+
+            Returns:
+                simdata (dict): document in the ``xmltodict`` layout, ``{}`` if the buffer cannot be parsed
+        """
+        if sections is not None:
+            buffer = iter_sections(buffer, sections)
+        try:
+            return parse(buffer)
+        except (ExpatError, AttributeError):
+            return {}
+
+    def parse_trajs(self, buffer) -> tuple:
+        """ Parse the ``INST`` attributes and the ``TRAJ`` records
+
+            Args:
+                buffer (bytes-like): simulator response
+
+            Returns:
+                header (dict): ``INST`` attributes e.g. ``{"@val": "1.00"}``
+                trajs (tuple): ``TRAJ`` records with XML attribute keys
+        """
+        inst = self.parse(buffer, ("TRAJS",)).get("INST") or {}
+        header = {k: v for k, v in inst.items() if k.startswith("@")}
+        veh_data = inst.get("TRAJS")
+        if veh_data is None:
+            return header, ()
+        if isinstance(veh_data["TRAJ"], list):
+            return header, tuple(veh_data["TRAJ"])
+        return header, (veh_data["TRAJ"],)
+
+
+class LxmlBackend(ParserBackend):
+    """ Backend building a ``libxml2`` tree through ``lxml``"""
+
+    name = "lxml"
+    scans_trajs = True
+
+    def parse_trajs(self, buffer) -> tuple:
+        try:
+            root = etree.fromstring(buffer)
+        except TypeError:
+            root = etree.fromstring(bytes(buffer))
+        except etree.XMLSyntaxError:
+            return {}, ()
+        header = {_key(k): v for k, v in root.items()}
+        trajs = root.find("TRAJS")
+        if trajs is None:
+            return header, ()
+        return (
+            header,
+            tuple({_key(k): v for k, v in t.items()} for t in trajs),
+        )
+
+
+class ExpatBackend(ParserBackend):
+    """ Backend collecting ``TRAJ`` attributes from raw ``expat`` callbacks"""
+
+    name = "expat"
+    scans_trajs = True
+
+    def parse_trajs(self, buffer) -> tuple:
+        header = {}
+        trajs = []
+
+        def start(tag, attrs):
+            if tag == "TRAJ":
+                trajs.append({_key(k): v for k, v in attrs.items()})
+            elif tag == "INST":
+                header.update((_key(k), v) for k, v in attrs.items())
+
+        parser = expat.ParserCreate()
+        parser.StartElementHandler = start
+        try:
+            parser.Parse(buffer, True)
+        except (ExpatError, TypeError):
+            return {}, ()
+        return header, tuple(trajs)
+
+
+class ScannerBackend(ParserBackend):
+    """ Byte-level scanner specialized to the ``TRAJ`` attribute layout
+        emitted by SymuVia. Records that do not follow the layout are read
+        with a generic attribute scan. The response is scanned in place,
+        only attribute values are decoded.
+    """
+
+    name = "scanner"
+    scans_trajs = True
+
+    _INST_OPEN = re.compile(rb"<INST([^>]*)>")
+    _TRAJS_OPEN = re.compile(rb"<TRAJS>")
+    _TRAJS_CLOSE = re.compile(rb"</TRAJS>")
+    _ATTRIBUTE = re.compile(rb'(\w+)="([^"]*)"')
+    _TRAJ = re.compile(rb"<TRAJ\s([^>]*?)/?>")
+    _TRAJ_START = re.compile(rb"<TRAJ\s")
+    _ENTITY = re.compile(rb"&")
+    _LAYOUT = re.compile(
+        rb'<TRAJ abs="([^"]*)" acc="([^"]*)" dst="([^"]*)"'
+        rb'(?: etat_pilotage="([^"]*)")? id="([^"]*)" ord="([^"]*)"'
+        rb' tron="([^"]*)" type="([^"]*)" vit="([^"]*)" voie="([^"]*)"'
+        rb' z="([^"]*)"\s*/>'
+    )
+    _LAYOUT_KEYS = (
+        "@abs",
+        "@acc",
+        "@dst",
+        "@etat_pilotage",
+        "@id",
+        "@ord",
+        "@tron",
+        "@type",
+        "@vit",
+        "@voie",
+        "@z",
+    )
+
+    @staticmethod
+    def _unescaped(value: bytes) -> str:
+        return unescape(value.decode("UTF8"))
+
+    def parse_trajs(self, buffer) -> tuple:
+        try:
+            head = self._INST_OPEN.search(buffer)
+        except TypeError:
+            return {}, ()
+        if head is None:
+            return {}, ()
+        text = self._unescaped
+        header = {
+            _key(k.decode("UTF8")): text(v)
+            for k, v in self._ATTRIBUTE.findall(head.group(1))
+        }
+        start = self._TRAJS_OPEN.search(buffer, head.end())
+        if start is None:
+            return header, ()
+        end = self._TRAJS_CLOSE.search(buffer, start.end())
+        if end is None:
+            # Incomplete response, as for the other backends
+            return {}, ()
+        start, end = start.end(), end.start()
+        if self._ENTITY.search(buffer, start, end) is None:
+            text = bytes.decode
+        keys = self._LAYOUT_KEYS
+        trajs = [
+            {k: text(v) for k, v in zip(keys, m.groups()) if v is not None}
+            for m in self._LAYOUT.finditer(buffer, start, end)
+        ]
+        if len(trajs) != len(self._TRAJ_START.findall(buffer, start, end)):
+            trajs = [
+                {
+                    _key(k.decode("UTF8")): text(v)
+                    for k, v in self._ATTRIBUTE.findall(attrs)
+                }
+                for attrs in self._TRAJ.findall(buffer, start, end)
+            ]
+        return header, tuple(trajs)
+
+
+BACKENDS = {
+    backend.name: backend
+    for backend in (
+        ParserBackend(),
+        LxmlBackend(),
+        ExpatBackend(),
+        ScannerBackend(),
+    )
+}
+
+# Calibration table: response sizes (bytes) and the backend chosen for each
+_CALIBRATION = {}
+
+
+def synthetic_response(nveh: int) -> bytes:
+    """ Build a response with ``nveh`` vehicles for calibration purposes
+
+        Args:
+            nveh (int): number of vehicles
+
+        Returns:
+            response (bytes): XML response in the SymuVia layout
+    """
+    trajs = "".join(
+        f'<TRAJ abs="{i:.2f}" acc="0.00" dst="{i:.2f}" id="{i}" ord="0.00" '
+        f'tron="Zone_{i % 10:03d}" type="VL" vit="25.00" voie="1" z="0.00"/>'
+        for i in range(nveh)
+    )
+    return (
+        f'<INST nbVeh="{nveh}" val="1.00"><CREATIONS/><SORTIES/>'
+        f"<TRAJS>{trajs}</TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/>"
+        f"<ENTREES/><REGULATIONS/></INST>"
+    ).encode("UTF8")
+
+
+def calibrate(
+    fleet_sizes: tuple = (10, 100, 1000, 5000), repeat: int = 3
+) -> dict:
+    """ Measure all backends on synthetic responses and store the fastest
+        backend per response size. The result is used by ``select_backend``.
+
+        Args:
+            fleet_sizes (tuple): number of vehicles of the sample responses
+            repeat (int): runs per backend and sample, the best run is kept
+
+        Returns:
+            table (dict): response size in bytes -> backend name
+    """
+    table = {}
+    for nveh in fleet_sizes:
+        sample = synthetic_response(nveh)
+        timings = {}
+        for name, backend in BACKENDS.items():
+            best = float("inf")
+            for _ in range(repeat):
+                t0 = perf_counter()
+                backend.parse_trajs(sample)
+                best = min(best, perf_counter() - t0)
+            timings[name] = best
+        table[len(sample)] = min(timings, key=timings.get)
+    _CALIBRATION.clear()
+    _CALIBRATION.update(sorted(table.items()))
+    return dict(_CALIBRATION)
+
+
+def select_backend(size: int) -> ParserBackend:
+    """ Backend for a response of a given size. Calibration runs on the
+        first call.
+
+        Args:
+            size (int): response size in bytes
+
+        Returns:
+            backend (ParserBackend): fastest backend measured for the closest larger calibrated size
+    """
+    if not _CALIBRATION:
+        calibrate()
+    sizes = tuple(_CALIBRATION)
+    pos = min(bisect_left(sizes, size), len(sizes) - 1)
+    return BACKENDS[_CALIBRATION[sizes[pos]]]
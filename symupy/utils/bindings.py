@@ -0,0 +1,127 @@
+"""
+Library Bindings
+================
+This module declares the prototypes of the SymuVia functions called by ``symupy``. Each library is loaded once per process and its prototypes are declared once. Identifiers sent to the library are encoded once and reused.
+
+Functions called per step or per vehicle (``HOT_PATH``) only get their return type: ``ctypes`` passes ``int`` and ``bytes`` arguments faster than it converts them through declared argument types (see ``test_binding_overhead`` in ``tests/test_bindings.py``). Their callers pass ``int``, encoded identifiers and ``c_double`` values.
+
+Example:
+    Declare the prototypes of a library ::
+
+    >>> lib = load_library(ct.DEFAULT_PATH_SYMUVIA)
+    >>> encoded = EncodedStrings()
+    >>> lib.SymDriveVehicleEx(0, encoded["Zone_001"], 1, c_double(20.0), 1)
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from ctypes import cdll, c_bool, c_char_p, c_double, c_int, POINTER
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+# Function name -> (restype, argtypes)
+PROTOTYPES = {
+    "SymLoadNetworkEx": (c_int, (c_char_p,)),
+    "SymRunEx": (c_int, (c_char_p,)),
+    "SymRunNextStepEx": (c_bool, (c_char_p, c_bool, POINTER(c_int))),
+    "SymRunNextStepLiteEx": (c_bool, (c_bool, POINTER(c_int))),
+    "SymCreateVehicleEx": (
+        c_int,
+        (c_char_p, c_char_p, c_char_p, c_int, c_double),
+    ),
+    "SymCreateVehicleWithRouteEx": (
+        c_int,
+        (c_char_p, c_char_p, c_char_p, c_int, c_double, c_char_p),
+    ),
+    "SymDriveVehicleEx": (c_int, (c_int, c_char_p, c_int, c_double, c_bool)),
+    "SymGetTotalTravelTimeEx": (c_double, (c_char_p,)),
+    "SymGetTotalTravelDistanceEx": (c_double, (c_char_p,)),
+    "SymAddControlZoneEx": (c_int, (c_int, c_double, c_double, c_char_p)),
+    "SymModifyControlZoneEx": (c_int, (c_int, c_int, c_double)),
+    "SymApplyControlZonesEx": (c_int, (c_int,)),
+    "SymUnloadCurrentNetworkEx": (c_int, ()),
+}
+
+# Functions called per step or per vehicle, arguments are not declared
+HOT_PATH = frozenset(
+    (
+        "SymRunNextStepEx",
+        "SymRunNextStepLiteEx",
+        "SymCreateVehicleEx",
+        "SymCreateVehicleWithRouteEx",
+        "SymDriveVehicleEx",
+    )
+)
+
+# Attribute flagging libraries with declared prototypes
+_DECLARED = "_symupy_declared"
+
+# Library path -> loaded library
+_libraries = {}
+
+
+def declare(library):
+    """ Declare the prototypes of the SymuVia functions on a loaded library,
+        only the return type for ``HOT_PATH`` functions. Functions missing
+        from the library are skipped. Declaring twice the same library has no
+        effect.
+
+        Args:
+            library (CDLL): loaded SymuVia library
+
+        Returns:
+            library (CDLL): same library
+    """
+    if getattr(library, _DECLARED, False):
+        return library
+    for name, (restype, argtypes) in PROTOTYPES.items():
+        try:
+            function = getattr(library, name)
+        except AttributeError:
+            continue
+        function.restype = restype
+        if name not in HOT_PATH:
+            function.argtypes = argtypes
+    setattr(library, _DECLARED, True)
+    return library
+
+
+def load_library(path: str):
+    """ Load a SymuVia library with declared prototypes. The library is
+        loaded once per process, later calls return the same handle.
+
+        Args:
+            path (str): path to the shared library
+
+        Returns:
+            library (CDLL): loaded library
+
+        Raises:
+            OSError: the library cannot be loaded
+    """
+    try:
+        return _libraries[path]
+    except KeyError:
+        pass
+    library = _libraries[path] = declare(cdll.LoadLibrary(path))
+    return library
+
+
+class EncodedStrings(dict):
+    """ UTF-8 encoded identifiers, each identifier is encoded on first use
+
+        Example:
+            Encoded link id ::
+
+            >>> encoded = EncodedStrings()
+            >>> encoded["Zone_001"]
+            b'Zone_001'
+    """
+
+    def __missing__(self, key: str) -> bytes:
+        value = self[key] = key.encode("UTF8")
+        return value
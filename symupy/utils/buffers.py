@@ -0,0 +1,216 @@
+"""
+Response Buffers
+================
+This module handles the memory where the simulator writes its step responses. Responses are read in place through bounded views. ``ResponseBuffer`` sizes its memory to the responses it receives: it grows ahead of time when a response uses most of the capacity and shrinks back after a sustained period of low usage.
+
+Example:
+    Run a step and read the response ::
+
+    >>> buffer = ResponseBuffer()
+    >>> lib.SymRunNextStepEx(buffer.raw, write_xml, byref(b_end))
+    >>> request.query = buffer.view()
+    >>> buffer.stats.high_water
+    4096
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+from ctypes import (
+    create_string_buffer,
+    addressof,
+    memmove,
+    CDLL,
+    cdll,
+    c_char_p,
+    c_int,
+    c_size_t,
+    c_void_p,
+)
+from typing import NamedTuple
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.exceptions import SymupyBufferError
+import symupy.utils.constants as ct
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+# C runtime functions to bound buffer views without copying
+_libc = CDLL(None) if os.name == "posix" else cdll.msvcrt
+_strlen = _libc.strlen
+_strlen.argtypes = (c_char_p,)
+_strlen.restype = c_size_t
+_memchr = _libc.memchr
+_memchr.argtypes = (c_void_p, c_int, c_size_t)
+_memchr.restype = c_void_p
+
+def buffer_view(buffer) -> memoryview:
+    """ View over a NUL terminated ``ctypes`` string buffer, bounded at the
+        terminator. No data is copied: the view reads the buffer memory in
+        place and is only valid until the buffer is written again.
+
+        Args:
+            buffer (c_char_Array): buffer created via ``create_string_buffer``
+
+        Returns:
+            view (memoryview): bytes of the response
+
+        Example:
+            Assign the simulator response to a request without copies ::
+
+            >>> request.query = buffer_view(simulator.buffer_string)
+    """
+    return memoryview(buffer).cast("B")[: _strlen(buffer)]
+
+
+class BufferStats(NamedTuple):
+    """ Usage statistics of a ``ResponseBuffer``
+
+        ============================  =================================
+        **Variable**                  **Description**
+        ----------------------------  ---------------------------------
+        ``size``                        Current capacity in bytes
+        ``used``                        Size of the last response
+        ``high_water``                  Largest response received
+        ``steps``                       Responses received
+        ``resizes``                     Number of reallocations
+        ``truncations``                 Responses that did not fit
+        ============================  =================================
+    """
+
+    size: int
+    used: int
+    high_water: int
+    steps: int
+    resizes: int
+    truncations: int
+
+
+class ResponseBuffer(object):
+    """ Memory where the simulator writes a step response.
+
+        After each response the capacity is adapted: when a response uses
+        more than ``headroom`` of the buffer, the buffer grows by ``growth``
+        so that the next response fits. After ``shrink_after`` consecutive
+        responses that would still fit with margin in a buffer ``growth``
+        times smaller, the buffer shrinks. The size stays within
+        ``[min_size, max_size]``.
+
+        Shrinking below the initial size is opt-in through ``min_size``: the
+        simulator writes responses without knowing the buffer length, so a
+        large response following a shrink may overflow a smaller buffer.
+
+        Args:
+            size (int): initial size in bytes
+            min_size (int): minimum size in bytes, defaults to ``size``
+            max_size (int): maximum size in bytes
+            growth (int): resize factor
+            headroom (float): fraction of the capacity a response may use before growing
+            shrink_after (int): consecutive low usage responses before shrinking
+    """
+
+    def __init__(
+        self,
+        size: int = ct.BUFFER_STRING,
+        min_size: int = None,
+        max_size: int = ct.BUFFER_MAX,
+        growth: int = ct.BUFFER_GROWTH,
+        headroom: float = ct.BUFFER_HEADROOM,
+        shrink_after: int = ct.BUFFER_SHRINK_STEPS,
+    ):
+        self.min_size = size if min_size is None else min(min_size, size)
+        self.max_size = max(max_size, size)
+        self.growth = growth
+        self.headroom = headroom
+        self.shrink_after = shrink_after
+        self._raw = create_string_buffer(size)
+        self._used = 0
+        self._high_water = 0
+        self._steps = 0
+        self._resizes = 0
+        self._truncations = 0
+        self._low_steps = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.size})"
+
+    def __len__(self):
+        return len(self._raw)
+
+    @property
+    def raw(self):
+        """Memory handed to the simulator (``c_char_Array``)"""
+        return self._raw
+
+    @property
+    def size(self) -> int:
+        """Current capacity in bytes"""
+        return len(self._raw)
+
+    @property
+    def stats(self) -> BufferStats:
+        """Usage statistics, see ``BufferStats``"""
+        return BufferStats(
+            self.size,
+            self._used,
+            self._high_water,
+            self._steps,
+            self._resizes,
+            self._truncations,
+        )
+
+    def _resize(self, size: int) -> None:
+        size = max(self.min_size, min(self.max_size, size))
+        if size == self.size:
+            return
+        # Keep the last response readable in the new memory
+        raw = create_string_buffer(size)
+        memmove(raw, self._raw, min(self._used, size - 1))
+        self._raw = raw
+        self._resizes += 1
+        self._low_steps = 0
+
+    def _adapt(self, used: int) -> None:
+        size = self.size
+        if used > self.headroom * size:
+            while used > self.headroom * size and size < self.max_size:
+                size *= self.growth
+            self._resize(size)
+        elif used <= self.headroom * size / self.growth ** 2:
+            self._low_steps += 1
+            if self._low_steps >= self.shrink_after:
+                self._resize(size // self.growth)
+        else:
+            self._low_steps = 0
+
+    def view(self) -> memoryview:
+        """ Bounded view over the response just written by the simulator.
+            Records the usage and adapts the capacity for the next response.
+            The view stays valid until the memory is written again.
+
+            Returns:
+                view (memoryview): bytes of the response
+
+            Raises:
+                SymupyBufferError: the response has no terminator within the capacity, the buffer grows before raising
+        """
+        size = self.size
+        end = _memchr(self._raw, 0, size)
+        used = size if end is None else end - addressof(self._raw)
+        view = memoryview(self._raw).cast("B")[:used]
+        self._steps += 1
+        self._used = used
+        self._high_water = max(self._high_water, used)
+        if end is None:
+            self._truncations += 1
+            self._resize(size * self.growth)
+            raise SymupyBufferError("Simulator response truncated", size)
+        self._adapt(used)
+        return view
@@ -0,0 +1,153 @@
+"""
+Content Cache
+=============
+This module implements a file cache keyed by the content of an input file. Values extracted from a file are stored once and loaded back by any process opening a file with the same content, regardless of its path or modification time.
+
+Entries are pickles, loading them runs code from the cache directory. There is no default directory: callers pass a directory they own.
+
+Example:
+    Cache data extracted from a scenario ::
+
+    >>> key = content_hash("scenario.xml")
+    >>> data = load_cached(key, "index", cache_dir)
+    >>> if data is None:
+    ...     data = extract("scenario.xml")
+    ...     store_cached(key, "index", data, cache_dir)
+
+Kinds may end with a version number (e.g. ``index3``) to be bumped when the stored data changes. The first entry stored for a kind in a process removes the entries of the other versions of the kind, so that entries that can no longer be read do not pile up.
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import pickle
+import re
+from hashlib import sha256
+from tempfile import NamedTemporaryFile
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+_CHUNK = 1 << 20
+
+# Kind name and version e.g. ("index", "3")
+_KIND = re.compile(r"(.*?)(\d*)")
+
+# (kind, cache directory) pruned by this process
+_pruned = set()
+
+
+def content_hash(file_name: str) -> str:
+    """ SHA-256 digest of a file content
+
+        Args:
+            file_name (str): path to the file
+
+        Returns:
+            digest (str): hexadecimal digest
+    """
+    digest = sha256()
+    with open(file_name, "rb") as f:
+        for chunk in iter(lambda: f.read(_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_path(key: str, kind: str, cache_dir: str) -> str:
+    """ Location of a cache entry
+
+        Args:
+            key (str): content hash
+            kind (str): kind of data stored e.g. ``index``
+            cache_dir (str): cache directory
+
+        Returns:
+            path (str): path of the entry
+    """
+    return os.path.join(cache_dir, f"{key}.{kind}.pickle")
+
+
+def load_cached(key: str, kind: str, cache_dir: str):
+    """ Load a cache entry
+
+        Args:
+            key (str): content hash
+            kind (str): kind of data stored e.g. ``index``
+            cache_dir (str): cache directory
+
+        Returns:
+            value (object): cached value, ``None`` when missing or unreadable
+    """
+    try:
+        with open(cache_path(key, kind, cache_dir), "rb") as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+
+
+def prune_cached(kind: str, cache_dir: str) -> int:
+    """ Remove the entries of the other versions of a kind, e.g. ``index1``
+        and ``index2`` entries for ``index3``
+
+        Args:
+            kind (str): current kind e.g. ``index3``
+            cache_dir (str): cache directory
+
+        Returns:
+            removed (int): number of entries removed
+    """
+    name = _KIND.fullmatch(kind).group(1)
+    versions = re.compile(rf"[^.]+\.{re.escape(name)}\d*\.pickle")
+    current = f".{kind}.pickle"
+    removed = 0
+    try:
+        entries = os.listdir(cache_dir)
+    except OSError:
+        return removed
+    for entry in entries:
+        if not versions.fullmatch(entry) or entry.endswith(current):
+            continue
+        try:
+            os.unlink(os.path.join(cache_dir, entry))
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+def store_cached(key: str, kind: str, value, cache_dir: str) -> bool:
+    """ Store a cache entry. The entry is written to a temporary file and
+        moved in place so that concurrent readers never see partial entries.
+        Entries of the other versions of the kind are removed once per
+        process.
+
+        Args:
+            key (str): content hash
+            kind (str): kind of data stored e.g. ``index``
+            value (object): picklable value
+            cache_dir (str): cache directory
+
+        Returns:
+            stored (bool): False if the cache could not be written
+    """
+    path = cache_path(key, kind, cache_dir)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with NamedTemporaryFile(
+            dir=os.path.dirname(path), suffix=".tmp", delete=False
+        ) as f:
+            try:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            except BaseException:
+                os.unlink(f.name)
+                raise
+        os.replace(f.name, path)
+    except OSError:
+        return False
+    if (kind, cache_dir) not in _pruned:
+        _pruned.add((kind, cache_dir))
+        prune_cached(kind, cache_dir)
+    return True
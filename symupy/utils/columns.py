@@ -0,0 +1,244 @@
+"""
+Columnar Decoder
+================
+This module decodes the trajectory block of a simulator response into a struct of arrays. Each vehicle attribute is stored as a single typed column following ``FIELD_FORMATAGG`` so that fleet-wide computations can be vectorized.
+
+Example:
+    Decode a list of ``TRAJ`` records as obtained from the parsed response ::
+
+    >>> cols = decode_columns(trajs)
+    >>> cols.speed.mean()
+    >>> cols.link.values  # link labels per vehicle
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from typing import NamedTuple, Sequence
+import numpy as np
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+import symupy.utils.constants as ct
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+# Column name -> attribute key in the XML response
+FIELD_KEYS = {name: key for key, name in ct.FIELD_DATA.items()}
+
+
+class Categorical(NamedTuple):
+    """ Categorical column: integer ``codes`` pointing into ``categories``
+
+        Example:
+            Links are stored as codes ::
+
+            >>> cat = Categorical(np.array([1, 0, 1]), ("Zone_001", "Zone_002"))
+            >>> cat.values
+            array(['Zone_002', 'Zone_001', 'Zone_002'], dtype='<U8')
+    """
+
+    codes: np.ndarray
+    categories: tuple
+
+    @property
+    def values(self) -> np.ndarray:
+        """Labels decoded for each row"""
+        if not self.categories:
+            return np.array([], dtype=str)
+        return np.asarray(self.categories)[self.codes]
+
+    def code(self, label: str) -> int:
+        """ Code associated to a label, -1 if the label is not present
+
+            Args:
+                label (str): category label e.g. link name
+        """
+        try:
+            return self.categories.index(label)
+        except ValueError:
+            return -1
+
+
+class VehicleColumns(NamedTuple):
+    """ Struct of arrays with the vehicle data of a single step. Rows are
+        aligned across columns and follow the order of the response.
+
+        ============================  =================================
+        **Variable**                  **Type**
+        ----------------------------  ---------------------------------
+        ``abscissa``                    ``float64`` array
+        ``acceleration``                ``float64`` array
+        ``distance``                    ``float64`` array
+        ``driven``                      ``bool`` array
+        ``elevation``                   ``float64`` array
+        ``lane``                        ``int32`` array
+        ``link``                        ``Categorical``
+        ``ordinate``                    ``float64`` array
+        ``speed``                       ``float64`` array
+        ``vehid``                       ``int32`` array
+        ``vehtype``                     ``Categorical``
+        ============================  =================================
+    """
+
+    abscissa: np.ndarray
+    acceleration: np.ndarray
+    distance: np.ndarray
+    driven: np.ndarray
+    elevation: np.ndarray
+    lane: np.ndarray
+    link: Categorical
+    ordinate: np.ndarray
+    speed: np.ndarray
+    vehid: np.ndarray
+    vehtype: Categorical
+
+    @property
+    def size(self) -> int:
+        """Number of vehicles (rows)"""
+        return len(self.vehid)
+
+
+def decode_column(name: str, values: Sequence):
+    """ Decode a single column according to ``FIELD_FORMATAGG``
+
+        Args:
+            name (str): column name e.g. ``speed``
+            values (sequence): raw values as received from the simulator
+
+        Returns:
+            column (ndarray, Categorical): typed read-only column
+    """
+    agg, fmt = ct.FIELD_FORMATAGG[name]
+    if agg is np.unique:
+        categories, codes = np.unique(
+            np.asarray(values, dtype=str), return_inverse=True
+        )
+        codes = codes.astype(fmt)
+        codes.setflags(write=False)
+        return Categorical(codes, tuple(categories.tolist()))
+    column = agg(values, dtype=fmt)
+    column.setflags(write=False)
+    return column
+
+
+def decode_columns(
+    trajs: Sequence[dict], fields: tuple = None
+) -> VehicleColumns:
+    """ Decode ``TRAJ`` records into a ``VehicleColumns`` struct of arrays
+
+        Args:
+            trajs (sequence): ``TRAJ`` records as parsed from the response (attribute keys ``@abs``, ``@acc``, ...)
+            fields (tuple): columns to decode, the others are set to ``None``. Defaults to all
+
+        Returns:
+            columns (VehicleColumns): typed columns for all vehicles
+    """
+    if fields is None:
+        fields = VehicleColumns._fields
+    return VehicleColumns(
+        **{
+            name: decode_column(
+                name, [t.get(FIELD_KEYS[name]) for t in trajs]
+            )
+            if name in fields
+            else None
+            for name in VehicleColumns._fields
+        }
+    )
+
+
+class NeighbourColumns(NamedTuple):
+    """ Leader and follower of every vehicle on its (link, lane). Rows are
+        aligned with ``VehicleColumns``.
+
+        ============================  =================================
+        **Variable**                  **Description**
+        ----------------------------  ---------------------------------
+        ``leader``                      Leader id, ``-1`` if none
+        ``follower``                    Follower id, ``-1`` if none
+        ``spacing``                     Leader distance minus own distance, ``nan`` if no leader
+        ``relative_speed``              Leader speed minus own speed, ``nan`` if no leader
+        ============================  =================================
+    """
+
+    leader: np.ndarray
+    follower: np.ndarray
+    spacing: np.ndarray
+    relative_speed: np.ndarray
+
+
+def decode_neighbours(columns: VehicleColumns) -> NeighbourColumns:
+    """ Compute leader, follower, spacing and relative speed for all vehicles 
+        from a single lexicographic sort over (link, lane, distance). The
+        leader is the nearest vehicle strictly downstream and the follower
+        the nearest vehicle strictly upstream, as in ``LaneIndex``: vehicles
+        sharing the same distance are not neighbours of each other. Among
+        tied candidates, the leader is the first one and the follower the
+        last one in response order.
+
+        Args:
+            columns (VehicleColumns): vehicle data of the step
+
+        Returns:
+            neighbours (NeighbourColumns): neighbour data aligned by row
+
+        Example:
+            Vehicles with a short spacing ::
+
+            >>> ngh = decode_neighbours(cols)
+            >>> cols.vehid[ngh.spacing < 10]
+    """
+    n = columns.size
+    order = np.lexsort((columns.distance, columns.lane, columns.link.codes))
+    link = columns.link.codes[order]
+    lane = columns.lane[order]
+    distance = columns.distance[order]
+    # same_group[i]: sorted vehicles i and i+1 share (link, lane)
+    same_group = (link[1:] == link[:-1]) & (lane[1:] == lane[:-1])
+    new_group = np.ones(n, dtype=bool)
+    new_group[1:] = ~same_group
+    group = np.cumsum(new_group)
+    # Runs of sorted vehicles sharing (link, lane, distance)
+    new_run = new_group.copy()
+    new_run[1:] |= distance[1:] != distance[:-1]
+    run_start = np.flatnonzero(new_run)
+    run = np.cumsum(new_run) - 1
+    run_end = np.append(run_start[1:], n)
+    # Leader: first vehicle of the next run, follower: last of the previous
+    ahead = run_end[run]
+    behind = run_start[run] - 1
+    has_ahead = ahead < n
+    has_ahead[has_ahead] = group[ahead[has_ahead]] == group[has_ahead]
+    has_behind = behind >= 0
+    has_behind[has_behind] = group[behind[has_behind]] == group[has_behind]
+
+    leader_row = np.full(n, -1, dtype=np.intp)
+    follower_row = np.full(n, -1, dtype=np.intp)
+    leader_row[order[has_ahead]] = order[ahead[has_ahead]]
+    follower_row[order[has_behind]] = order[behind[has_behind]]
+
+    has_leader = leader_row >= 0
+    has_follower = follower_row >= 0
+    leader = np.full(n, -1, dtype=ct.INTFORMAT)
+    follower = np.full(n, -1, dtype=ct.INTFORMAT)
+    spacing = np.full(n, np.nan, dtype=ct.FLOATFORMAT)
+    relative_speed = np.full(n, np.nan, dtype=ct.FLOATFORMAT)
+
+    leader[has_leader] = columns.vehid[leader_row[has_leader]]
+    follower[has_follower] = columns.vehid[follower_row[has_follower]]
+    spacing[has_leader] = (
+        columns.distance[leader_row[has_leader]]
+        - columns.distance[has_leader]
+    )
+    relative_speed[has_leader] = (
+        columns.speed[leader_row[has_leader]] - columns.speed[has_leader]
+    )
+    for column in (leader, follower, spacing, relative_speed):
+        column.setflags(write=False)
+    return NeighbourColumns(leader, follower, spacing, relative_speed)
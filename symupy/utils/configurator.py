@@ -9,7 +9,7 @@
 # STANDARD  IMPORTS
 # ============================================================================
 
-from ctypes import create_string_buffer, c_bool, c_char
+from ctypes import c_bool
 from dataclasses import dataclass
 import click
 
@@ -17,6 +17,7 @@ import click
 # INTERNAL IMPORTS
 # ============================================================================
 
+from symupy.utils.buffers import ResponseBuffer
 from symupy.utils.constants import (
     BUFFER_STRING,
     WRITE_XML,
@@ -24,6 +25,7 @@ from symupy.utils.constants import (
     DEFAULT_PATH_SYMUVIA,
     TOTAL_SIMULATION_STEPS,
     LAUNCH_MODE,
+    PIPELINE,
 )
 
 # ============================================================================
@@ -46,7 +48,10 @@ class Configurator:
                 Absolute path towards the simulator library
 
             bufferSize (int):
-                Size of the buffer for message for data received from simulator
+                Initial size of the buffer for message for data received from simulator. The buffer is owned by the instance and adapts to the size of the responses
+
+            bufferMinSize (int):
+                Size the buffer may shrink to after a period of small responses, e.g. ``65536``. Defaults to ``bufferSize`` (no shrinking below it)
 
             write_xml (bool):
                 Flag to turn on writting the XML output
@@ -60,16 +65,19 @@ class Configurator:
             step_launch_mode (str):
                 Determine to way to launch the ``RunStepEx``. Options ``lite``/``full``
 
+            pipeline (bool):
+                Flag to parse responses in background while the next step is computed
+
         :return: Configurator object with simulation parameters
         :rtype: Configurator
     """
 
-    buffer_string: c_char = create_string_buffer(BUFFER_STRING)
     write_xml: c_bool = c_bool(WRITE_XML)
     trace_flow: bool = TRACE_FLOW
     library_path: str = DEFAULT_PATH_SYMUVIA
     total_steps: int = TOTAL_SIMULATION_STEPS
     step_launch_mode: str = LAUNCH_MODE
+    pipeline: bool = PIPELINE
 
     def __init__(self, **kwargs) -> None:
         """ Configurator class for containing specific simulator parameter
@@ -79,7 +87,10 @@ class Configurator:
                     Absolute path towards the simulator library
 
                 bufferSize (int):
-                    Size of the buffer for message for data received from simulator
+                    Initial size of the buffer for message for data received from simulator. The buffer is owned by the instance and adapts to the size of the responses
+
+                bufferMinSize (int):
+                    Size the buffer may shrink to after a period of small responses, e.g. ``65536``. Defaults to ``bufferSize`` (no shrinking below it)
 
                 write_xml (bool):
                     Flag to turn on writting the XML output
@@ -92,11 +103,23 @@ class Configurator:
 
                 step_launch_mode (str):
                     Determine to way to launch the ``RunStepEx``. Options ``lite``/``full``
+
+                pipeline (bool):
+                    Flag to parse responses in background while the next step is computed
         """
         click.echo("Configurator: Initialization")
+        self.response_buffer = ResponseBuffer(
+            kwargs.pop("bufferSize", BUFFER_STRING),
+            kwargs.pop("bufferMinSize", None),
+        )
         for key, value in kwargs.items():
             setattr(self, key, value)
 
+    @property
+    def buffer_string(self):
+        """Memory where the simulator writes its responses"""
+        return self.response_buffer.raw
+
     def __repr__(self):
         data_dct = ", ".join(f"{k}={v}" for k, v in self.__dict__.items())
         return f"{self.__class__.__name__}({data_dct})"
@@ -14,12 +14,15 @@
      **Variable**                 **Description**
     ----------------------------  ---------------------------------
     ``BUFFER_STRING``              Buffer size
+    ``BUFFER_MAX``                 Maximum adaptive buffer size
     ``DEFAULT_LIB_OSX``            Default OS X library path
     ``DEFAULT_LIB_LINUX``          Default Linux library path
     ``FIELD_DATA``                 Vehicle trajectory data
     ``FIELD_FORMAT``               Trajectory data types
     ``HOUR_FORMAT``                Time format
     ``FIELD_FORMATAGG``            Format aggretations
+    ``INST_SECTIONS``              Sections of a step response
+    ``SECTION_FORMAT``             Response section data types
     ``DCT_SIMULATION_INFO```       XML Simulation information
     ``DCT_EXPORT_INFO``            XML Export information
     ``DCT_TRAFIC_INFO``            XML Traffic information
@@ -38,7 +41,7 @@ import os
 from datetime import date, datetime, timedelta
 import platform
 from decouple import config, UndefinedValueError
-from numpy import array, float64, int32
+from numpy import array, unique, float64, int32, bool_
 from pathlib import Path
 from collections import defaultdict
 
@@ -111,10 +114,27 @@ else:
 # =============================================================================
 
 BUFFER_STRING = 1000000
+BUFFER_MAX = 512000000
+BUFFER_GROWTH = 2
+BUFFER_HEADROOM = 0.5
+BUFFER_SHRINK_STEPS = 100
 WRITE_XML = False
 TRACE_FLOW = False
 LAUNCH_MODE = "lite"
 TOTAL_SIMULATION_STEPS = 0
+PIPELINE = False
+
+INST_SECTIONS = (
+    "CREATIONS",
+    "SORTIES",
+    "TRAJS",
+    "STREAMS",
+    "LINKS",
+    "SGTS",
+    "FEUX",
+    "ENTREES",
+    "REGULATIONS",
+)
 
 FIELD_DATA = {
     "@abs": "abscissa",
@@ -144,20 +164,69 @@ FIELD_FORMAT = {
     "@etat_pilotage": bool,
 }
 
+# Element tag and attribute -> (field, type) for the auxiliary sections
+SECTION_FORMAT = {
+    "CREATIONS": (
+        "CREATION",
+        {
+            "@id": ("vehid", int),
+            "@type": ("vehtype", str),
+            "@entree": ("origin", str),
+            "@sortie": ("destination", str),
+        },
+    ),
+    "SORTIES": (
+        "SORTIE",
+        {
+            "@id": ("vehid", int),
+            "@type": ("vehtype", str),
+            "@entree": ("origin", str),
+            "@sortie": ("destination", str),
+        },
+    ),
+    "ENTREES": (
+        "ENTREE",
+        {"@id": ("endpoint", str), "@nb_veh_en_attente": ("queue", int)},
+    ),
+    "FEUX": (
+        "FEU",
+        {
+            "@ctrl_feu": ("controller", str),
+            "@troncon_entree": ("link_in", str),
+            "@troncon_sortie": ("link_out", str),
+            "@etat": ("state", str),
+        },
+    ),
+    "LINKS": (
+        "LINK",
+        {
+            "@id": ("link", str),
+            "@nb_veh": ("count", int),
+            "@conc": ("density", float),
+            "@debit": ("flow", float),
+            "@vit": ("speed", float),
+        },
+    ),
+}
+
 FLOATFORMAT = float64
 INTFORMAT = int32
+BOOLFORMAT = bool_
 
+# Aggregation per field: ``array`` builds a typed column, ``unique`` encodes
+# the field as categorical codes of the given type
 FIELD_FORMATAGG = {
-    "abscisa": (array, FLOATFORMAT),
+    "abscissa": (array, FLOATFORMAT),
     "acceleration": (array, FLOATFORMAT),
     "distance": (array, FLOATFORMAT),
     "vehid": (array, INTFORMAT),
     "ordinate": (array, FLOATFORMAT),
-    "link": (list, None),
-    "vehtype": (list, None),
+    "link": (unique, INTFORMAT),
+    "vehtype": (unique, INTFORMAT),
     "speed": (array, FLOATFORMAT),
     "lane": (array, INTFORMAT),
     "elevation": (array, FLOATFORMAT),
+    "driven": (array, BOOLFORMAT),
 }
 
 # =============================================================================
@@ -242,6 +311,7 @@ BUFFER_CONTROL = 10  # Amount of control samples stored in memory
 # =============================================================================
 
 ENGINE_CONSTANT = 0.2
+FREE_FLOW_SPEED = 25  # Speed on links without vehicle types (m/s)
 
 # =============================================================================
 # COMMUNICATION
@@ -0,0 +1,86 @@
+"""
+Record Converters
+=================
+This module generates converters for ``TRAJ`` records. A converter is compiled once per attribute set from ``FIELD_DATA``/``FIELD_FORMAT`` into a single function that builds the formatted vehicle record in one expression. Converters hold no state and can be used from several threads.
+
+Example:
+    Convert a record as received from the simulator ::
+
+    >>> conv = compile_converter(("@id", "@vit", "@etat_pilotage"))
+    >>> conv({"@id": "0", "@vit": "25.00"})
+    {'vehid': 0, 'speed': 25.0, 'driven': False}
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from functools import lru_cache
+from typing import Callable, Sequence
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+import symupy.utils.constants as ct
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+# Attributes that may be absent from a record
+OPTIONAL_KEYS = ("@etat_pilotage",)
+
+
+@lru_cache(maxsize=None)
+def compile_converter(keys: tuple) -> Callable[[dict], dict]:
+    """ Compile a converter for records with the given attribute keys.
+        Attributes unknown to ``FIELD_DATA`` are ignored, optional attributes
+        are read with a default and other missing attributes decode as ``None``.
+
+        Args:
+            keys (tuple): XML attribute keys e.g. ``("@id", "@vit")``
+
+        Returns:
+            converter (callable): function mapping a record to a formatted dictionary
+    """
+    namespace = {}
+    items = []
+    for i, key in enumerate(k for k in keys if k in ct.FIELD_DATA):
+        fmt = f"_fmt{i}"
+        namespace[fmt] = ct.FIELD_FORMAT[key]
+        if key in OPTIONAL_KEYS:
+            value = f"{fmt}(d.get({key!r}))"
+        else:
+            value = f"{fmt}(d[{key!r}]) if {key!r} in d else None"
+        items.append(f"{ct.FIELD_DATA[key]!r}: {value}")
+    source = "def converter(d):\n    return {%s}\n" % ", ".join(items)
+    exec(source, namespace)
+    return namespace["converter"]
+
+
+def convert_records(trajs: Sequence[dict], keys: tuple = None) -> tuple:
+    """ Convert ``TRAJ`` records into formatted vehicle records
+
+        Args:
+            trajs (sequence): records as parsed from the response
+            keys (tuple): attribute keys to convert, defaults to the attributes present in each record
+
+        Returns:
+            records (tuple): formatted dictionaries
+    """
+    if keys is not None:
+        converter = compile_converter(keys)
+        return tuple(converter(d) for d in trajs)
+    converters = {}
+    records = []
+    for d in trajs:
+        signature = tuple(d)
+        converter = converters.get(signature)
+        if converter is None:
+            converter = compile_converter(
+                signature + tuple(k for k in OPTIONAL_KEYS if k not in d)
+            )
+            converters[signature] = converter
+        records.append(converter(d))
+    return tuple(records)
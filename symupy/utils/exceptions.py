@@ -154,3 +154,23 @@ class SymupyDriveVehicleError(SymupyError):
 
     def __repr__(self) -> str:
         return f"SymupyDriveVehicleError({self.get_message},{self._target_dir})"
+
+
+class SymupyBufferError(SymupyError):
+    """
+        Buffer Error exception handler, created for handling responses from
+        the simulator that do not fit in the response buffer
+
+        :return: Buffer Error
+        :rtype: SymupyBufferError
+    """
+
+    def __init__(self, error_message: str, size: int = 0) -> None:
+        super().__init__(error_message, size)
+        self._size = size
+
+    def __str__(self) -> str:
+        return "{0}".format(*self.get_message) + f" size: {self._size}"
+
+    def __repr__(self) -> str:
+        return f"SymupyBufferError({self.get_message},{self._size})"
@@ -10,11 +10,12 @@ The parser object converts a request from the simulator into the correct format
 # STANDARD  IMPORTS
 # ============================================================================
 
-from xmltodict import parse
-from xml.parsers.expat import ExpatError
 from ctypes import create_string_buffer
-from typing import Union, Dict, List, Tuple
+from typing import Union, Dict, List, Tuple, NamedTuple
 from collections import defaultdict
+from types import MappingProxyType
+from bisect import bisect_left, bisect_right
+import numpy as np
 
 # ============================================================================
 # INTERNAL IMPORTS
@@ -22,23 +23,562 @@ from collections import defaultdict
 
 from symupy.logic.publisher import Publisher
 from symupy.components import Vehicle, VehicleList
+from symupy.utils.columns import (
+    FIELD_KEYS,
+    VehicleColumns,
+    NeighbourColumns,
+    decode_columns,
+    decode_neighbours,
+)
+from symupy.utils.sections import SECTION_RECORDS, decode_section
+from symupy.utils.converters import convert_records
+from symupy.utils.buffers import buffer_view
+from symupy.utils.backends import (
+    BACKENDS,
+    iter_sections,
+    ParserBackend,
+    select_backend,
+)
+from symupy.utils.exceptions import SymupyError
 import symupy.utils.constants as ct
 
 # ============================================================================
 # CLASS AND DEFINITIONS
 # ============================================================================
 
+# Vehicle fields needed by the (link, lane) and neighbour queries, decoded
+# even when they are not part of the projection
+LANE_FIELDS = ("vehid", "link", "lane", "distance")
+NEIGHBOUR_FIELDS = LANE_FIELDS + ("speed",)
+
 vtypes = Union[float, int, str]
 vdata = Tuple[vtypes]
 vmaps = Dict[str, vtypes]
 vlists = List[vmaps]
-response = defaultdict(lambda: False)
+
+
+class LaneIndex(object):
+    """ Vehicles traveling on a single (link, lane) sorted by ``distance``.
+
+        Neighbour queries are answered with a bisection over the sorted 
+        distances. Results are returned nearest first. Vehicles at the same
+        distance are neither upstream nor downstream of each other, the same
+        rule as ``decode_neighbours``.
+
+        Args: 
+            entries (iterable): tuples ``(distance, row, vehid)``
+
+        Example: 
+            Leaders of a vehicle within 100 m ::
+
+            >>> lane = LaneIndex(((50.0, 2, 2), (94.12, 1, 1), (125.0, 0, 0)))
+            >>> lane.downstream(2, within=100.0)
+            (1, 0)
+            >>> lane.upstream(1, k=1)
+            (2,)
+    """
+
+    __slots__ = ("distances", "vehids", "rows", "_slots")
+
+    def __init__(self, entries):
+        entries = sorted(entries)
+        self.distances = [e[0] for e in entries]
+        self.rows = tuple(e[1] for e in entries)
+        self.vehids = tuple(e[2] for e in entries)
+        self._slots = {vehid: i for i, vehid in enumerate(self.vehids)}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.vehids})"
+
+    def __len__(self):
+        return len(self.vehids)
+
+    def __contains__(self, vehid: int) -> bool:
+        return vehid in self._slots
+
+    @property
+    def in_response_order(self) -> tuple:
+        """Vehicle ids sorted as received from the simulator"""
+        return tuple(v for _, v in sorted(zip(self.rows, self.vehids)))
+
+    def downstream(self, vehid: int, k: int = None, within: float = None):
+        """ Vehicles strictly downstream of ``vehid``, nearest first
+
+            Args: 
+                vehid (int): reference vehicle id
+                k (int): maximum number of vehicles, defaults to all
+                within (float): maximum distance gap, defaults to no limit
+
+            Returns: 
+                vehids (tuple): downstream vehicle ids
+        """
+        pos = self.distances[self._slots[vehid]]
+        start = bisect_right(self.distances, pos)
+        end = len(self.distances)
+        if within is not None:
+            end = bisect_right(self.distances, pos + within, start)
+        if k is not None:
+            end = min(end, start + k)
+        return self.vehids[start:end]
+
+    def upstream(self, vehid: int, k: int = None, within: float = None):
+        """ Vehicles strictly upstream of ``vehid``, nearest first
+
+            Args: 
+                vehid (int): reference vehicle id
+                k (int): maximum number of vehicles, defaults to all
+                within (float): maximum distance gap, defaults to no limit
+
+            Returns: 
+                vehids (tuple): upstream vehicle ids
+        """
+        pos = self.distances[self._slots[vehid]]
+        end = bisect_left(self.distances, pos)
+        start = 0
+        if within is not None:
+            start = bisect_left(self.distances, pos - within, 0, end)
+        if k is not None:
+            start = max(start, end - k)
+        return self.vehids[start:end][::-1]
+
+
+class StepSnapshot(object):
+    """ Read-only view of a single simulator response. 
+
+        The snapshot is bound to one buffer and parses it at most once, the 
+        first time any of its data is accessed. Derived data (e.g. vehicle 
+        records) is computed from the parsed document and kept for the 
+        lifetime of the snapshot. A new snapshot is created each time the 
+        request receives a new buffer.
+
+        Args: 
+            buffer (bytes): Simulator response for the current step
+            fields (tuple): vehicle fields to decode, defaults to all
+            sections (tuple): ``INST`` sections to parse, defaults to all
+            backend (ParserBackend): parser backend, defaults to ``xmltodict``
+
+        Example: 
+            Parsing is deferred until the data is needed ::
+
+            >>> snap = StepSnapshot(one_vehicle_xml)
+            >>> snap.parse_count
+            0
+            >>> snap.data.get("INST").get("@val")
+            '2.00'
+            >>> snap.vehicles[0]["vehid"]
+            0
+            >>> snap.parse_count
+            1
+    """
+
+    def __init__(
+        self,
+        buffer,
+        fields: tuple = None,
+        sections: tuple = None,
+        backend: ParserBackend = None,
+    ):
+        self._buffer = buffer
+        self._fields = fields
+        self._sections = sections
+        self._backend = BACKENDS["xmltodict"] if backend is None else backend
+        self._data = None
+        self._header = None
+        self._trajs = None
+        self._vehicles = None
+        self._columns = None
+        self._index = None
+        self._locations = None
+        self._lanes = None
+        self._neighbours = None
+        self._records = {}
+        self._scanned = False
+        self.parse_count = 0
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(parsed={self.parse_count > 0})"
+
+    @property
+    def buffer(self):
+        """Raw response the snapshot is bound to"""
+        return self._buffer
+
+    @property
+    def backend(self) -> ParserBackend:
+        """Parser backend used for the response"""
+        return self._backend
+
+    def detach(self) -> None:
+        """ Detach the snapshot from the memory of a buffer view. 
+
+            Must be called before the memory behind a ``buffer_view`` is 
+            overwritten. The response is copied only when it has not been 
+            parsed yet. Once the trajectories are scanned, only the other
+            sections are copied.
+        """
+        if not isinstance(self._buffer, memoryview):
+            return
+        if self._data is not None:
+            self._buffer = b""
+        elif self._trajs is not None:
+            # Trajectories are scanned, only the other sections are copied
+            sections = self._sections or ct.INST_SECTIONS
+            self._buffer = b"".join(
+                iter_sections(
+                    self._buffer, tuple(s for s in sections if s != "TRAJS")
+                )
+            )
+            self._scanned = "TRAJS" in sections
+        else:
+            self._buffer = bytes(self._buffer)
+
+    @property
+    def data(self) -> dict:
+        """ Parsed document, computed on first access only
+
+            Returns:
+                simdata (dict): Simulator data parsed from XML, ``{}`` if the buffer cannot be parsed
+        """
+        if self._data is None:
+            self.parse_count += 1
+            self._data = self._backend.parse(self._buffer, self._sections)
+            inst = self._data.get("INST")
+            if self._scanned and inst is not None:
+                # Scanned trajectories were left out of the detached copy
+                trajs = self._trajs
+                if not trajs:
+                    inst["TRAJS"] = None
+                elif len(trajs) == 1:
+                    inst["TRAJS"] = {"TRAJ": trajs[0]}
+                else:
+                    inst["TRAJS"] = {"TRAJ": list(trajs)}
+        return self._data
+
+    def _scan(self) -> None:
+        self.parse_count += 1
+        self._header, self._trajs = self._backend.parse_trajs(self._buffer)
+
+    @property
+    def header(self) -> dict:
+        """ Attributes of the ``INST`` element e.g. ``{"@val": "2.00"}``
+
+            Returns:
+                header (dict): step attributes with XML attribute keys
+        """
+        if self._header is None:
+            if self._data is None and self._backend.scans_trajs:
+                self._scan()
+            else:
+                inst = self.data.get("INST") or {}
+                self._header = {
+                    k: v for k, v in inst.items() if k.startswith("@")
+                }
+        return self._header
+
+    @property
+    def trajs(self) -> tuple:
+        """ Raw ``TRAJ`` records as parsed from the response
+
+            Returns:
+                trajs (tuple): one dictionary per vehicle with XML attribute keys
+        """
+        if self._trajs is None and self._data is None:
+            if self._backend.scans_trajs:
+                self._scan()
+        if self._trajs is None:
+            veh_data = self.data.get("INST", {}).get("TRAJS")
+            if veh_data is None:
+                self._trajs = ()
+            elif isinstance(veh_data["TRAJ"], list):
+                self._trajs = tuple(veh_data["TRAJ"])
+            else:
+                self._trajs = (veh_data["TRAJ"],)
+        return self._trajs
+
+    def _vehicle_records(self) -> tuple:
+        """Read-only vehicle records shared by the queries"""
+        if self._vehicles is None:
+            keys = None
+            if self._fields is not None:
+                keys = tuple(FIELD_KEYS[f] for f in self._fields)
+            self._vehicles = tuple(
+                MappingProxyType(record)
+                for record in convert_records(self.trajs, keys)
+            )
+        return self._vehicles
+
+    @property
+    def vehicles(self) -> tuple:
+        """ Formatted vehicle records, decoded on first access only. Each
+            access returns new dictionaries owned by the caller.
+
+            Returns:
+                vehicles (tuple): dictionaries with vehicle data
+        """
+        return tuple(dict(v) for v in self._vehicle_records())
+
+    @property
+    def index(self) -> dict:
+        """ Vehicle id to row mapping, computed on first access only. Rows
+            point into ``vehicles``, ``trajs`` and ``columns``.
+
+            Returns:
+                index (dict): vehid -> row
+        """
+        if self._index is None:
+            self._index = {
+                int(t["@id"]): row for row, t in enumerate(self.trajs)
+            }
+        return self._index
+
+    def _projects(self, fields: tuple) -> bool:
+        """True if the projection decodes all ``fields``"""
+        return self._fields is None or set(fields).issubset(self._fields)
+
+    @property
+    def locations(self) -> tuple:
+        """ Vehicle id, link, lane and distance of every vehicle, aligned by
+            row. Decoded even if the projection leaves these fields out.
+
+            Returns:
+                locations (tuple): mappings with vehicle location data
+        """
+        if self._locations is None:
+            if self._projects(LANE_FIELDS):
+                self._locations = self._vehicle_records()
+            else:
+                keys = tuple(FIELD_KEYS[f] for f in LANE_FIELDS)
+                self._locations = tuple(convert_records(self.trajs, keys))
+        return self._locations
+
+    @property
+    def lanes(self) -> dict:
+        """ Vehicles grouped by (link, lane) and sorted by distance, computed 
+            on first access only
+
+            Returns:
+                lanes (dict): (link, lane) -> ``LaneIndex``
+        """
+        if self._lanes is None:
+            groups = defaultdict(list)
+            for row, veh in enumerate(self.locations):
+                groups[(veh["link"], veh["lane"])].append(
+                    (veh["distance"], row, veh["vehid"])
+                )
+            self._lanes = {
+                key: LaneIndex(entries) for key, entries in groups.items()
+            }
+        return self._lanes
+
+    @property
+    def columns(self) -> VehicleColumns:
+        """ Vehicle data as a struct of arrays, computed on first access only
+
+            Returns:
+                columns (VehicleColumns): typed columns for all vehicles
+        """
+        if self._columns is None:
+            self._columns = decode_columns(self.trajs, self._fields)
+        return self._columns
+
+    def decoded(self, fields: tuple) -> VehicleColumns:
+        """ Vehicle columns with at least ``fields`` decoded. Fields left out
+            by the projection are decoded on demand and kept with the other
+            columns.
+
+            Args:
+                fields (tuple): vehicle fields e.g. ``("link", "lane")``
+
+            Returns:
+                columns (VehicleColumns): typed columns for all vehicles
+        """
+        columns = self.columns
+        missing = tuple(f for f in fields if getattr(columns, f) is None)
+        if missing:
+            extra = decode_columns(self.trajs, missing)
+            self._columns = columns = columns._replace(
+                **{f: getattr(extra, f) for f in missing}
+            )
+        return columns
+
+    @property
+    def neighbours(self) -> NeighbourColumns:
+        """ Leader and follower data for all vehicles, computed on first 
+            access only
+
+            Returns:
+                neighbours (NeighbourColumns): neighbour data aligned with ``columns``
+        """
+        if self._neighbours is None:
+            self._neighbours = decode_neighbours(
+                self.decoded(NEIGHBOUR_FIELDS)
+            )
+        return self._neighbours
+
+    def records(self, section: str) -> tuple:
+        """ Typed records of an auxiliary section, computed on first access 
+            only
+
+            Args:
+                section (str): one of ``CREATIONS``, ``SORTIES``, ``ENTREES``, ``FEUX``, ``LINKS``
+
+            Returns:
+                records (tuple): slotted records of the section
+        """
+        if section not in self._records:
+            if section not in SECTION_RECORDS:
+                raise SymupyError("Unknown response section", section)
+            self._records[section] = decode_section(
+                section, self.data.get("INST", {}).get(section)
+            )
+        return self._records[section]
+
+
+class StepDelta(NamedTuple):
+    """ Changes in the vehicle population between two consecutive steps
+
+        ============================  =================================
+        **Variable**                  **Description**
+        ----------------------------  ---------------------------------
+        ``entered``                     Ids of vehicles that appeared
+        ``exited``                      Ids of vehicles that left
+        ``updated``                     Ids of vehicles present in both steps whose state changed
+        ============================  =================================
+    """
+
+    entered: np.ndarray
+    exited: np.ndarray
+    updated: np.ndarray
+
+
+def compute_delta(previous: StepSnapshot, current: StepSnapshot) -> StepDelta:
+    """ Compare the vehicles of two snapshots
+
+        Args: 
+            previous (StepSnapshot): snapshot of the previous step
+            current (StepSnapshot): snapshot of the current step
+
+        Returns: 
+            delta (StepDelta): entered, exited and updated vehicle ids
+    """
+    prev_index, prev_trajs = previous.index, previous.trajs
+    cur_index, cur_trajs = current.index, current.trajs
+    entered, updated = [], []
+    for vehid, row in cur_index.items():
+        prev_row = prev_index.get(vehid)
+        if prev_row is None:
+            entered.append(vehid)
+        elif prev_trajs[prev_row] != cur_trajs[row]:
+            updated.append(vehid)
+    exited = [vehid for vehid in prev_index if vehid not in cur_index]
+    return StepDelta(
+        *(
+            np.array(ids, dtype=ct.INTFORMAT)
+            for ids in (entered, exited, updated)
+        )
+    )
 
 
 class SimulatorRequest(Publisher):
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self._str_response = create_string_buffer(ct.BUFFER_STRING)
+    """ Request handling the responses of the simulator. Each new response 
+        is exposed as a ``StepSnapshot`` that is parsed on demand.
+
+        Args: 
+            fields (tuple): vehicle fields to decode, defaults to all
+            sections (tuple): ``INST`` sections to parse, defaults to all when no ``fields`` are given and to ``TRAJS`` otherwise
+            backend (str): parser backend, one of ``BACKENDS`` or ``auto`` to pick the fastest backend for the response size (calibrated once per process)
+
+        Example: 
+            Decode only what a controller needs ::
+
+            >>> req = SimulatorRequest(fields=("vehid", "speed", "distance"))
+            >>> req.query = two_vehicle_xml
+            >>> req.get_vehicle_data()
+            [{'vehid': 0, 'speed': 25.0, 'distance': 75.0}, ...]
+
+        Subscribers to the ``delta`` channel are notified after the other 
+        channels and can read the changes with respect to the previous step 
+        in ``delta``.
+    """
+
+    DELTA_CHANNEL = "delta"
+
+    def __init__(
+        self,
+        fields: tuple = None,
+        sections: tuple = None,
+        backend: str = "xmltodict",
+        **kwargs,
+    ):
+        channels = tuple(kwargs.pop("channels", ("default",)))
+        if self.DELTA_CHANNEL not in channels:
+            channels += (self.DELTA_CHANNEL,)
+        super().__init__(channels=channels, **kwargs)
+        if backend != "auto" and backend not in BACKENDS:
+            raise SymupyError("Unknown parser backend", backend)
+        self._backend = backend
+        # Empty response, never written by the simulator
+        self._initial = create_string_buffer(ct.BUFFER_STRING)
+        self._str_response = self._initial
+        self.project(fields, sections)
+        self._previous = self._snapshot
+        self._delta = None
+
+    def project(self, fields: tuple = None, sections: tuple = None) -> None:
+        """ Restrict the decoding to a subset of vehicle fields and response 
+            sections. ``vehid`` is always decoded. Calling without arguments 
+            restores full decoding. Applies from the current response on.
+
+            Args: 
+                fields (tuple): vehicle fields e.g. ``("vehid", "speed")``
+                sections (tuple): ``INST`` sections e.g. ``("TRAJS",)``
+        """
+        if fields is not None:
+            unknown = set(fields).difference(FIELD_KEYS)
+            if unknown:
+                raise SymupyError("Unknown vehicle fields", unknown)
+            fields = ("vehid",) + tuple(f for f in fields if f != "vehid")
+            if sections is None:
+                sections = ("TRAJS",)
+        if sections is not None:
+            unknown = set(sections).difference(ct.INST_SECTIONS)
+            if unknown:
+                raise SymupyError("Unknown response sections", unknown)
+            sections = tuple(sections)
+        self._fields = fields
+        self._sections = sections
+        self._snapshot = self._bind(self._str_response)
+
+    def _bind(self, response) -> StepSnapshot:
+        if self._backend == "auto":
+            backend = select_backend(len(response))
+        else:
+            backend = BACKENDS[self._backend]
+        return StepSnapshot(response, self._fields, self._sections, backend)
+
+    def reset(self) -> None:
+        """ Forget the responses received, e.g. before a new simulation. The
+            projection and the subscribers are kept.
+        """
+        self._str_response = self._initial
+        self._snapshot = self._bind(self._initial)
+        self._previous = self._snapshot
+        self._delta = None
+
+    @property
+    def backend(self) -> ParserBackend:
+        """Parser backend used for the current response"""
+        return self._snapshot.backend
+
+    @property
+    def fields(self) -> tuple:
+        """Vehicle fields decoded, ``None`` for all"""
+        return self._fields
+
+    @property
+    def sections(self) -> tuple:
+        """Response sections parsed, ``None`` for all"""
+        return self._sections
 
     def __repr__(self):
         return f"{self.__class__.__name__}()"
@@ -64,32 +604,57 @@ class SimulatorRequest(Publisher):
     @query.setter
     def query(self, response: str):
         self._str_response = response
+        self._previous = self._snapshot
+        self._snapshot = self._bind(response)
+        self._delta = None
         for c in self._channels:
             self.dispatch(c)
 
+    @property
+    def delta(self) -> StepDelta:
+        """ Vehicles that entered, exited or changed state since the previous
+            response, computed on first access only
+
+            Example: 
+                Register newly created vehicles only ::
+
+                >>> for vehid in req.delta.entered:
+                ...     registry.add(vehid)
+        """
+        if self._delta is None:
+            self._delta = compute_delta(self._previous, self._snapshot)
+        return self._delta
+
+    @property
+    def snapshot(self) -> StepSnapshot:
+        """Parsed view of the current response"""
+        return self._snapshot
+
+    @property
+    def parse_count(self) -> int:
+        """ Number of times the current response has been parsed. The full
+            document and, for backends scanning ``TRAJ`` records, the scan
+            are each done at most once, so the count is at most 2.
+        """
+        return self._snapshot.parse_count
+
     @property
     def current_time(self) -> float:
-        return float(self.data_query.get("INST").get("@val"))
+        return float(self._snapshot.header.get("@val"))
 
     @property
     def current_nbveh(self) -> int:
-        return int(self.data_query.get("INST").get("@nbVeh"))
+        return int(self._snapshot.header.get("@nbVeh"))
 
     @property
     def data_query(self):
-        """ Direct parsing from the string buffer
+        """ Parsed data from the string buffer. The buffer is parsed once 
+            per query, subsequent calls reuse the same result.
             
             Returns:
                 simdata (OrderedDict): Simulator data parsed from XML
         """
-        try:
-            dataveh = parse(self._str_response)
-            # Transform ordered dictionary into new keys
-            return dataveh
-        except ExpatError:
-            return {}
-        except AttributeError:
-            return {}
+        return self._snapshot.data
 
     # =========================================================================
     # METHODS
@@ -102,19 +667,91 @@ class SimulatorRequest(Publisher):
                 t_veh_data (list): list of dictionaries containing vehicle data with correct formatting
 
         """
-        if self.data_query.get("INST", {}).get("TRAJS") is not None:
-            veh_data = self.data_query.get("INST").get("TRAJS")
-            if isinstance(veh_data["TRAJ"], list):
-                return [SimulatorRequest.transform(d) for d in veh_data["TRAJ"]]
-            return [SimulatorRequest.transform(veh_data["TRAJ"])]
-        return []
+        return [dict(v) for v in self._snapshot._vehicle_records()]
+
+    def get_creations(self) -> tuple:
+        """ Vehicles created during the current step
+
+            Returns:
+                creations (tuple): ``Creation`` records (vehid, vehtype, origin, destination)
+        """
+        return self._snapshot.records("CREATIONS")
+
+    def get_exits(self) -> tuple:
+        """ Vehicles that left the network during the current step
+
+            Returns:
+                exits (tuple): ``Exit`` records (vehid, vehtype, origin, destination)
+        """
+        return self._snapshot.records("SORTIES")
+
+    def get_entry_queues(self) -> dict:
+        """ Number of vehicles waiting at each network entry
+
+            Returns:
+                queues (dict): endpoint -> number of vehicles waiting
+
+            Example:
+                Queue at the entry ``Ext_In`` ::
+
+                >>> simrequest.get_entry_queues().get("Ext_In")
+                1
+        """
+        entries = self._snapshot.records("ENTREES")
+        return {entry.endpoint: entry.queue for entry in entries}
+
+    def get_traffic_lights(self) -> tuple:
+        """ Traffic light states at the current step
+
+            Returns:
+                lights (tuple): ``TrafficLight`` records (controller, link_in, link_out, state)
+        """
+        return self._snapshot.records("FEUX")
+
+    def get_links(self) -> tuple:
+        """ Link data at the current step
+
+            Returns:
+                links (tuple): ``LinkState`` records (link, count, density, flow, speed)
+        """
+        return self._snapshot.records("LINKS")
+
+    def get_vehicle_columns(self, fields: tuple = None) -> VehicleColumns:
+        """ Extracts vehicles information as a struct of arrays. Columns are
+            typed according to ``FIELD_FORMATAGG`` and aligned by row.
+
+            Args:
+                fields (tuple): fields needed by the caller, decoded even if the projection leaves them out
+
+            Returns:
+                columns (VehicleColumns): vehicle data per attribute
+
+            Example:
+                Compute the mean speed of the fleet ::
+
+                >>> simrequest.query = two_vehicle_xml
+                >>> cols = simrequest.get_vehicle_columns()
+                >>> cols.speed.mean()
+                25.0
+        """
+        if fields is None:
+            return self._snapshot.columns
+        return self._snapshot.decoded(fields)
+
+    def _location(self, vehid: int) -> dict:
+        """Location of a vehicle (see ``LANE_FIELDS``), ``None`` if absent"""
+        row = self._snapshot.index.get(vehid)
+        if row is None:
+            return None
+        return self._snapshot.locations[row]
 
     @staticmethod
-    def transform(veh_data: dict):
+    def transform(veh_data: dict, keys: tuple = None):
         """ Transform vehicle data from string format to coherent format
 
             Args: 
                 veh_data (dict): vehicle data as received from simulator
+                keys (tuple): attributes to transform e.g. ``("@id", "@vit")``, defaults to all
 
             Returns:
                 t_veh_data (dict): vehicle data with correct formatting 
@@ -140,13 +777,7 @@ class SimulatorRequest(Publisher):
                 >>> },
 
         """
-        for key, val in veh_data.items():
-            response[ct.FIELD_DATA[key]] = ct.FIELD_FORMAT[key](val)
-        lkey = "@etat_pilotage"
-        response[ct.FIELD_DATA[lkey]] = ct.FIELD_FORMAT[lkey](
-            veh_data.get(lkey)
-        )
-        return dict(response)
+        return convert_records((veh_data,), keys)[0]
 
     def get_vehicles_property(self, property: str) -> vdata:
         """ Extracts a specific property and returns a tuple containing this 
@@ -160,7 +791,8 @@ class SimulatorRequest(Publisher):
                 values (tuple):
                     tuple with corresponding values e.g (0,1), (0,),(None,)
         """
-        return tuple(veh.get(property) for veh in self.get_vehicle_data())
+        vehicles = self._snapshot._vehicle_records()
+        return tuple(veh.get(property) for veh in vehicles)
 
     def filter_vehicle_property(self, property: str, *args):
         """ Filter out a property for a subset of vehicles
@@ -173,14 +805,10 @@ class SimulatorRequest(Publisher):
                     separate the ``vehid`` via commas to get the corresponding property
         """
         if args:
-            sargs = set(args)
-            vehids = set(self.get_vehicles_property("vehid"))
-            fin_ids = vehids.intersection(sargs)
-            return tuple(
-                veh.get(property)
-                for veh in self.get_vehicle_data()
-                if veh.get("vehid") in fin_ids
-            )
+            index = self._snapshot.index
+            vehicles = self._snapshot._vehicle_records()
+            rows = sorted(index[v] for v in set(args) if v in index)
+            return tuple(vehicles[row].get(property) for row in rows)
         return self.get_vehicles_property(property)
 
     def get_vehicle_properties(self, vehid: int) -> dict:
@@ -189,11 +817,34 @@ class SimulatorRequest(Publisher):
             Returns: 
                 vehdata (dict): Dictionary with all vehicle properties
         """
-        data = self.get_vehicle_data()
-        for v in data:
-            if v["vehid"] == vehid:
-                return v
-        return {}
+        row = self._snapshot.index.get(vehid)
+        if row is None:
+            return {}
+        return dict(self._snapshot._vehicle_records()[row])
+
+    def get_vehicle_rows(self, *vehids) -> np.ndarray:
+        """ Rows of the given vehicle ids within the current step data, 
+            ``-1`` for vehicles that are not in the network. Rows can be used 
+            to index the arrays returned by ``get_vehicle_columns``.
+
+            Args: 
+                vehids (int): vehicle ids, comma separated
+
+            Returns: 
+                rows (ndarray): row per vehicle id
+
+            Example: 
+                Get the speed of a subset of vehicles ::
+
+                >>> rows = simrequest.get_vehicle_rows(0, 1)
+                >>> simrequest.get_vehicle_columns().speed[rows[rows >= 0]]
+        """
+        index = self._snapshot.index
+        return np.fromiter(
+            (index.get(v, -1) for v in vehids),
+            dtype=ct.INTFORMAT,
+            count=len(vehids),
+        )
 
     def is_vehicle_in_network(self, vehid: int, *args) -> bool:
         """ True if veh id is in the network at current state, for multiple
@@ -206,11 +857,10 @@ class SimulatorRequest(Publisher):
                 present (bool): True if vehicle is in the network otherwise false.
   
         """
-        all_vehs = self.get_vehicles_property("vehid")
+        index = self._snapshot.index
         if not args:
-            return vehid in all_vehs
-        vehids = set((vehid, *args))
-        return set(vehids).issubset(set(all_vehs))
+            return vehid in index
+        return index.keys() >= set((vehid, *args))
 
     def vehicles_in_link(self, link: str, lane: int = 1) -> vdata:
         """ Returns a tuple containing vehicle ids traveling on the same 
@@ -224,11 +874,10 @@ class SimulatorRequest(Publisher):
                 vehs (tuple): set of vehicles in link/lane
 
         """
-        return tuple(
-            veh.get("vehid")
-            for veh in self.get_vehicle_data()
-            if veh.get("link") == link and veh.get("lane") == lane
-        )
+        lane_index = self._snapshot.lanes.get((link, lane))
+        if lane_index is None:
+            return ()
+        return lane_index.in_response_order
 
     def is_vehicle_in_link(self, veh: int, link: str) -> bool:
         """ Returns true if a vehicle is in a link at current state
@@ -241,8 +890,8 @@ class SimulatorRequest(Publisher):
                 present (bool): True if veh is in link 
 
         """
-        veh_ids = self.vehicles_in_link(link)
-        return set((veh,)).issubset(set(veh_ids))
+        location = self._location(veh)
+        return location is not None and location["link"] == link
 
     def is_vehicle_driven(self, vehid: int) -> bool:
         """ Returns true if the vehicle state is exposed to a driven state
@@ -254,18 +903,24 @@ class SimulatorRequest(Publisher):
             Returns: 
                 driven (bool): True if veh is driven
         """
-        if self.is_vehicle_in_network(vehid):
+        return self.get_vehicle_properties(vehid).get("driven") == True
 
-            forced = tuple(
-                veh.get("driven") == True
-                for veh in self.get_vehicle_data()
-                if veh.get("vehid") == vehid
-            )
-            return any(forced)
-        return False
+    def get_lane_index(self, vehid: int) -> LaneIndex:
+        """ Sorted index of the (link, lane) where a vehicle is traveling
+
+            Args: 
+                vehid (int): vehicle id
+
+            Returns: 
+                lane (LaneIndex): index of the lane, ``None`` if the vehicle is not in the network
+        """
+        veh = self._location(vehid)
+        if veh is None:
+            return None
+        return self._snapshot.lanes[(veh["link"], veh["lane"])]
 
     def vehicle_downstream_of(self, vehid: int) -> tuple:
-        """ Get ids of vehicles downstream to vehid
+        """ Get ids of vehicles downstream to vehid on the same (link, lane)
 
             Args: 
                 vehid (str):
@@ -275,18 +930,13 @@ class SimulatorRequest(Publisher):
                 vehid (tuple):
                     vehicles downstream of vehicle id
         """
-        link = self.filter_vehicle_property("link", vehid)[0]
-        vehpos = self.filter_vehicle_property("distance", vehid)[0]
-
-        vehids = set(self.vehicles_in_link(link))
-        neigh = vehids.difference(set((vehid,)))
-
-        neighpos = self.filter_vehicle_property("distance", *neigh)
-
-        return tuple(nbh for nbh, npos in zip(neigh, neighpos) if npos > vehpos)
+        lane_index = self.get_lane_index(vehid)
+        if lane_index is None:
+            return ()
+        return self.sort_by_response(lane_index.downstream(vehid))
 
     def vehicle_upstream_of(self, vehid: str) -> tuple:
-        """Get ids of vehicles upstream to vehid
+        """Get ids of vehicles upstream to vehid on the same (link, lane)
 
             Args: 
                 vehid (str):
@@ -296,12 +946,81 @@ class SimulatorRequest(Publisher):
                 vehid (tuple):
                     vehicles upstream of vehicle id
         """
-        link = self.filter_vehicle_property("link", vehid)[0]
-        vehpos = self.filter_vehicle_property("distance", vehid)[0]
+        lane_index = self.get_lane_index(vehid)
+        if lane_index is None:
+            return ()
+        return self.sort_by_response(lane_index.upstream(vehid))
+
+    def get_vehicle_neighbours(self) -> NeighbourColumns:
+        """ Leader id, follower id, spacing and relative speed for every 
+            vehicle in a single call. Arrays are aligned with the rows of 
+            ``get_vehicle_columns``.
+
+            Returns: 
+                neighbours (NeighbourColumns): neighbour data per vehicle
+
+            Example: 
+                Time headway for the whole fleet ::
+
+                >>> cols = simrequest.get_vehicle_columns()
+                >>> ngh = simrequest.get_vehicle_neighbours()
+                >>> headway = ngh.spacing / cols.speed
+        """
+        return self._snapshot.neighbours
+
+    def vehicle_leaders_of(
+        self, vehid: int, k: int = 1, within: float = None
+    ) -> tuple:
+        """ Get the ``k`` nearest vehicles downstream to vehid on the same 
+            (link, lane), nearest first
+
+            Args: 
+                vehid (int): vehicle id
+                k (int): number of leaders, ``None`` for all, defaults to 1
+                within (float): maximum distance gap, defaults to no limit
+
+            Returns: 
+                vehid (tuple): leaders of vehicle id
+
+            Example: 
+                Immediate leader and all leaders within 50 m ::
+
+                >>> simrequest.vehicle_leaders_of(2)
+                (1,)
+                >>> simrequest.vehicle_leaders_of(2, k=None, within=50)
+                (1,)
+        """
+        lane_index = self.get_lane_index(vehid)
+        if lane_index is None:
+            return ()
+        return lane_index.downstream(vehid, k, within)
+
+    def vehicle_followers_of(
+        self, vehid: int, k: int = 1, within: float = None
+    ) -> tuple:
+        """ Get the ``k`` nearest vehicles upstream to vehid on the same 
+            (link, lane), nearest first
+
+            Args: 
+                vehid (int): vehicle id
+                k (int): number of followers, ``None`` for all, defaults to 1
+                within (float): maximum distance gap, defaults to no limit
+
+            Returns: 
+                vehid (tuple): followers of vehicle id
+        """
+        lane_index = self.get_lane_index(vehid)
+        if lane_index is None:
+            return ()
+        return lane_index.upstream(vehid, k, within)
 
-        vehids = set(self.vehicles_in_link(link))
-        neigh = vehids.difference(set((vehid,)))
+    def sort_by_response(self, vehids) -> tuple:
+        """ Sort vehicle ids as received from the simulator
 
-        neighpos = self.filter_vehicle_property("distance", *neigh)
+            Args: 
+                vehids (iterable): vehicle ids in the network
 
-        return tuple(nbh for nbh, npos in zip(neigh, neighpos) if npos < vehpos)
+            Returns: 
+                vehid (tuple): sorted vehicle ids
+        """
+        return tuple(sorted(vehids, key=self._snapshot.index.__getitem__))
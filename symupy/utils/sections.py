@@ -0,0 +1,82 @@
+"""
+Section Decoder
+===============
+This module decodes the auxiliary sections of a simulator response (vehicle creations, exits, entry queues, traffic lights and links) into compact typed records. Records are slotted tuples built from the schema in ``SECTION_FORMAT``.
+
+Example:
+    Decode the entry queues of a parsed response ::
+
+    >>> queues = decode_section("ENTREES", data["INST"]["ENTREES"])
+    >>> queues[0].queue
+    1
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from collections import namedtuple
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+import symupy.utils.constants as ct
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+Creation = namedtuple(
+    "Creation", [f for f, _ in ct.SECTION_FORMAT["CREATIONS"][1].values()]
+)
+Exit = namedtuple(
+    "Exit", [f for f, _ in ct.SECTION_FORMAT["SORTIES"][1].values()]
+)
+EntryQueue = namedtuple(
+    "EntryQueue", [f for f, _ in ct.SECTION_FORMAT["ENTREES"][1].values()]
+)
+TrafficLight = namedtuple(
+    "TrafficLight", [f for f, _ in ct.SECTION_FORMAT["FEUX"][1].values()]
+)
+LinkState = namedtuple(
+    "LinkState", [f for f, _ in ct.SECTION_FORMAT["LINKS"][1].values()]
+)
+
+SECTION_RECORDS = {
+    "CREATIONS": Creation,
+    "SORTIES": Exit,
+    "ENTREES": EntryQueue,
+    "FEUX": TrafficLight,
+    "LINKS": LinkState,
+}
+
+
+def _convert(fmt, value):
+    return None if value is None else fmt(value)
+
+
+def decode_section(name: str, section) -> tuple:
+    """ Decode a section of the parsed response into typed records
+
+        Args:
+            name (str): section name, one of ``SECTION_RECORDS``
+            section (dict): parsed section e.g. ``data["INST"]["ENTREES"]``
+
+        Returns:
+            records (tuple): one record per element, ``()`` for empty sections
+    """
+    if not section:
+        return ()
+    tag, schema = ct.SECTION_FORMAT[name]
+    elements = section.get(tag)
+    if elements is None:
+        return ()
+    if not isinstance(elements, list):
+        elements = (elements,)
+    record = SECTION_RECORDS[name]
+    items = tuple(schema.items())
+    return tuple(
+        record(*(_convert(fmt, e.get(key)) for key, (_, fmt) in items))
+        for e in elements
+    )
@@ -0,0 +1,154 @@
+"""
+Scenario Validation
+===================
+This module validates scenario files against the SymuVia XML schema. Schemas are compiled once per process and shared by all validations. Successful validations are remembered by file content so that unchanged files are not validated again.
+
+Example:
+    Validate a campaign before allocating simulators ::
+
+    >>> errors = validate_scenarios(files, processes=4)
+    >>> invalid = {f: e for f, e in errors.items() if e}
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from lxml import etree
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.cache import content_hash, load_cached, store_cached
+from symupy.utils.exceptions import SymupyFileLoadError
+
+# ============================================================================
+# CLASS AND DEFINITIONS
+# ============================================================================
+
+_XSI_LOCATION = (
+    "{http://www.w3.org/2001/XMLSchema-instance}noNamespaceSchemaLocation"
+)
+_CACHE_KIND = "valid"
+
+# Content keys of the files validated by this process
+_validated = set()
+
+
+@lru_cache(maxsize=None)
+def _compile(schema_path: str, schema_key: str) -> etree.XMLSchema:
+    return etree.XMLSchema(etree.parse(schema_path))
+
+
+def load_schema(schema_path: str) -> tuple:
+    """ Compiled schema, compiled once per process and schema content
+
+        Args:
+            schema_path (str): path to the ``.xsd`` file
+
+        Returns:
+            schema (XMLSchema): compiled schema
+            key (str): content hash of the schema
+    """
+    schema_path = os.path.realpath(schema_path)
+    key = content_hash(schema_path)
+    return _compile(schema_path, key), key
+
+
+def schema_location(file_name: str) -> str:
+    """ Schema declared by a scenario in ``xsi:noNamespaceSchemaLocation``,
+        resolved relative to the scenario file
+
+        Args:
+            file_name (str): path to the scenario file
+
+        Returns:
+            schema_path (str): path to the schema, ``""`` if none is declared
+    """
+    location = ""
+    try:
+        for _, element in etree.iterparse(file_name, events=("start",)):
+            location = element.get(_XSI_LOCATION, "")
+            break
+    except etree.XMLSyntaxError:
+        pass
+    if not location:
+        return ""
+    return os.path.join(os.path.dirname(os.path.abspath(file_name)), location)
+
+
+def validate_scenario(
+    file_name: str, schema_path: str = None, key: str = None, cache_dir=None
+) -> None:
+    """ Validate a scenario file against the SymuVia schema. Files already
+        validated with the same schema and content are skipped.
+
+        Args:
+            file_name (str): path to the scenario file
+            schema_path (str): path to the schema, defaults to the one declared by the file
+            key (str): content hash of the file if already known
+            cache_dir (str): cache directory, defaults to None (validations kept for the process only)
+
+        Raises:
+            SymupyFileLoadError: the file does not follow the schema or no schema is available
+    """
+    if schema_path is None:
+        schema_path = schema_location(file_name)
+    if not schema_path or not os.path.exists(schema_path):
+        raise SymupyFileLoadError("Schema not found", schema_path)
+    schema, schema_key = load_schema(schema_path)
+    if key is None:
+        key = content_hash(file_name)
+    key = f"{key}-{schema_key}"
+    if key in _validated or (
+        cache_dir is not None and load_cached(key, _CACHE_KIND, cache_dir)
+    ):
+        _validated.add(key)
+        return
+    try:
+        valid = schema.validate(etree.parse(file_name))
+    except etree.XMLSyntaxError as error:
+        raise SymupyFileLoadError(f"Invalid XML: {error}", file_name)
+    if not valid:
+        error = schema.error_log.last_error
+        raise SymupyFileLoadError(
+            f"Invalid scenario: line {error.line}: {error.message}", file_name
+        )
+    _validated.add(key)
+    if cache_dir is not None:
+        store_cached(key, _CACHE_KIND, True, cache_dir)
+
+
+def _validate(args: tuple) -> str:
+    try:
+        validate_scenario(*args)
+    except SymupyFileLoadError as error:
+        return str(error)
+    return ""
+
+
+def validate_scenarios(
+    file_names, schema_path: str = None, processes: int = None, cache_dir=None
+) -> dict:
+    """ Validate several scenario files in a pool of processes. Each process
+        compiles the schema once.
+
+        Args:
+            file_names (iterable): paths to the scenario files
+            schema_path (str): path to the schema, defaults to the one declared by each file
+            processes (int): number of processes, defaults to the number of CPUs. ``1`` validates in the current process
+            cache_dir (str): cache directory, defaults to None (validations kept for the process only)
+
+        Returns:
+            errors (dict): file name -> error message, ``""`` for valid files
+    """
+    file_names = tuple(file_names)
+    args = tuple((f, schema_path, None, cache_dir) for f in file_names)
+    if processes == 1:
+        return dict(zip(file_names, map(_validate, args)))
+    with ProcessPoolExecutor(processes) as pool:
+        return dict(zip(file_names, pool.map(_validate, args)))
@@ -0,0 +1,113 @@
+"""
+    Unit tests for symupy.utils.backends
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.backends import (
+    BACKENDS,
+    calibrate,
+    select_backend,
+    synthetic_response,
+)
+from symupy.utils.parser import SimulatorRequest
+from symupy.utils.exceptions import SymupyError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def no_trajectory_xml():
+    return b'<INST nbVeh="0" val="1.00"><CREATIONS/><SORTIES/><TRAJS/><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES/><REGULATIONS/></INST>'
+
+
+@pytest.fixture
+def two_vehicle_one_forced_xml():
+    return b'<INST nbVeh="2" val="3.00"><CREATIONS/><SORTIES/><TRAJS><TRAJ abs="50.00" acc="0.00" dst="50.00" etat_pilotage="force (ecoulement respecte)" id="0" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/><TRAJ abs="19.12" acc="0.00" dst="19.12" id="1" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/></TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES/><REGULATIONS/></INST>'
+
+
+@pytest.fixture
+def reordered_xml():
+    """ Attributes outside the usual layout """
+    return b'<INST nbVeh="1" val="2.00"><TRAJS><TRAJ id="4" abs="1.00" acc="0.00" dst="1.00" ord="0.00" tron="L" type="VL" vit="2.00" voie="2" z="0.00"/></TRAJS></INST>'
+
+
+@pytest.fixture
+def escaped_xml():
+    """ Escaped characters in attribute values """
+    return b'<INST nbVeh="1" val="2.00"><TRAJS><TRAJ abs="1.00" acc="0.00" dst="1.00" id="4" ord="0.00" tron="A&amp;B&#233;&lt;" type="VL" vit="2.00" voie="2" z="0.00"/></TRAJS></INST>'
+
+
+@pytest.mark.parametrize("name", list(BACKENDS))
+def test_backends_agree(
+    name, two_vehicle_one_forced_xml, reordered_xml, escaped_xml
+):
+    reference = BACKENDS["xmltodict"]
+    for xml in (two_vehicle_one_forced_xml, reordered_xml, escaped_xml):
+        header, trajs = BACKENDS[name].parse_trajs(memoryview(xml))
+        ref_header, ref_trajs = reference.parse_trajs(xml)
+        assert header == ref_header
+        assert [dict(t) for t in trajs] == [dict(t) for t in ref_trajs]
+
+
+@pytest.mark.parametrize("name", list(BACKENDS))
+def test_backends_empty(name, no_trajectory_xml):
+    header, trajs = BACKENDS[name].parse_trajs(no_trajectory_xml)
+    assert header == {"@nbVeh": "0", "@val": "1.00"}
+    assert trajs == ()
+
+
+@pytest.mark.parametrize("name", list(BACKENDS))
+def test_backends_invalid(name):
+    assert BACKENDS[name].parse_trajs(b"") == ({}, ())
+
+
+@pytest.mark.parametrize("name", list(BACKENDS))
+def test_backends_incomplete(name, two_vehicle_one_forced_xml):
+    incomplete = two_vehicle_one_forced_xml.split(b"</TRAJS>")[0]
+    header, trajs = BACKENDS[name].parse_trajs(incomplete)
+    assert trajs == ()
+
+
+@pytest.mark.parametrize("name", list(BACKENDS))
+def test_request_backend(name, two_vehicle_one_forced_xml):
+    reference = SimulatorRequest()
+    reference.query = two_vehicle_one_forced_xml
+    simrequest = SimulatorRequest(backend=name)
+    simrequest.query = two_vehicle_one_forced_xml
+    assert simrequest.backend is BACKENDS[name]
+    assert simrequest.current_time == 3.0
+    assert simrequest.current_nbveh == 2
+    assert simrequest.get_vehicle_data() == reference.get_vehicle_data()
+    assert simrequest.parse_count == 1
+
+
+def test_request_unknown_backend():
+    with pytest.raises(SymupyError):
+        SimulatorRequest(backend="sax")
+
+
+def test_calibrate():
+    table = calibrate(fleet_sizes=(1, 50), repeat=1)
+    assert len(table) == 2
+    assert set(table.values()) <= set(BACKENDS)
+    large = len(synthetic_response(50))
+    assert select_backend(large) is BACKENDS[table[large]]
+    assert select_backend(10 * large) is BACKENDS[table[large]]
+
+
+def test_request_auto_backend(two_vehicle_one_forced_xml):
+    simrequest = SimulatorRequest(backend="auto")
+    simrequest.query = two_vehicle_one_forced_xml
+    assert simrequest.backend in BACKENDS.values()
+    assert simrequest.current_nbveh == 2
@@ -0,0 +1,140 @@
+"""
+    Unit tests for symupy.utils.bindings
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+from ctypes import CDLL, cdll, c_bool, c_char_p, c_double, c_int, c_size_t
+from ctypes.util import find_library
+from types import SimpleNamespace
+import timeit
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.bindings import (
+    PROTOTYPES,
+    HOT_PATH,
+    declare,
+    load_library,
+    EncodedStrings,
+)
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+class FakeLibrary(object):
+    """ Library exporting all functions except ``SymRunEx``"""
+
+    def __init__(self):
+        for name in PROTOTYPES:
+            if name != "SymRunEx":
+                setattr(self, name, SimpleNamespace(restype=c_int))
+
+
+def test_declare():
+    library = declare(FakeLibrary())
+    travel_time = library.SymGetTotalTravelTimeEx
+    assert travel_time.restype is c_double
+    assert len(travel_time.argtypes) == 1
+    run_step = library.SymRunNextStepLiteEx
+    assert run_step.restype is c_bool
+    assert not hasattr(run_step, "argtypes")
+    assert HOT_PATH <= PROTOTYPES.keys()
+
+
+def test_declare_once():
+    library = declare(FakeLibrary())
+    library.SymDriveVehicleEx.restype = None
+    assert declare(library) is library
+    assert library.SymDriveVehicleEx.restype is None
+
+
+def test_load_library_once():
+    path = find_library("c")
+    if path is None:
+        pytest.skip("C library not found")
+    library = load_library(path)
+    assert load_library(path) is library
+    with pytest.raises(OSError):
+        load_library("/nonexistent/libsymuvia.so")
+
+
+def test_encoded_strings():
+    encoded = EncodedStrings()
+    first = encoded["Zone_001"]
+    assert first == b"Zone_001"
+    assert encoded["Zone_001"] is first
+    assert encoded["Zoné"] == "Zoné".encode("UTF8")
+
+
+def binding_overhead(number: int = 100000, repeat: int = 5) -> dict:
+    """ Per call overhead of foreign calls with three bindings:
+
+        * ``before``: identifiers encoded and numbers wrapped at every call
+        * ``declared``: declared argument types, identifiers encoded once
+        * ``inferred``: return type only, identifiers encoded once, doubles wrapped
+
+        C library functions stand in for the SymuVia functions so that only
+        the binding overhead is measured: ``strncmp`` for identifier
+        arguments and ``ldexp`` for numeric arguments.
+
+        Args:
+            number (int): calls per measure
+            repeat (int): measures, the fastest one is kept
+
+        Returns:
+            overhead (dict): ``(before, declared, inferred)`` seconds per call, for ``identifiers`` and ``numbers``
+
+        Example:
+            Compare the bindings ::
+
+            >>> binding_overhead()["identifiers"]
+            (1.26e-06, 1.17e-06, 6.7e-07)
+    """
+    libc = CDLL(None) if os.name == "posix" else cdll.msvcrt
+    link, vehtype, position, lane = "Zone_001", "VL", 20.0, 1
+    encoded = EncodedStrings()
+
+    # Item access returns distinct function pointers with their own prototype
+    strncmp, strncmp_declared = libc["strncmp"], libc["strncmp"]
+    strncmp.restype = strncmp_declared.restype = c_int
+    strncmp_declared.argtypes = (c_char_p, c_char_p, c_size_t)
+    ldexp, ldexp_declared = libc["ldexp"], libc["ldexp"]
+    ldexp.restype = ldexp_declared.restype = c_double
+    ldexp_declared.argtypes = (c_double, c_int)
+
+    calls = {
+        "identifiers": (
+            lambda: strncmp(
+                link.encode("UTF8"), vehtype.encode("UTF8"), c_size_t(lane)
+            ),
+            lambda: strncmp_declared(encoded[link], encoded[vehtype], lane),
+            lambda: strncmp(encoded[link], encoded[vehtype], lane),
+        ),
+        "numbers": (
+            lambda: ldexp(c_double(position), c_int(lane)),
+            lambda: ldexp_declared(position, lane),
+            lambda: ldexp(c_double(position), lane),
+        ),
+    }
+    return {
+        name: tuple(
+            min(timeit.repeat(call, number=number, repeat=repeat)) / number
+            for call in variants
+        )
+        for name, variants in calls.items()
+    }
+
+
+def test_binding_overhead():
+    overhead = binding_overhead(number=100, repeat=1)
+    assert set(overhead) == {"identifiers", "numbers"}
+    assert all(len(t) == 3 and min(t) > 0 for t in overhead.values())
@@ -0,0 +1,113 @@
+"""
+    Unit tests for symupy.utils.buffers
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.buffers import ResponseBuffer, buffer_view
+from symupy.utils.configurator import Configurator
+from symupy.utils.exceptions import SymupyBufferError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def response(nbytes: int) -> bytes:
+    """ Response of exactly ``nbytes`` bytes """
+    head, tail = b'<INST nbVeh="0" val="1.00">', b"</INST>"
+    return head + b" " * (nbytes - len(head) - len(tail)) + tail
+
+
+def write(buffer: ResponseBuffer, nbytes: int) -> memoryview:
+    buffer.raw.value = response(nbytes)
+    return buffer.view()
+
+
+def test_view_bounded():
+    buffer = ResponseBuffer(1000, min_size=100)
+    view = write(buffer, 100)
+    assert bytes(view) == response(100)
+    assert bytes(view) == bytes(buffer_view(buffer.raw))
+    assert buffer.stats.used == 100
+
+
+def test_grows_ahead():
+    buffer = ResponseBuffer(1000, min_size=100)
+    write(buffer, 600)
+    assert buffer.size == 2000
+    assert buffer.stats.resizes == 1
+    # Last response remains in the new memory
+    assert bytes(buffer_view(buffer.raw)) == response(600)
+
+
+def test_truncation_detected():
+    buffer = ResponseBuffer(1000, min_size=100)
+    buffer.raw.raw = response(2000)[:1000]
+    with pytest.raises(SymupyBufferError):
+        buffer.view()
+    assert buffer.stats.truncations == 1
+    assert buffer.size >= 2000
+    write(buffer, 900)
+
+
+def test_complete_responses_accepted():
+    buffer = ResponseBuffer(1000)
+    # Filled up to the terminator
+    assert bytes(write(buffer, 999)) == response(999)
+    buffer.raw.value = b'<INST nbVeh="0" val="1.00"/>\n'
+    assert bytes(buffer.view()) == b'<INST nbVeh="0" val="1.00"/>\n'
+    assert buffer.stats.truncations == 0
+
+
+def test_shrinks_after_low_usage():
+    buffer = ResponseBuffer(4000, min_size=1000, shrink_after=3)
+    for _ in range(2):
+        write(buffer, 100)
+    assert buffer.size == 4000
+    write(buffer, 100)
+    assert buffer.size == 2000
+    write(buffer, 600)  # Moderate usage resets the counter
+    for _ in range(5):
+        write(buffer, 100)
+    assert buffer.size == 1000
+
+
+def test_no_shrink_below_initial_size():
+    buffer = ResponseBuffer(1000, shrink_after=1)
+    for _ in range(5):
+        write(buffer, 100)
+    assert buffer.size == 1000
+    # Grown memory is still released down to the initial size
+    write(buffer, 600)
+    assert buffer.size == 2000
+    for _ in range(5):
+        write(buffer, 100)
+    assert buffer.size == 1000
+
+
+def test_high_water_mark():
+    buffer = ResponseBuffer(4000)
+    for nbytes in (100, 1500, 200):
+        write(buffer, nbytes)
+    stats = buffer.stats
+    assert stats.high_water == 1500
+    assert stats.used == 200
+    assert stats.steps == 3
+
+
+def test_configurator_owns_buffer():
+    first, second = Configurator(), Configurator(bufferSize=5000)
+    assert first.buffer_string is not second.buffer_string
+    assert len(second.buffer_string) == 5000
+    assert second.response_buffer.min_size == 5000
+    third = Configurator(bufferSize=5000, bufferMinSize=1000)
+    assert third.response_buffer.min_size == 1000
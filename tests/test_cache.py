@@ -0,0 +1,68 @@
+"""
+    Unit tests for symupy.utils.cache
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.cache import (
+    content_hash,
+    cache_path,
+    load_cached,
+    store_cached,
+    prune_cached,
+)
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def test_content_hash(tmp_path):
+    first, second = tmp_path / "a.xml", tmp_path / "b.xml"
+    first.write_bytes(b"<ROOT/>")
+    second.write_bytes(b"<ROOT/>")
+    assert content_hash(str(first)) == content_hash(str(second))
+    second.write_bytes(b"<ROOT />")
+    assert content_hash(str(first)) != content_hash(str(second))
+
+
+def test_store_and_load(tmp_path):
+    assert load_cached("key", "index", str(tmp_path)) is None
+    assert store_cached("key", "index", {"a": (1, 2)}, str(tmp_path))
+    assert load_cached("key", "index", str(tmp_path)) == {"a": (1, 2)}
+    assert load_cached("key", "other", str(tmp_path)) is None
+
+
+def test_corrupted_entry(tmp_path):
+    with open(cache_path("key", "index", str(tmp_path)), "wb") as f:
+        f.write(b"not a pickle")
+    assert load_cached("key", "index", str(tmp_path)) is None
+
+
+def test_stale_versions_removed(tmp_path):
+    cache_dir = str(tmp_path)
+    for key, kind in (("a", "index1"), ("b", "index2"), ("a", "valid")):
+        assert store_cached(key, kind, None, cache_dir)
+    assert store_cached("a", "index3", None, cache_dir)
+    names = sorted(p.name for p in tmp_path.iterdir())
+    assert names == ["a.index3.pickle", "a.valid.pickle"]
+    assert prune_cached("index3", cache_dir) == 0
+    assert prune_cached("index4", cache_dir) == 1
+
+
+def test_stale_versions_pruned_once(tmp_path):
+    cache_dir = str(tmp_path)
+    assert store_cached("a", "trace1", None, cache_dir)
+    assert store_cached("a", "trace2", None, cache_dir)
+    (tmp_path / "b.trace1.pickle").write_bytes(b"")
+    # Pruned when the first trace2 entry was stored
+    assert store_cached("c", "trace2", None, cache_dir)
+    assert (tmp_path / "b.trace1.pickle").exists()
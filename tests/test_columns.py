@@ -0,0 +1,146 @@
+"""
+    Unit tests for symupy.utils.columns
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import numpy as np
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils import SimulatorRequest
+from symupy.utils.columns import Categorical, decode_columns
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def simrequest():
+    return SimulatorRequest()
+
+
+@pytest.fixture
+def no_trajectory_xml():
+    """ Emulates  a XML response for no trajectory case """
+    STREAM = b'<INST nbVeh="0" val="1.00"><CREATIONS><CREATION entree="Ext_In" id="0" sortie="Ext_Out" type="VL"/></CREATIONS><SORTIES/><TRAJS/><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="1"/></ENTREES><REGULATIONS/></INST>'
+    return STREAM
+
+
+@pytest.fixture
+def two_vehicle_one_forced_xml():
+    """ Emulates a XML response for 1 vehicle forced amont 2 trajectories"""
+    STREAM = b'<INST nbVeh="1" val="3.00"><CREATIONS><CREATION entree="Ext_In" id="2" sortie="Ext_Out" type="VL"/></CREATIONS><SORTIES/><TRAJS><TRAJ abs="50.00" acc="0.00" dst="50.00" etat_pilotage="force (ecoulement respecte)" id="0" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/><TRAJ abs="19.12" acc="0.00" dst="19.12" id="1" ord="0.00" tron="Zone_002" type="PL" vit="20.00" voie="2" z="0.00"/></TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="1"/></ENTREES><REGULATIONS/></INST>'
+    return STREAM
+
+
+def test_columns_no_trajectory(simrequest, no_trajectory_xml):
+    simrequest.query = no_trajectory_xml
+    cols = simrequest.get_vehicle_columns()
+    assert cols.size == 0
+    assert cols.speed.dtype == np.float64
+    assert cols.vehid.dtype == np.int32
+    assert cols.link.categories == ()
+    assert len(cols.link.values) == 0
+
+
+def test_columns_dtypes(simrequest, two_vehicle_one_forced_xml):
+    simrequest.query = two_vehicle_one_forced_xml
+    cols = simrequest.get_vehicle_columns()
+    assert cols.size == 2
+    for name in ("abscissa", "acceleration", "distance", "ordinate", "speed"):
+        assert getattr(cols, name).dtype == np.float64
+    assert cols.vehid.dtype == np.int32
+    assert cols.lane.dtype == np.int32
+    assert cols.link.codes.dtype == np.int32
+    np.testing.assert_array_equal(cols.vehid, (0, 1))
+    np.testing.assert_array_equal(cols.distance, (50.0, 19.12))
+    np.testing.assert_array_equal(cols.driven, (True, False))
+    np.testing.assert_array_equal(cols.lane, (1, 2))
+
+
+def test_columns_categorical(simrequest, two_vehicle_one_forced_xml):
+    simrequest.query = two_vehicle_one_forced_xml
+    cols = simrequest.get_vehicle_columns()
+    assert cols.link.categories == ("Zone_001", "Zone_002")
+    assert tuple(cols.link.values) == ("Zone_001", "Zone_002")
+    assert tuple(cols.vehtype.values) == ("VL", "PL")
+    assert cols.link.code("Zone_002") == 1
+    assert cols.link.code("Zone_003") == -1
+
+
+def test_columns_match_vehicle_data(simrequest, two_vehicle_one_forced_xml):
+    simrequest.query = two_vehicle_one_forced_xml
+    cols = simrequest.get_vehicle_columns()
+    for row, veh in enumerate(simrequest.get_vehicle_data()):
+        assert cols.speed[row] == veh["speed"]
+        assert cols.link.values[row] == veh["link"]
+    assert simrequest.parse_count == 1
+
+
+def test_columns_read_only(simrequest, two_vehicle_one_forced_xml):
+    simrequest.query = two_vehicle_one_forced_xml
+    cols = decode_columns(simrequest.snapshot.trajs)
+    assert isinstance(cols.link, Categorical)
+    with pytest.raises(ValueError):
+        cols.speed[0] = 2.0
+
+
+@pytest.fixture
+def three_vehicle_xml():
+    """ Emulate a XML response for 3 vehicle trajectories"""
+    STREAM = b'<INST nbVeh="3" val="6.00"><CREATIONS/><SORTIES/><TRAJS><TRAJ abs="125.00" acc="0.00" dst="125.00" id="0" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/><TRAJ abs="94.12" acc="0.00" dst="94.12" id="1" ord="0.00" tron="Zone_001" type="VL" vit="20.00" voie="1" z="0.00"/><TRAJ abs="50.00" acc="0.00" dst="50.00" id="2" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/></TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="0"/></ENTREES><REGULATIONS/></INST>'
+    return STREAM
+
+
+def test_neighbours_three_vehicles(simrequest, three_vehicle_xml):
+    simrequest.query = three_vehicle_xml
+    ngh = simrequest.get_vehicle_neighbours()
+    np.testing.assert_array_equal(ngh.leader, (-1, 0, 1))
+    np.testing.assert_array_equal(ngh.follower, (1, 2, -1))
+    np.testing.assert_allclose(ngh.spacing, (np.nan, 30.88, 44.12))
+    np.testing.assert_allclose(ngh.relative_speed, (np.nan, 5.0, -5.0))
+
+
+def test_neighbours_ties_match_lane_index(simrequest):
+    trajs = "".join(
+        f'<TRAJ abs="{d}" acc="0.00" dst="{d}" id="{i}" ord="0.00" '
+        f'tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/>'
+        for i, d in enumerate(("80.00", "50.00", "50.00", "20.00", "50.00"))
+    )
+    simrequest.query = (
+        f'<INST nbVeh="5" val="6.00"><TRAJS>{trajs}</TRAJS></INST>'
+    ).encode("UTF8")
+    ngh = simrequest.get_vehicle_neighbours()
+    # Vehicles at the same distance are not neighbours of each other
+    np.testing.assert_array_equal(ngh.leader, (-1, 0, 0, 1, 0))
+    np.testing.assert_array_equal(ngh.follower, (4, 3, 3, -1, 3))
+    for vehid, leader, follower in zip(range(5), ngh.leader, ngh.follower):
+        assert simrequest.vehicle_leaders_of(vehid) == (
+            (leader,) if leader >= 0 else ()
+        )
+        assert simrequest.vehicle_followers_of(vehid) == (
+            (follower,) if follower >= 0 else ()
+        )
+    assert simrequest.vehicle_downstream_of(2) == (0,)
+    assert simrequest.vehicle_upstream_of(2) == (3,)
+
+
+def test_neighbours_split_by_lane(simrequest, two_vehicle_one_forced_xml):
+    simrequest.query = two_vehicle_one_forced_xml
+    ngh = simrequest.get_vehicle_neighbours()
+    np.testing.assert_array_equal(ngh.leader, (-1, -1))
+    np.testing.assert_array_equal(ngh.follower, (-1, -1))
+    assert np.isnan(ngh.spacing).all()
+
+
+def test_neighbours_no_trajectory(simrequest, no_trajectory_xml):
+    simrequest.query = no_trajectory_xml
+    ngh = simrequest.get_vehicle_neighbours()
+    assert len(ngh.leader) == 0
@@ -8,12 +8,21 @@
 import os
 import platform
 import pytest
+from ctypes import c_int
 
 # ============================================================================
 # INTERNAL IMPORTS
 # ============================================================================
 
 from symupy.api import Simulation, Simulator
+from symupy.logic.triggers import TimeReached, VehicleAppears
+from symupy.utils.exceptions import (
+    SymupyDriveVehicleError,
+    SymupyBufferError,
+    SymupyVehicleCreationError,
+)
+from symupy.utils import SimulatorRequest
+from symupy.components.vehicles import VehicleList
 import symupy.utils.constants as CT
 
 # ============================================================================
@@ -21,6 +30,29 @@ import symupy.utils.constants as CT
 # ============================================================================
 
 
+class TruncatingLibrary:
+    """ Library writing step responses larger than the buffer """
+
+    def SymRunNextStepEx(self, buffer, write_xml, b_end):
+        buffer.raw = b"<INST" + b" " * (len(buffer) - 5)
+        return True
+
+
+class RejectingLibrary:
+    """ Library rejecting the creation of ``VL2`` vehicles """
+
+    def __init__(self):
+        self.created = []
+
+    def SymCreateVehicleEx(self, vehtype, origin, destination, lane, time):
+        if vehtype == b"VL2":
+            return -2
+        self.created.append(vehtype)
+        return len(self.created) - 1
+
+    SymCreateVehicleWithRouteEx = None
+
+
 @pytest.fixture
 def symuvia_library_path():
     return CT.DEFAULT_PATH_SYMUVIA
@@ -191,3 +223,132 @@ def test_runbystep_bottleneck_002(bottleneck_002, symuvia_library_path):
         while s.do_next:
             s.run_step()
         assert s.do_next == False
+
+
+def test_run_steps_bottleneck_001(bottleneck_001, symuvia_library_path):
+    symuvia = Simulator.from_path(bottleneck_001, symuvia_library_path)
+    times = []
+
+    def callback(s):
+        times.append(s.request.current_time)
+
+    with symuvia as s:
+        s.run_steps(10)
+        s.run_steps(20, every=5, callback=callback)
+        assert len(times) == 4
+        assert times == sorted(times)
+
+
+def test_run_triggered_bottleneck_001(bottleneck_001, symuvia_library_path):
+    symuvia = Simulator.from_path(bottleneck_001, symuvia_library_path)
+    fired = []
+
+    with symuvia as s:
+        s.add_trigger(TimeReached(10.0), lambda s: fired.append("time"))
+        s.add_trigger(VehicleAppears(0), lambda s: fired.append("vehicle"))
+        s.run_triggered()
+        assert set(fired) == {"time", "vehicle"}
+
+
+def test_create_vehicles_bottleneck_001(bottleneck_001, symuvia_library_path):
+    symuvia = Simulator.from_path(bottleneck_001, symuvia_library_path)
+    demand = {
+        "vehtype": ["VL", "VL", "VL2"],
+        "origin": ["Ext_In"] * 3,
+        "destination": ["Ext_Out"] * 3,
+        "time": [1.0, 3.5, 3.0],
+    }
+
+    with symuvia as s:
+        assert s.create_vehicles(demand) == 3
+        s.run_step()
+        assert s.pending_vehicles == 3
+        s.run_steps(5)
+        assert s.pending_vehicles == 0
+
+
+def test_create_vehicles_rejected(bottleneck_001, symuvia_library_path):
+    symuvia = Simulator.from_path(bottleneck_001, symuvia_library_path)
+    library = symuvia._Simulator__library = RejectingLibrary()
+    symuvia._c_iter = 0
+    symuvia.create_vehicles(
+        {
+            "vehtype": ["VL", "VL2", "VL"],
+            "origin": ["Ext_In"] * 3,
+            "destination": ["Ext_Out"] * 3,
+        }
+    )
+
+    with pytest.raises(SymupyVehicleCreationError):
+        symuvia._release_vehicles()
+    # Vehicles after the rejected one are still created
+    assert library.created == [b"VL", b"VL"]
+    assert symuvia.pending_vehicles == 0
+
+
+@pytest.mark.parametrize(
+    "positions, links",
+    [
+        ((10.0, 900.0), ("Zone_001", "Zone_001")),
+        ((10.0, -1.0), ("Zone_001", "Zone_001")),
+        ((10.0, 20.0), ("Zone_001", "Zone_002")),
+        ((10.0, 20.0), ("Zone_001",)),
+    ],
+)
+def test_drive_vehicles_validation(
+    bottleneck_001, symuvia_library_path, positions, links
+):
+    symuvia = Simulator.from_path(bottleneck_001, symuvia_library_path)
+    with pytest.raises(SymupyDriveVehicleError):
+        symuvia.drive_vehicles((0, 1), positions, links)
+
+
+def test_truncated_step_counted(bottleneck_001, symuvia_library_path):
+    symuvia = Simulator.from_path(bottleneck_001, symuvia_library_path)
+    symuvia._Simulator__library = TruncatingLibrary()
+    symuvia.request = SimulatorRequest()
+    symuvia.vehicles = VehicleList(symuvia.request)
+    symuvia._n_iter = iter(symuvia.simulation.get_simulation_steps())
+    symuvia._c_iter = next(symuvia._n_iter)
+    symuvia._b_end = c_int()
+    symuvia.step_launch_mode = "full"
+
+    with pytest.raises(SymupyBufferError):
+        symuvia.run_step()
+    # The step ran in the simulator even if its response was lost
+    assert symuvia.simulationstep == 1
+
+
+def test_drive_vehicles_bottleneck_001(bottleneck_001, symuvia_library_path):
+    symuvia = Simulator(
+        library_path=symuvia_library_path, step_launch_mode="full"
+    )
+    symuvia.register_simulation(bottleneck_001)
+
+    with symuvia as s:
+        s.request_answer()
+        s.request_answer()
+        vehids = [s.create_vehicle("VL", "Ext_In", "Ext_Out") for _ in "ab"]
+        s.request_answer()
+        states = s.drive_vehicles(vehids, (40.0, 20.0), lanes=1)
+        positions = s.request.filter_vehicle_property("distance", *vehids)
+
+        assert states == (4, 4)
+        assert sorted(map(float, positions)) == pytest.approx([20.0, 40.0])
+
+
+def test_campaign_bottleneck(
+    bottleneck_001, bottleneck_002, symuvia_library_path
+):
+    symuvia = Simulator(library_path=symuvia_library_path)
+    libraries, requests, steps = set(), set(), []
+
+    for s in symuvia.campaign((bottleneck_001, bottleneck_002)):
+        libraries.add(id(s.library))
+        requests.add(id(s.request))
+        while s.do_next:
+            s.run_step()
+        steps.append(s.simulationstep)
+
+    assert len(libraries) == len(requests) == 1
+    assert len(steps) == 2
@@ -0,0 +1,87 @@
+"""
+    Unit tests for symupy.utils.converters
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.utils.converters import compile_converter, convert_records
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def traj():
+    return {
+        "@abs": "25.00",
+        "@acc": "0.00",
+        "@dst": "25.00",
+        "@id": "0",
+        "@ord": "0.00",
+        "@tron": "Zone_001",
+        "@type": "VL",
+        "@vit": "25.00",
+        "@voie": "1",
+        "@z": "0.00",
+    }
+
+
+@pytest.fixture
+def traj_data():
+    return {
+        "abscissa": 25.0,
+        "acceleration": 0.0,
+        "distance": 25.0,
+        "driven": False,
+        "elevation": 0.0,
+        "lane": 1,
+        "link": "Zone_001",
+        "ordinate": 0.0,
+        "speed": 25.0,
+        "vehid": 0,
+        "vehtype": "VL",
+    }
+
+
+def test_compile_converter_cached():
+    keys = ("@id", "@vit")
+    assert compile_converter(keys) is compile_converter(keys)
+
+
+def test_convert_record(traj, traj_data):
+    assert convert_records((traj,)) == (traj_data,)
+
+
+def test_convert_record_driven(traj, traj_data):
+    traj["@etat_pilotage"] = "force (ecoulement respecte)"
+    traj_data["driven"] = True
+    assert convert_records((traj,)) == (traj_data,)
+
+
+def test_convert_record_projection(traj):
+    records = convert_records((traj,), ("@id", "@dst"))
+    assert records == ({"vehid": 0, "distance": 25.0},)
+
+
+def test_convert_record_missing(traj):
+    del traj["@z"]
+    records = convert_records((traj,), ("@id", "@z", "@etat_pilotage"))
+    assert records == ({"vehid": 0, "elevation": None, "driven": False},)
+
+
+def test_convert_records_threads(traj, traj_data):
+    trajs = [dict(traj, **{"@id": str(i)}) for i in range(100)]
+    with ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(lambda t: convert_records((t,))[0], trajs))
+    assert [r["vehid"] for r in results] == list(range(100))
+    assert all(r["speed"] == traj_data["speed"] for r in results)
@@ -0,0 +1,101 @@
+"""
+    Unit tests for symupy.logic.demand
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.api import Simulation
+from symupy.components import Route
+from symupy.logic.demand import DemandQueue, demand_columns, encode_column
+from symupy.utils.exceptions import SymupyVehicleCreationError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def index(tmp_path):
+    file_name = "bottleneck_001.xml"
+    file_path = ("tests", "mocks", "bottlenecks", file_name)
+    file_path = os.path.join(os.getcwd(), *file_path)
+    return Simulation(file_path, cache_dir=str(tmp_path)).index
+
+
+@pytest.fixture
+def batch():
+    return {
+        "vehtype": ["VL", "VL2", "VL"],
+        "origin": ["Ext_In"] * 3,
+        "destination": ["Ext_Out"] * 3,
+        "time": [2.5, 0.2, 2.5],
+        "route": ["", Route(0, ("Zone_001",), b"Zone_001"), "Zone_001"],
+    }
+
+
+def test_encode_column():
+    encoded = encode_column(["a", "b", "a"])
+    assert encoded.tolist() == [b"a", b"b", b"a"]
+    assert encoded[0] is encoded[2]
+
+
+def test_demand_columns(index, batch):
+    times, vehtype, origin, destination, lanes, routes = demand_columns(
+        batch, index
+    )
+    assert times.tolist() == [2.5, 0.2, 2.5]
+    assert vehtype.tolist() == [b"VL", b"VL2", b"VL"]
+    assert lanes.tolist() == [1, 1, 1]
+    assert routes.tolist() == [b"", b"Zone_001", b"Zone_001"]
+    times = demand_columns(
+        {"vehtype": ["VL"], "origin": ["Ext_In"], "destination": ["Ext_Out"]},
+        index,
+        time=4.0,
+    )[0]
+    assert times.tolist() == [4.0]
+
+
+@pytest.mark.parametrize(
+    "column, value",
+    [("vehtype", "Bus"), ("origin", "Ext_X"), ("destination", "Ext_In")],
+)
+def test_invalid_rows(index, batch, column, value):
+    batch[column] = [batch[column][0], value, value]
+    with pytest.raises(SymupyVehicleCreationError, match=r"2 rows \(1, 2\)"):
+        demand_columns(batch, index)
+
+
+def test_dataframe(index, batch):
+    pd = pytest.importorskip("pandas")
+    columns = demand_columns(pd.DataFrame(batch), index)
+    assert columns[2].tolist() == [b"Ext_In"] * 3
+
+
+def test_queue_by_time(index, batch):
+    queue = DemandQueue()
+    queue.push(*demand_columns(batch, index))
+    assert len(queue) == 3
+    assert queue.next_time == 0.2
+    assert [row[1] for row in queue.pop(1.0)] == [b"VL2"]
+    assert queue.pop(2.0) == []
+    del batch["time"]
+    queue.push(*demand_columns(batch, index, time=2.5))
+    assert [row[1] for row in queue.pop(3.0)] == [b"VL", b"VL"] + [
+        b"VL",
+        b"VL2",
+        b"VL",
+    ]
+    queue.push(*demand_columns(batch, index, time=4.0))
+    assert len(queue.pop(4.0)) == 0
+    assert len(queue) == 3
+    queue.clear()
+    assert not queue
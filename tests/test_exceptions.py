@@ -16,6 +16,7 @@ from symupy.utils.exceptions import (
     SymupyLoadLibraryError,
     SymupyDriveVehicleError,
     SymupyVehicleCreationError,
+    SymupyBufferError,
     SymupyWarning,
 )
 
@@ -58,6 +59,12 @@ def test_symupyvehiclecreationerror():
         raise SymupyVehicleCreationError("Test Error", "")
 
 
+def test_symupybuffererror():
+    assert str(SymupyBufferError("Error raised", 10)) == "Error raised size: 10"
+    with pytest.raises(SymupyError):
+        raise SymupyBufferError("Test Error", 10)
+
+
 def test_symupywarning():
     SymupyWarning("Test Warning")
     assert True
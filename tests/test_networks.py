@@ -0,0 +1,170 @@
+"""
+    Unit tests for symupy.components.networks.models
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import random
+from math import inf
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.api import Simulation
+from symupy.components import RoadNetwork, RouteCache
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def bottleneck_001():
+    file_name = "bottleneck_001.xml"
+    file_path = ("tests", "mocks", "bottlenecks", file_name)
+    return os.path.join(os.getcwd(), *file_path)
+
+
+@pytest.fixture
+def diamond():
+    """ Two routes from In to Out, the longer one is faster """
+    return RoadNetwork(
+        (
+            ("L_in", "In", "A", 100, 10),
+            ("L_slow", "A", "B", 300, 10),
+            ("L_up", "A", "C", 200, 25),
+            ("L_down", "C", "B", 200, 25),
+            ("L_out", "B", "Out", 100, 10),
+            ("L_back", "Out", "In", 50, 10),
+        )
+    )
+
+
+def test_csr_adjacency(diamond):
+    assert diamond.nodes == ("In", "A", "B", "C", "Out")
+    assert diamond.indptr.tolist() == [0, 1, 3, 4, 5, 6]
+    assert diamond.successors("A") == ("L_slow", "L_up")
+    assert diamond.free_flow_time[diamond.link("L_up")] == 8.0
+
+
+def test_shortest_path(diamond):
+    cost, route = diamond.shortest_path("In", "Out")
+    assert route == ("L_in", "L_up", "L_down", "L_out")
+    assert cost == 36.0
+    cost, route = diamond.shortest_path("In", "Out", weight="length")
+    assert route == ("L_in", "L_slow", "L_out")
+    assert diamond.shortest_path("A", "A") == (0.0, ())
+
+
+def test_unreachable():
+    network = RoadNetwork((("L", "A", "B", 10, 1), ("M", "C", None, 1, 1)))
+    assert network.shortest_path("B", "A") == (inf, ())
+    assert network.successors("C") == ()
+
+
+def test_custom_weights(diamond):
+    with pytest.raises(ValueError):
+        diamond.shortest_path("In", "Out", weight=[1.0])
+    weights = [1, 1, 5, 5, 1, 1]
+    assert diamond.shortest_path("In", "Out", weights) == (
+        3.0,
+        ("L_in", "L_slow", "L_out"),
+    )
+
+
+def test_from_simulation(bottleneck_001, tmp_path):
+    sim = Simulation(bottleneck_001, cache_dir=str(tmp_path))
+    network = RoadNetwork.from_simulation(sim)
+    cost, route = network.shortest_path("Ext_In", "Ext_Out")
+    assert route == ("Zone_001",)
+    assert cost == pytest.approx(800 / 25)
+
+
+def test_matches_networkx():
+    nx = pytest.importorskip("networkx")
+    rng = random.Random(7)
+    nodes = range(200)
+    links = [
+        (f"L{i}", *rng.sample(nodes, 2), rng.uniform(1, 100), 1)
+        for i in range(1000)
+    ]
+    network = RoadNetwork(links)
+    graph = nx.DiGraph()
+    for _, u, v, length, _ in links:
+        if not graph.has_edge(u, v) or graph[u][v]["weight"] > length:
+            graph.add_edge(u, v, weight=length)
+    for _ in range(20):
+        u, v = rng.sample(network.nodes, 2)
+        cost, route = network.shortest_path(u, v)
+        try:
+            expected = nx.dijkstra_path_length(graph, u, v)
+        except nx.NetworkXNoPath:
+            expected = inf
+        assert cost == pytest.approx(expected)
+
+
+def test_k_shortest_paths(diamond):
+    paths = diamond.k_shortest_paths("In", "Out", 3)
+    assert [route for _, route in paths] == [
+        ("L_in", "L_up", "L_down", "L_out"),
+        ("L_in", "L_slow", "L_out"),
+    ]
+    assert paths[1][0] == 50.0
+    assert diamond.k_shortest_paths("Out", "Out", 2) == ((0.0, ()),)
+
+
+def test_k_shortest_matches_networkx():
+    nx = pytest.importorskip("networkx")
+    rng = random.Random(3)
+    nodes = range(50)
+    links = [
+        (f"L{i}", *rng.sample(nodes, 2), rng.randrange(1, 100), 1)
+        for i in range(300)
+    ]
+    # One link per node pair, networkx paths are node sequences
+    links = list({(lk[1], lk[2]): lk for lk in links}.values())
+    network = RoadNetwork(links)
+    graph = nx.DiGraph()
+    graph.add_weighted_edges_from((u, v, c) for _, u, v, c, _ in links)
+    for _ in range(10):
+        u, v = rng.sample(network.nodes, 2)
+        costs = [cost for cost, _ in network.k_shortest_paths(u, v, 5)]
+        try:
+            paths = nx.shortest_simple_paths(graph, u, v, weight="weight")
+            expected = [
+                nx.path_weight(graph, p, "weight")
+                for _, p in zip(range(5), paths)
+            ]
+        except nx.NetworkXNoPath:
+            expected = []
+        assert costs == pytest.approx(expected)
+
+
+def test_route_cache(diamond):
+    routes = RouteCache(diamond, k=2, endpoints=("In", "Out", "Nowhere"))
+    assert routes.endpoints == ("In", "Out")
+    first = routes.route("In", "Out")
+    assert first.encoded == b"L_in L_up L_down L_out"
+    second = routes.route("In", "Out", rank=1)
+    assert second.links == ("L_in", "L_slow", "L_out")
+    assert routes.route("In", "Out", rank=2) is first
+    assert routes.routes("In", "Out")[0] is first
+    routes.weight = "length"
+    assert len(routes) == 0
+    assert routes.precompute() == 2
+    assert routes.route("In", "Out").cost == 500.0
+
+
+def test_route_cache_from_simulation(bottleneck_001, tmp_path):
+    sim = Simulation(bottleneck_001, cache_dir=str(tmp_path))
+    routes = RouteCache.from_simulation(sim, k=3)
+    routes.precompute()
+    assert ("Ext_In", "Ext_Out") in routes
+    assert routes.route("Ext_In", "Ext_Out").encoded == b"Zone_001"
+    assert routes.route("Ext_Out", "Ext_In") is None
@@ -8,6 +8,8 @@
 # ============================================================================
 
 from ctypes import create_string_buffer
+import json
+import pickle
 import pytest
 from xmltodict import parse
 
@@ -15,8 +17,9 @@ from xmltodict import parse
 # INTERNAL IMPORTS
 # ============================================================================
 
-from symupy.utils.parser import SimulatorRequest
+from symupy.utils.parser import SimulatorRequest, buffer_view
 from symupy.utils.constants import BUFFER_STRING
+from symupy.utils.exceptions import SymupyError
 
 # ============================================================================
 # TESTS AND DEFINITIONS
@@ -156,6 +159,15 @@ def test_parse_nodata(simrequest):
     assert response == {}
 
 
+def test_reset_request(simrequest, one_vehicle_xml):
+    initial = simrequest.query
+    simrequest.query = one_vehicle_xml
+    simrequest.reset()
+    assert simrequest.query is initial
+    assert simrequest.data_query == {}
+    assert simrequest.delta.entered.size == 0
+
+
 def test_parse_notrajectory(simrequest, no_trajectory_xml, no_trajectory_dct):
     simrequest.query = no_trajectory_xml
     response = simrequest.data_query
@@ -453,3 +465,246 @@ def test_retrieve_time_step(simrequest, three_vehicle_xml):
 def test_retrieve_nb_veh(simrequest, three_vehicle_xml):
     simrequest.query = three_vehicle_xml
     assert simrequest.current_nbveh == 3
+
+
+def test_parse_once_per_query(simrequest, three_vehicle_xml):
+    simrequest.query = three_vehicle_xml
+    assert simrequest.parse_count == 0
+    simrequest.current_time
+    simrequest.get_vehicle_data()
+    simrequest.vehicle_downstream_of(2)
+    simrequest.get_vehicle_properties(1)
+    assert simrequest.parse_count == 1
+
+
+def test_parse_invalidated_on_new_query(
+    simrequest, one_vehicle_xml, two_vehicle_xml
+):
+    simrequest.query = one_vehicle_xml
+    assert simrequest.current_nbveh == 1
+    snapshot = simrequest.snapshot
+    simrequest.query = two_vehicle_xml
+    assert simrequest.snapshot is not snapshot
+    assert simrequest.parse_count == 0
+    assert simrequest.current_nbveh == 2
+    assert simrequest.parse_count == 1
+
+
+def test_snapshot_vehicles_owned_by_caller(simrequest, one_vehicle_xml):
+    simrequest.query = one_vehicle_xml
+    veh = simrequest.get_vehicle_properties(0)
+    veh["speed"] = 0.0
+    simrequest.get_vehicle_data()[0]["speed"] = 0.0
+    simrequest.snapshot.vehicles[0]["speed"] = 0.0
+    assert simrequest.get_vehicle_properties(0)["speed"] == 25.0
+    assert simrequest.filter_vehicle_property("speed", 0) == (25.0,)
+    # Plain dictionaries can be serialised
+    data = simrequest.get_vehicle_data()
+    assert pickle.loads(pickle.dumps(data)) == data
+    assert json.loads(json.dumps(data)) == data
+
+
+def test_parse_vehicle_index(simrequest, three_vehicle_xml):
+    simrequest.query = three_vehicle_xml
+    assert simrequest.snapshot.index == {0: 0, 1: 1, 2: 2}
+    rows = simrequest.get_vehicle_rows(2, 5, 0)
+    assert tuple(rows) == (2, -1, 0)
+    assert simrequest.get_vehicle_properties(5) == {}
+    assert simrequest.is_vehicle_driven(5) == False
+    assert simrequest.filter_vehicle_property("distance", 2, 0, 2) == (
+        125.0,
+        50.0,
+    )
+
+
+def test_parse_3_vehicle_leaders_of(simrequest, three_vehicle_xml):
+    simrequest.query = three_vehicle_xml
+
+    assert simrequest.vehicle_leaders_of(2) == (1,)
+    assert simrequest.vehicle_leaders_of(2, k=None) == (1, 0)
+    assert simrequest.vehicle_leaders_of(2, k=None, within=50.0) == (1,)
+    assert simrequest.vehicle_leaders_of(0) == tuple()
+    assert simrequest.vehicle_leaders_of(7) == tuple()
+
+
+def test_parse_3_vehicle_followers_of(simrequest, three_vehicle_xml):
+    simrequest.query = three_vehicle_xml
+
+    assert simrequest.vehicle_followers_of(0) == (1,)
+    assert simrequest.vehicle_followers_of(0, k=2) == (1, 2)
+    assert simrequest.vehicle_followers_of(0, k=None, within=31.0) == (1,)
+    assert simrequest.vehicle_followers_of(2) == tuple()
+
+
+def test_parse_3_lane_index(simrequest, three_vehicle_xml):
+    simrequest.query = three_vehicle_xml
+    lane_index = simrequest.snapshot.lanes[("Zone_001", 1)]
+    assert lane_index.vehids == (2, 1, 0)
+    assert lane_index.distances == [50.0, 94.12, 125.0]
+    assert simrequest.vehicles_in_link("Zone_001") == (0, 1, 2)
+    assert simrequest.parse_count == 1
+
+
+def test_parse_buffer_view(simrequest, two_vehicle_xml, two_vehicle_dct):
+    buffer = create_string_buffer(BUFFER_STRING)
+    buffer.value = two_vehicle_xml
+    view = buffer_view(buffer)
+    assert len(view) == len(two_vehicle_xml)
+    simrequest.query = view
+    assert simrequest.data_query == two_vehicle_dct
+
+
+def test_parse_buffer_view_detach(simrequest, one_vehicle_xml, two_vehicle_xml):
+    buffer = create_string_buffer(BUFFER_STRING)
+    buffer.value = one_vehicle_xml
+    simrequest.query = buffer_view(buffer)
+    snapshot = simrequest.snapshot
+    snapshot.detach()
+    buffer.value = two_vehicle_xml
+    simrequest.query = buffer_view(buffer)
+    assert snapshot.data["INST"]["@nbVeh"] == "1"
+    assert simrequest.current_nbveh == 2
+
+
+@pytest.mark.parametrize("backend", ("lxml", "expat", "scanner"))
+@pytest.mark.parametrize("nveh", (1, 2))
+def test_parse_scanned_detach(
+    one_vehicle_xml, two_vehicle_xml, no_trajectory_xml, backend, nveh
+):
+    response = one_vehicle_xml if nveh == 1 else two_vehicle_xml
+    simrequest = SimulatorRequest(backend=backend)
+    buffer = create_string_buffer(BUFFER_STRING)
+    buffer.value = response
+    simrequest.query = buffer_view(buffer)
+    snapshot = simrequest.snapshot
+    assert len(snapshot.trajs) == nveh
+    snapshot.detach()
+    # Scanned trajectories are kept, only the other sections are copied
+    assert b"<TRAJS>" not in snapshot.buffer
+    buffer.value = no_trajectory_xml
+    assert snapshot.data == parse(response)
+    assert snapshot.records("ENTREES")[0].queue == 1
+    assert snapshot.vehicles[0]["vehid"] == 0
+
+
+def test_parse_projected_fields(two_vehicle_xml):
+    simrequest = SimulatorRequest(fields=("speed", "distance"))
+    simrequest.query = two_vehicle_xml
+    assert simrequest.get_vehicle_data() == [
+        {"vehid": 0, "speed": 25.0, "distance": 75.0},
+        {"vehid": 1, "speed": 25.0, "distance": 44.12},
+    ]
+    assert tuple(simrequest.data_query["INST"].keys()) == (
+        "@nbVeh",
+        "@val",
+        "TRAJS",
+    )
+    assert simrequest.current_time == 4.0
+    cols = simrequest.get_vehicle_columns()
+    assert cols.link is None
+    assert tuple(cols.speed) == (25.0, 25.0)
+
+
+def test_parse_projected_sections(simrequest, no_trajectory_xml):
+    simrequest.project(sections=("ENTREES", "CREATIONS"))
+    simrequest.query = no_trajectory_xml
+    inst = simrequest.data_query["INST"]
+    assert tuple(inst.keys())[2:] == ("CREATIONS", "ENTREES")
+    assert simrequest.get_vehicle_data() == []
+    simrequest.project()
+    simrequest.query = no_trajectory_xml
+    assert "TRAJS" in simrequest.data_query["INST"]
+
+
+def test_parse_projected_unknown_field(simrequest):
+    with pytest.raises(SymupyError):
+        simrequest.project(fields=("color",))
+
+
+@pytest.mark.parametrize("backend", ("xmltodict", "scanner"))
+def test_parse_projected_link_queries(three_vehicle_xml, backend):
+    simrequest = SimulatorRequest(fields=("vehid", "speed"), backend=backend)
+    simrequest.query = three_vehicle_xml
+    assert simrequest.vehicles_in_link("Zone_001") == (0, 1, 2)
+    assert simrequest.is_vehicle_in_link(1, "Zone_001")
+    assert not simrequest.is_vehicle_in_link(1, "Zone_002")
+    assert not simrequest.is_vehicle_in_link(7, "Zone_001")
+    assert simrequest.vehicle_downstream_of(2) == (0, 1)
+    assert simrequest.vehicle_upstream_of(0) == (1, 2)
+    assert simrequest.vehicle_leaders_of(2) == (1,)
+    assert simrequest.vehicle_followers_of(0, k=None) == (1, 2)
+    ngh = simrequest.get_vehicle_neighbours()
+    assert tuple(ngh.leader) == (-1, 0, 1)
+    assert ngh.spacing[2] == pytest.approx(44.12)
+    # Projected vehicle data is left unchanged
+    assert simrequest.get_vehicle_data()[0] == {"vehid": 0, "speed": 25.0}
+    cols = simrequest.get_vehicle_columns(("link",))
+    assert cols.link.categories[cols.link.codes[0]] == "Zone_001"
+
+
+def test_parse_delta(
+    simrequest, one_vehicle_xml, two_vehicle_xml, one_vehicle_forced_xml
+):
+    simrequest.query = one_vehicle_xml
+    assert tuple(simrequest.delta.entered) == (0,)
+    simrequest.query = two_vehicle_xml
+    delta = simrequest.delta
+    assert tuple(delta.entered) == (1,)
+    assert tuple(delta.exited) == ()
+    assert tuple(delta.updated) == (0,)
+    simrequest.query = one_vehicle_forced_xml
+    delta = simrequest.delta
+    assert tuple(delta.entered) == ()
+    assert tuple(delta.exited) == (1,)
+    assert tuple(delta.updated) == (0,)
+
+
+def test_parse_delta_channel(simrequest, one_vehicle_xml, two_vehicle_xml):
+    received = []
+    simrequest.attach(
+        "recorder", "delta", lambda: received.append(simrequest.delta)
+    )
+    simrequest.query = one_vehicle_xml
+    simrequest.query = two_vehicle_xml
+    assert len(received) == 2
+    assert tuple(received[1].entered) == (1,)
+
+
+def test_parse_sections(simrequest, two_vehicle_one_forced_xml):
+    simrequest.query = two_vehicle_one_forced_xml
+    creations = simrequest.get_creations()
+    assert len(creations) == 1
+    assert creations[0].vehid == 2
+    assert creations[0].origin == "Ext_In"
+    assert creations[0].destination == "Ext_Out"
+    assert simrequest.get_exits() == ()
+    assert simrequest.get_traffic_lights() == ()
+    assert simrequest.get_links() == ()
+    assert simrequest.get_entry_queues() == {"Ext_In": 1}
+    assert simrequest.parse_count == 1
+
+
+def test_parse_sections_multiple(simrequest):
+    simrequest.query = b'<INST nbVeh="0" val="9.00"><CREATIONS/><SORTIES><SORTIE id="3" sortie="Ext_Out" type="VL"/><SORTIE id="4" sortie="Ext_Out" type="PL"/></SORTIES><TRAJS/><ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="4"/><ENTREE id="Ext_In2" nb_veh_en_attente="0"/></ENTREES></INST>'
+    assert tuple(e.vehid for e in simrequest.get_exits()) == (3, 4)
+    assert simrequest.get_exits()[1].vehtype == "PL"
+    assert simrequest.get_exits()[1].origin is None
+    assert simrequest.get_entry_queues() == {"Ext_In": 4, "Ext_In2": 0}
+
+
+def test_parse_sections_values(simrequest):
+    simrequest.query = b'<INST nbVeh="0" val="9.00"><CREATIONS/><SORTIES><SORTIE entree="Ext_In" id="3" sortie="Ext_Out" type="VL"/></SORTIES><TRAJS/><STREAMS/><LINKS><LINK conc="0.02" debit="0.50" id="Zone_001" nb_veh="2" vit="25.00"/><LINK conc="0.00" debit="0.00" id="Zone_002" nb_veh="0" vit="0.00"/></LINKS><SGTS/><FEUX><FEU ctrl_feu="CAF_1" etat="1" troncon_entree="Zone_001" troncon_sortie="Zone_002"/></FEUX><ENTREES/><REGULATIONS/></INST>'
+    exits = simrequest.get_exits()
+    assert exits == ((3, "VL", "Ext_In", "Ext_Out"),)
+    lights = simrequest.get_traffic_lights()
+    assert lights[0].controller == "CAF_1"
+    assert lights[0].link_in == "Zone_001"
+    assert lights[0].link_out == "Zone_002"
+    assert lights[0].state == "1"
+    links = simrequest.get_links()
+    assert tuple(l.link for l in links) == ("Zone_001", "Zone_002")
+    assert links[0].count == 2
+    assert links[0].density == 0.02
+    assert links[0].flow == 0.5
+    assert links[0].speed == 25.0
+    assert links[1].count == 0
@@ -0,0 +1,111 @@
+"""
+    Unit tests for symupy.logic.pipeline
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import time
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.logic.pipeline import StepPipeline
+from symupy.utils.parser import SimulatorRequest
+from symupy.utils.exceptions import SymupyError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+def response(step: int) -> bytes:
+    return (
+        f'<INST nbVeh="1" val="{step}.00"><TRAJS><TRAJ abs="{step}.00" '
+        f'acc="0.00" dst="{step}.00" id="0" ord="0.00" tron="Zone_001" '
+        f'type="VL" vit="25.00" voie="1" z="0.00"/></TRAJS></INST>'
+    ).encode("UTF8")
+
+
+def run(pipe: StepPipeline, steps: int) -> None:
+    for step in range(steps):
+        buffer = pipe.acquire()
+        buffer.raw.value = response(step)  # Simulator writes the response
+        pipe.submit(buffer)
+
+
+def test_pipeline_keeps_order():
+    request = SimulatorRequest()
+    seen = []
+
+    def process(buffer):
+        time.sleep(0.001)
+        request.query = buffer.view()
+        seen.append((request.current_time, request.get_vehicle_data()))
+        request.snapshot.detach()
+
+    pipe = StepPipeline(process, size=1000)
+    run(pipe, 20)
+    pipe.flush()
+    assert [t for t, _ in seen] == [float(s) for s in range(20)]
+    assert all(data[0]["distance"] == t for t, data in seen)
+    pipe.close()
+    assert not pipe.running
+
+
+def test_pipeline_reuses_buffers():
+    pipe = StepPipeline(lambda buffer: None, size=10)
+    first, second = pipe.acquire(), pipe.acquire()
+    assert first is not second
+    pipe.submit(first)
+    pipe.submit(second)
+    assert pipe.acquire() is first
+    pipe.close()
+
+
+def test_pipeline_min_size():
+    pipe = StepPipeline(lambda buffer: None, size=1000, min_size=100)
+    assert all(b.min_size == 100 for b in pipe.buffers)
+    pipe.close()
+
+
+def test_pipeline_raises_worker_errors():
+    def process(buffer):
+        raise ValueError(buffer.raw.value)
+
+    pipe = StepPipeline(process, size=10)
+    buffer = pipe.acquire()
+    buffer.raw.value = b"bad"
+    pipe.submit(buffer)
+    with pytest.raises(ValueError):
+        pipe.flush()
+    pipe.close()
+
+
+def test_pipeline_worker_errors_in_submit():
+    def process(buffer):
+        raise ValueError(buffer.raw.value)
+
+    pipe = StepPipeline(process, size=10)
+    for _ in range(2 * pipe.depth):
+        first, second = pipe.acquire(), pipe.acquire()
+        pipe.submit(first)
+        pipe._queue.join()  # Error of the first buffer is pending
+        with pytest.raises(ValueError):
+            pipe.submit(second)
+        # Rejected buffer is handed out again, no slot is lost
+        assert pipe.acquire() is second
+        pipe.submit(second)
+        with pytest.raises(ValueError):
+            pipe.flush()
+    pipe.close()
+
+
+def test_pipeline_closed():
+    pipe = StepPipeline(lambda buffer: None, size=10)
+    pipe.close()
+    with pytest.raises(SymupyError):
+        pipe.submit(pipe.acquire())
@@ -16,6 +16,8 @@ from ctypes import create_string_buffer
 # ============================================================================
 
 from symupy.api import Simulation, Simulator
+import symupy.api.scenario as scenario_module
+import symupy.utils.validation as validation_module
 import symupy.utils.constants as CT
 from symupy.utils.constants import TRACE_FLOW
 
@@ -43,6 +45,13 @@ def bottleneck_002():
     return os.path.join(os.getcwd(), *file_path)
 
 
+@pytest.fixture
+def bottleneck_003():
+    file_name = "bottleneck_003.xml"
+    file_path = ("tests", "mocks", "bottlenecks", file_name)
+    return os.path.join(os.getcwd(), *file_path)
+
+
 # ============================================================================
 # BOTTLENECK 001
 # ============================================================================
@@ -95,3 +104,79 @@ def test_get_network_endpoints_botleneck_001(bottleneck_001):
     sim_endpoints = scenario.get_network_endpoints()
     END_POINTS = ("Ext_In", "Ext_Out")
     sim_endpoints == END_POINTS
+
+
+def test_index_bottleneck_001(bottleneck_001):
+    scenario = Simulation(bottleneck_001)
+    index = scenario.index
+    assert index.endpoint_set == {"Ext_In", "Ext_Out"}
+    assert index.vehicle_type_set == {"VL", "VL2"}
+    assert index.link_set == {"Zone_001"}
+    assert index.sensor_set == frozenset()
+    assert index.time_step == 1.0
+    assert index.link_length["Zone_001"] == pytest.approx(800.0)
+    assert index.link_lanes["Zone_001"] == 1
+    assert scenario.get_network_endpoints() == ("Ext_In", "Ext_Out")
+    assert scenario.get_links_in_mfd_sensor("unknown") == ()
+    assert scenario.get_simulation_steps() == range(30)
+    with pytest.raises(TypeError):
+        index.link_length["Zone_001"] = 0.0
+
+
+def test_streaming_index_bottleneck_001(bottleneck_001):
+    streamed = Simulation(bottleneck_001)
+    loaded = Simulation(bottleneck_001, streaming=False)
+    assert streamed.index == loaded.index
+    # Full tree is loaded on demand
+    assert streamed.xmltree.tag == "ROOT_SYMUBRUIT"
+
+
+def test_streaming_index_large_demand(bottleneck_001, tmp_path):
+    with open(bottleneck_001) as f:
+        text = f.read()
+    demand = "".join(
+        f'<CREATION_VEHICULE typeVehicule="VL" destination="Ext_Out" '
+        f"instant='{i}.00'/>"
+        for i in range(20000)
+    )
+    text = text.replace("<CREATION_VEHICULES>", "<CREATION_VEHICULES>" + demand)
+    scenario = tmp_path / "large.xml"
+    scenario.write_text(text)
+    streamed = Simulation(str(scenario))
+    assert streamed.index == Simulation(bottleneck_001).index
+
+
+def test_cached_index_bottleneck_001(bottleneck_001, tmp_path):
+    first = Simulation(bottleneck_001, cache_dir=str(tmp_path))
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    # A copy of the file hits the same entry
+    copy = tmp_path / "copy.xml"
+    copy.write_bytes(open(bottleneck_001, "rb").read())
+    second = Simulation(str(copy), cache_dir=str(tmp_path))
+    assert len(list(tmp_path.glob("*.pickle"))) == 1
+    assert second.index == first.index
+    assert second.index.link_ends["Zone_001"] == ("Ext_In", "Ext_Out")
+
+
+def test_cache_opt_in_bottleneck_001(bottleneck_001, monkeypatch):
+    calls = []
+    monkeypatch.setattr(validation_module, "_validated", set())
+    for module in (scenario_module, validation_module):
+        monkeypatch.setattr(module, "load_cached", lambda *a: calls.append(a))
+        monkeypatch.setattr(module, "store_cached", lambda *a: calls.append(a))
+    Simulation(bottleneck_001, validate=True)
+    assert not calls
+
+
+# ============================================================================
+# BOTTLENECK 003
+# ============================================================================
+
+
+@pytest.mark.parametrize("streaming", (True, False))
+def test_sensors_bottleneck_003(bottleneck_003, streaming):
+    scenario = Simulation(bottleneck_003, streaming=streaming)
+    assert scenario.get_mfd_sensor_names() == ("P1", "MFD_1")
+    assert scenario.get_links_in_mfd_sensor("MFD_1") == ("Zone_001",)
+    assert scenario.get_links_in_mfd_sensor("P1") == ()
+    assert scenario.index.sensor_set == {"P1", "MFD_1"}
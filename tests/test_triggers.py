@@ -0,0 +1,124 @@
+"""
+    Unit tests for symupy.logic.triggers
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.logic.triggers import (
+    Trigger,
+    TimeReached,
+    VehicleEntersLink,
+    EntryQueueAbove,
+    VehicleAppears,
+)
+from symupy.utils.parser import SimulatorRequest
+from symupy.utils.exceptions import SymupyError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def one_vehicle_xml():
+    return b'<INST nbVeh="1" val="2.00"><CREATIONS/><SORTIES/><TRAJS><TRAJ abs="25.00" acc="0.00" dst="25.00" id="0" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/></TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="1"/></ENTREES><REGULATIONS/></INST>'
+
+
+@pytest.fixture
+def two_vehicle_xml():
+    return b'<INST nbVeh="2" val="4.00"><CREATIONS/><SORTIES/><TRAJS><TRAJ abs="75.00" acc="0.00" dst="75.00" id="0" ord="0.00" tron="Zone_001" type="VL" vit="25.00" voie="1" z="0.00"/><TRAJ abs="44.12" acc="0.00" dst="44.12" id="1" ord="0.00" tron="Zone_001" type="PL" vit="25.00" voie="2" z="0.00"/></TRAJS><STREAMS/><LINKS/><SGTS/><FEUX/><ENTREES><ENTREE id="Ext_In" nb_veh_en_attente="3"/></ENTREES><REGULATIONS/></INST>'
+
+
+@pytest.fixture
+def simrequest():
+    return SimulatorRequest()
+
+
+class Always(Trigger):
+    def check(self, request) -> bool:
+        return True
+
+
+def test_trigger_abstract():
+    with pytest.raises(TypeError):
+        Trigger()
+
+
+def test_periodic_next_step():
+    trigger = Always(period=5)
+    assert trigger.next_step(0, 1.0) == 0
+    assert trigger.next_step(1, 1.0) == 5
+    assert trigger.next_step(5, 1.0) == 5
+
+
+def test_time_reached():
+    trigger = TimeReached(10.0)
+    assert trigger.once
+    # Step 19 ends at 10.0 s
+    assert trigger.next_step(0, 0.5) == 19
+    assert trigger.next_step(25, 0.5) == 25
+
+
+def test_time_reached_check(simrequest, one_vehicle_xml, two_vehicle_xml):
+    trigger = TimeReached(4.0)
+    simrequest.query = one_vehicle_xml
+    assert not trigger.check(simrequest)
+    simrequest.query = two_vehicle_xml
+    assert trigger.check(simrequest)
+
+
+def test_vehicle_enters_link(simrequest, one_vehicle_xml, two_vehicle_xml):
+    trigger = VehicleEntersLink("Zone_001", "PL")
+    simrequest.query = one_vehicle_xml
+    assert not trigger.check(simrequest)
+    simrequest.query = two_vehicle_xml
+    assert trigger.check(simrequest)
+    # Already on the link
+    assert not trigger.check(simrequest)
+    assert not VehicleEntersLink("Zone_002").check(simrequest)
+
+
+def test_vehicle_enters_link_projected(one_vehicle_xml, two_vehicle_xml):
+    simrequest = SimulatorRequest(fields=("vehid", "speed"))
+    trigger = VehicleEntersLink("Zone_001", "PL")
+    simrequest.query = one_vehicle_xml
+    assert not trigger.check(simrequest)
+    simrequest.query = two_vehicle_xml
+    assert trigger.check(simrequest)
+
+
+def test_entry_queue_above(simrequest, one_vehicle_xml, two_vehicle_xml):
+    trigger = EntryQueueAbove("Ext_In", 2, period=10)
+    simrequest.query = one_vehicle_xml
+    assert not trigger.check(simrequest)
+    simrequest.query = two_vehicle_xml
+    assert trigger.check(simrequest)
+    assert trigger.next_step(11, 1.0) == 20
+
+
+def test_entry_queue_above_projected(two_vehicle_xml):
+    trigger = EntryQueueAbove("Ext_In", 2)
+    assert trigger.sections == ("ENTREES",)
+    simrequest = SimulatorRequest(fields=("vehid",))
+    simrequest.query = two_vehicle_xml
+    with pytest.raises(SymupyError):
+        trigger.check(simrequest)
+    simrequest.project(("vehid",), ("TRAJS",) + trigger.sections)
+    assert trigger.check(simrequest)
+
+
+def test_vehicle_appears(simrequest, one_vehicle_xml, two_vehicle_xml):
+    trigger = VehicleAppears(1)
+    simrequest.query = one_vehicle_xml
+    assert not trigger.check(simrequest)
+    simrequest.query = two_vehicle_xml
+    assert trigger.check(simrequest)
+    assert trigger.once
@@ -0,0 +1,86 @@
+"""
+    Unit tests for symupy.utils.validation
+"""
+
+# ============================================================================
+# STANDARD  IMPORTS
+# ============================================================================
+
+import os
+import pytest
+
+# ============================================================================
+# INTERNAL IMPORTS
+# ============================================================================
+
+from symupy.api import Simulation
+from symupy.utils.validation import (
+    load_schema,
+    schema_location,
+    validate_scenario,
+    validate_scenarios,
+)
+from symupy.utils.exceptions import SymupyFileLoadError
+
+# ============================================================================
+# TESTS AND DEFINITIONS
+# ============================================================================
+
+
+@pytest.fixture
+def bottleneck_001():
+    file_name = "bottleneck_001.xml"
+    file_path = ("tests", "mocks", "bottlenecks", file_name)
+    return os.path.join(os.getcwd(), *file_path)
+
+
+@pytest.fixture
+def schema():
+    return os.path.join(os.getcwd(), "tests", "mocks", "reseau.xsd")
+
+
+@pytest.fixture
+def invalid(bottleneck_001, tmp_path):
+    with open(bottleneck_001) as f:
+        text = f.read()
+    path = tmp_path / "invalid.xml"
+    path.write_text(text.replace('pasdetemps="1"', 'pasdetemps="fast"'))
+    return str(path)
+
+
+def test_schema_location(bottleneck_001, schema):
+    assert os.path.realpath(schema_location(bottleneck_001)) == schema
+
+
+def test_schema_compiled_once(schema):
+    first, key = load_schema(schema)
+    second, _ = load_schema(schema)
+    assert first is second
+
+
+def test_validate_scenario(bottleneck_001, tmp_path):
+    validate_scenario(bottleneck_001, cache_dir=str(tmp_path))
+    assert list(tmp_path.glob("*.valid.pickle"))
+
+
+def test_invalid_scenario(invalid, schema, tmp_path):
+    with pytest.raises(SymupyFileLoadError):
+        validate_scenario(invalid, schema, cache_dir=str(tmp_path))
+    with pytest.raises(SymupyFileLoadError):
+        Simulation(invalid, validate=True, schema=schema)
+
+
+def test_missing_schema(bottleneck_001, tmp_path):
+    with pytest.raises(SymupyFileLoadError):
+        validate_scenario(bottleneck_001, str(tmp_path / "none.xsd"))
+
+
+def test_validate_scenarios(bottleneck_001, invalid, schema, tmp_path):
+    errors = validate_scenarios(
+        (bottleneck_001, invalid), schema, processes=2, cache_dir=str(tmp_path)
+    )
+    assert errors[bottleneck_001] == ""
+    assert "pasdetemps" in errors[invalid]
+    assert validate_scenarios((invalid,), schema, processes=1) == {
+        invalid: errors[invalid]
+    }
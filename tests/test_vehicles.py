@@ -120,6 +120,34 @@ def test_create_vehicle_list_1_vehicle_update(
     assert vl[0].distance == 48.00
 
 
+def test_vehicle_list_reset(simrequest, one_vehicle_xml, two_vehicle_xml):
+    simrequest.query = two_vehicle_xml
+    vl = VehicleList(simrequest)
+    old = tuple(vl)
+    # New simulation, as in a campaign
+    simrequest.reset()
+    vl.reset()
+    assert len(vl) == 0
+    assert not simrequest.get_subscribers("default")
+    simrequest.query = one_vehicle_xml
+    vl.update_list()
+    assert [v.vehid for v in vl] == [0]
+    assert len(simrequest.get_subscribers("default")) == 1
+    # Vehicles of the previous simulation are no longer updated
+    assert vl[0] is not old[0]
+    simrequest.dispatch()
+    assert old[0].distance == 75.0
+    assert vl[0].distance == 25.0
+
+
+def test_vehicle_list_reset_keeps_current(simrequest, two_vehicle_xml):
+    simrequest.query = two_vehicle_xml
+    vl = VehicleList(simrequest)
+    vl.reset()
+    assert [v.vehid for v in vl] == [0, 1]
+    assert len(simrequest.get_subscribers("default")) == 2
+
+
 def test_create_vehicle_list_2_vehicles_gradual_update(
     simrequest, one_vehicle_xml, two_vehicle_xml
 ):
@@ -132,3 +160,19 @@ def test_create_vehicle_list_2_vehicles_gradual_update(
     assert len(vl) == 2
     assert vl[0].distance == 75.00
     assert vl[1].distance == 44.12
+
+
+def test_vehicle_list_update_keeps_instances(
+    simrequest, one_vehicle_xml, two_vehicle_xml, one_vehicle_forced_xml
+):
+    simrequest.query = one_vehicle_xml
+    vl = VehicleList(simrequest)
+    veh0 = vl[0]
+    simrequest.query = two_vehicle_xml
+    vl.update_list()
+    assert vl[0] is veh0
+    simrequest.query = one_vehicle_forced_xml
+    vl.update_list()
+    assert len(vl) == 2
+    assert veh0.distance == 48.00
+    assert veh0.driven == True